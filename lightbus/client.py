@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import copy
 import functools
 import inspect
 import logging
@@ -7,7 +8,7 @@ import signal
 import time
 from asyncio.futures import CancelledError
 from collections import defaultdict
-from typing import List, Tuple
+from typing import List, Tuple, Optional, Sequence, Hashable
 
 from lightbus.api import registry, Api
 from lightbus.config import Config
@@ -23,6 +24,7 @@ from lightbus.exceptions import (
     NoApisToListenOn,
     InvalidName,
     LightbusShutdownInProgress,
+    LightbusException,
 )
 from lightbus.internal_apis import LightbusStateApi, LightbusMetricsApi
 from lightbus.log import LBullets, L, Bold
@@ -39,6 +41,7 @@ from lightbus.utilities.async import (
     await_if_necessary,
     make_exception_checker,
 )
+from lightbus.utilities.cache import TtlLruCache, make_rpc_key, make_partition_key, MISSING
 from lightbus.utilities.casting import cast_to_signature
 from lightbus.utilities.deforming import deform_to_bus
 from lightbus.utilities.frozendict import frozendict
@@ -72,6 +75,13 @@ class BusClient(object):
         self._listeners = {}
         self._hook_callbacks = defaultdict(list)
         self._exit_code = 0
+        self._rpc_semaphores = {}
+        self._rpc_tasks = set()
+        self._rpc_caches = {}
+        self._rpc_calls_in_flight = {}
+        self._rpc_cache_invalidation = {}
+        # Consumer groups created to receive cache invalidation events, keyed by event
+        self._rpc_cache_consumer_groups = {}
 
     async def setup_async(self, plugins: dict = None):
         """Setup lightbus and get it ready to consume events and/or RPCs
@@ -162,6 +172,8 @@ class BusClient(object):
                     f" '{OnError.SHUTDOWN.value}'"
                 )
 
+        await self._delete_rpc_cache_consumer_groups()
+
         for transport in self.transport_registry.get_all_transports():
             await transport.close()
 
@@ -172,7 +184,7 @@ class BusClient(object):
         return get_event_loop()
 
     def run_forever(self, *, consume_rpcs=True):
-        registry.add(LightbusStateApi())
+        registry.add(LightbusStateApi(bus_client=self))
         registry.add(LightbusMetricsApi())
 
         if consume_rpcs:
@@ -241,71 +253,259 @@ class BusClient(object):
                 "or the API registry is empty."
             )
 
-        while True:
-            # Not all APIs will necessarily be served by the same transport, so group them
-            # accordingly
-            api_names = [api.meta.name for api in apis]
-            api_names_by_transport = self.transport_registry.get_rpc_transports(api_names)
-
-            coroutines = []
-            for rpc_transport, transport_api_names in api_names_by_transport:
-                transport_apis = list(map(registry.get, transport_api_names))
-                coroutines.append(
-                    self._consume_rpcs_with_transport(
-                        rpc_transport=rpc_transport, apis=transport_apis
-                    )
+        # Not all APIs will necessarily be served by the same transport, so group them
+        # accordingly. APIs with a max_concurrency are also consumed separately, so that
+        # waiting for capacity on one API does not stop RPCs being consumed for the others
+        api_names = [api.meta.name for api in apis]
+        api_names_by_transport = self.transport_registry.get_rpc_transports(api_names)
+
+        consumers = []
+        for rpc_transport, transport_api_names in api_names_by_transport:
+            transport_apis = list(map(registry.get, transport_api_names))
+            sequential_apis = []
+            for api in transport_apis:
+                if self.config.api(api.meta.name).max_concurrency:
+                    consumers.append((rpc_transport, [api]))
+                else:
+                    sequential_apis.append(api)
+            if sequential_apis:
+                consumers.append((rpc_transport, sequential_apis))
+
+        async def consume_forever(rpc_transport, consumer_apis):
+            while True:
+                await self._consume_rpcs_with_transport(
+                    rpc_transport=rpc_transport, apis=consumer_apis
                 )
 
-            await asyncio.gather(*coroutines)
+        tasks = [
+            asyncio.ensure_future(consume_forever(rpc_transport, consumer_apis))
+            for rpc_transport, consumer_apis in consumers
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Don't leave any consumers or concurrently executing RPCs behind
+            await cancel(*tasks, *self._rpc_tasks)
 
     async def _consume_rpcs_with_transport(
         self, rpc_transport: RpcTransport, apis: List[Api] = None
     ):
         rpc_messages = await rpc_transport.consume_rpcs(apis)
         for rpc_message in rpc_messages:
-            self._validate(rpc_message, "incoming")
-
-            await self._plugin_hook("before_rpc_execution", rpc_message=rpc_message)
-            try:
-                result = await self.call_rpc_local(
-                    api_name=rpc_message.api_name,
-                    name=rpc_message.procedure_name,
-                    kwargs=rpc_message.kwargs,
+            semaphore = self._get_rpc_semaphore(rpc_message.api_name)
+            if semaphore:
+                # Execute concurrently. Waiting for a free slot here means we will not
+                # consume further RPCs for this API until it has capacity for them. APIs
+                # with a semaphore are consumed on their own, so other APIs are unaffected
+                await semaphore.acquire()
+                task = asyncio.ensure_future(
+                    self._execute_rpc_concurrently(rpc_message, rpc_transport, semaphore)
                 )
-            except SuddenDeathException:
-                # Used to simulate message failure for testing
-                pass
+                task.add_done_callback(self._rpc_tasks.discard)
+                task.add_done_callback(make_exception_checker())
+                self._rpc_tasks.add(task)
             else:
-                result = deform_to_bus(result)
-                result_message = ResultMessage(result=result, rpc_message_id=rpc_message.id)
-                await self._plugin_hook(
-                    "after_rpc_execution", rpc_message=rpc_message, result_message=result_message
-                )
+                # Each result is sent as soon as it is ready, so callers do
+                # not wait for the rest of the batch to be executed
+                await self._execute_and_send_rpc(rpc_message, rpc_transport)
 
-                self._validate(
-                    result_message,
-                    "outgoing",
-                    api_name=rpc_message.api_name,
-                    procedure_name=rpc_message.procedure_name,
-                )
+    async def _execute_and_send_rpc(self, rpc_message: RpcMessage, rpc_transport: RpcTransport):
+        """Execute an incoming RPC, then send its result and acknowledge it
+
+        Errors (such as validation errors) are sent to the caller as an error
+        result, so a single bad call cannot prevent the rest of its batch
+        from being processed.
+        """
+        try:
+            result_message = await self._execute_rpc(rpc_message)
+        except CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(e)
+            result_message = ResultMessage(result=e, rpc_message_id=rpc_message.id)
+
+        if result_message:
+            await self.send_result(rpc_message=rpc_message, result_message=result_message)
+            await rpc_transport.acknowledge(rpc_message)
+
+    async def _execute_rpc(self, rpc_message: RpcMessage) -> Optional[ResultMessage]:
+        """Execute an incoming RPC and return the result message to be sent to the caller
+
+        Will return None if no result should be sent.
+        """
+        self._validate(rpc_message, "incoming")
+
+        await self._plugin_hook("before_rpc_execution", rpc_message=rpc_message)
+        try:
+            result = await self.call_rpc_local(
+                api_name=rpc_message.api_name,
+                name=rpc_message.procedure_name,
+                kwargs=rpc_message.kwargs,
+            )
+        except SuddenDeathException:
+            # Used to simulate message failure for testing
+            return None
+
+        result = deform_to_bus(result)
+        result_message = ResultMessage(result=result, rpc_message_id=rpc_message.id)
+        await self._plugin_hook(
+            "after_rpc_execution", rpc_message=rpc_message, result_message=result_message
+        )
 
-                await self.send_result(rpc_message=rpc_message, result_message=result_message)
+        self._validate(
+            result_message,
+            "outgoing",
+            api_name=rpc_message.api_name,
+            procedure_name=rpc_message.procedure_name,
+        )
+        return result_message
+
+    async def _execute_rpc_concurrently(
+        self, rpc_message: RpcMessage, rpc_transport: RpcTransport, semaphore: asyncio.Semaphore
+    ):
+        try:
+            await self._execute_and_send_rpc(rpc_message, rpc_transport)
+        finally:
+            semaphore.release()
+
+    def _get_rpc_semaphore(self, api_name: str) -> Optional[asyncio.Semaphore]:
+        """Get the semaphore limiting concurrent execution of RPCs on the given API
+
+        Returns None if RPCs on this API should be executed one at a time
+        """
+        if api_name not in self._rpc_semaphores:
+            max_concurrency = self.config.api(api_name).max_concurrency
+            self._rpc_semaphores[api_name] = (
+                asyncio.Semaphore(max_concurrency) if max_concurrency else None
+            )
+        return self._rpc_semaphores[api_name]
 
     async def call_rpc_remote(
         self, api_name: str, name: str, kwargs: dict = frozendict(), options: dict = frozendict()
     ):
-        rpc_transport = self.transport_registry.get_rpc_transport(api_name)
-        result_transport = self.transport_registry.get_result_transport(api_name)
+        cache = await self._get_rpc_cache(api_name, name)
+        if cache is None:
+            return await self._call_rpc_remote_coalesced(api_name, name, kwargs, options)
+
+        cache_key = make_rpc_key(api_name, name, kwargs)
+        result = cache.get(cache_key, MISSING)
+        if result is MISSING:
+            result = await self._call_rpc_remote_coalesced(api_name, name, kwargs, options)
+            # Copy the result to ensure changes made by the caller do not affect the cache
+            cache.set(cache_key, copy.deepcopy(result))
+            return result
+        else:
+            logger.info(
+                L("🗃  Using cached result for remote call of {}.{}", Bold(api_name), Bold(name))
+            )
+            return copy.deepcopy(result)
 
-        kwargs = deform_to_bus(kwargs)
-        rpc_message = RpcMessage(api_name=api_name, procedure_name=name, kwargs=kwargs)
-        return_path = result_transport.get_return_path(rpc_message)
-        rpc_message.return_path = return_path
+    async def _call_rpc_remote_coalesced(
+        self, api_name: str, name: str, kwargs: dict = frozendict(), options: dict = frozendict()
+    ):
+        """Call the RPC, sharing a single remote call between identical concurrent calls
+
+        Only applies if the API has coalescing enabled. The options of the first call
+        will be used for the remote call.
+        """
+        if not self.config.api(api_name).coalesce_rpcs:
+            return await self._call_rpc_remote(api_name, name, kwargs, options)
+
+        key = make_rpc_key(api_name, name, kwargs)
+        task = self._rpc_calls_in_flight.get(key)
+        if task:
+            logger.info(L("🔗  Joining in-flight remote call of {}.{}", Bold(api_name), Bold(name)))
+        else:
+            task = asyncio.ensure_future(self._call_rpc_remote(api_name, name, kwargs, options))
+            self._rpc_calls_in_flight[key] = task
+
+            def call_done(_):
+                self._rpc_calls_in_flight.pop(key, None)
+                # Retrieve any exception, as nobody may be waiting for the result
+                if not task.cancelled():
+                    task.exception()
+
+            task.add_done_callback(call_done)
+
+        # Shielding the task ensures that the call continues for the other callers
+        # if this caller is cancelled. Every caller (including the one which made the
+        # call) gets its own copy of the result, as the result is shared between them
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _get_rpc_cache(self, api_name: str, name: str) -> Optional[TtlLruCache]:
+        """Get the cache for results of the given RPC
+
+        Will return None if results of this RPC should not be cached
+        """
+        if (api_name, name) not in self._rpc_caches:
+            rpc_cache_config = self.config.api(api_name).rpc_cache
+            cache_config = rpc_cache_config.get(name) or rpc_cache_config.get("default")
+            if cache_config and cache_config.ttl:
+                cache = TtlLruCache(max_size=cache_config.max_size, ttl=cache_config.ttl)
+            else:
+                cache = None
+            self._rpc_caches[(api_name, name)] = cache
+
+            for event in cache_config.invalidate_on if cache else []:
+                await self._invalidate_rpc_cache_on(event, cache)
+
+        return self._rpc_caches[(api_name, name)]
+
+    async def _invalidate_rpc_cache_on(self, event: str, cache: TtlLruCache):
+        """Clear the given cache whenever the given event is fired
+
+        The event should be in the form `api_name.event_name`.
+
+        Note that the cache is only cleared once this process receives the event, which
+        requires the event loop to be running. A synchronous caller may therefore be served
+        stale results (up to the cache's TTL) until the bus is next used.
+        """
+        event_api_name, event_name = event.rsplit(".", 1)
+        key = (event_api_name, event_name)
+
+        if key not in self._rpc_cache_invalidation:
+            caches = self._rpc_cache_invalidation[key] = []
+
+            def invalidate_rpc_caches(event_message, **kwargs):
+                for cache_ in caches:
+                    cache_.clear()
+
+            # Every process needs to receive the event in order to clear its own caches.
+            # The consumer group is deleted upon close, as it will never be used again
+            consumer_group = f"rpc_cache_{self.config.process_name}"
+            self._rpc_cache_consumer_groups[key] = consumer_group
+            await self.listen_for_event(
+                event_api_name,
+                event_name,
+                invalidate_rpc_caches,
+                options={"consumer_group": consumer_group},
+            )
+
+        self._rpc_cache_invalidation[key].append(cache)
+
+    async def _delete_rpc_cache_consumer_groups(self):
+        """Delete the consumer groups used to receive cache invalidation events"""
+        for (api_name, event_name), consumer_group in self._rpc_cache_consumer_groups.items():
+            event_transport = self.transport_registry.get_event_transport(api_name)
+            try:
+                await event_transport.delete_consumer_group(
+                    [(api_name, event_name)], consumer_group
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to delete consumer group {consumer_group} used for RPC cache "
+                    f"invalidation upon {api_name}.{event_name}. The error was: {e}"
+                )
+        self._rpc_cache_consumer_groups = {}
+
+    async def _call_rpc_remote(
+        self, api_name: str, name: str, kwargs: dict = frozendict(), options: dict = frozendict()
+    ):
+        rpc_transport = self.transport_registry.get_rpc_transport(api_name)
+        rpc_message = self._make_rpc_message(api_name, name, kwargs)
         options = options or {}
         timeout = options.get("timeout", self.config.api(api_name).rpc_timeout)
 
-        self._validate_name(api_name, "rpc", name)
-
         logger.info("📞  Calling remote RPC {}.{}".format(Bold(api_name), Bold(name)))
 
         start_time = time.time()
@@ -314,7 +514,7 @@ class BusClient(object):
         self._validate(rpc_message, "outgoing")
 
         future = asyncio.gather(
-            self.receive_result(rpc_message, return_path, options=options),
+            self.receive_result(rpc_message, rpc_message.return_path, options=options),
             rpc_transport.call_rpc(rpc_message, options=options),
         )
 
@@ -331,15 +531,137 @@ class BusClient(object):
             except CancelledError:
                 pass
 
-            # TODO: Remove RPC from queue. Perhaps add a RpcBackend.cancel() method. Optional,
-            #       as not all backends will support it. No point processing calls which have timed out.
-            raise LightbusTimeout(
-                f"Timeout when calling RPC {rpc_message.canonical_name} after {timeout} seconds. "
-                f"It is possible no Lightbus process is serving this API, or perhaps it is taking "
-                f"too long to process the request. In which case consider raising the 'rpc_timeout' "
-                f"config option."
-            ) from None
+            raise await self._handle_rpc_timeout(rpc_message, timeout) from None
+
+        return await self._handle_result_message(rpc_message, result_message, start_time)
+
+    async def call_rpc_many(
+        self,
+        calls: Sequence[Tuple[str, str, dict]],
+        options: dict = frozendict(),
+        return_exceptions: bool = False,
+    ) -> list:
+        """Call many RPCs at once, returning their results in the order given
+
+        Each call is an `(api_name, procedure_name, kwargs)` tuple. The calls are
+        passed to each RPC transport as a single batch, and the results are
+        awaited subject to a single timeout. Results are not cached or coalesced.
+
+        If `return_exceptions` is true, then errors (including timeouts) will be
+        returned in place of the results of the failed calls, rather than raised.
+        """
+        if not calls:
+            return []
+
+        options = options or {}
+        rpc_messages = [self._make_rpc_message(*call) for call in calls]
+        timeout = options.get(
+            "timeout", max(self.config.api(m.api_name).rpc_timeout for m in rpc_messages)
+        )
+
+        logger.info(L("📞  Calling {} remote RPCs", Bold(len(rpc_messages))))
+
+        start_time = time.time()
+        for rpc_message in rpc_messages:
+            self._validate(rpc_message, "outgoing")
+
+        # Start waiting for the results before making the calls
+        receive_tasks = [
+            asyncio.ensure_future(
+                self.receive_result(rpc_message, rpc_message.return_path, options=options)
+            )
+            for rpc_message in rpc_messages
+        ]
+
+        try:
+            for rpc_message in rpc_messages:
+                await self._plugin_hook("before_rpc_call", rpc_message=rpc_message)
+
+            # Send the calls to each transport in a single batch
+            rpc_messages_by_transport = defaultdict(list)
+            for rpc_message in rpc_messages:
+                rpc_transport = self.transport_registry.get_rpc_transport(rpc_message.api_name)
+                rpc_messages_by_transport[rpc_transport].append(rpc_message)
+
+            for rpc_transport, transport_rpc_messages in rpc_messages_by_transport.items():
+                await rpc_transport.call_rpcs(transport_rpc_messages, options=options)
+
+            remaining = max(timeout - (time.time() - start_time), 0)
+            done, _ = await asyncio.wait(receive_tasks, timeout=remaining)
+        finally:
+            for task in receive_tasks:
+                task.cancel()
+
+        # A cancelled task only reports itself as cancelled once the loop
+        # has run again, so check which tasks completed in time instead.
+        # Timed out calls are cleaned up concurrently
+        timed_out = [m for m, task in zip(rpc_messages, receive_tasks) if task not in done]
+        timeout_errors = dict(
+            zip(
+                timed_out,
+                await asyncio.gather(*[self._handle_rpc_timeout(m, timeout) for m in timed_out]),
+            )
+        )
+
+        results = []
+        for rpc_message, task in zip(rpc_messages, receive_tasks):
+            try:
+                if rpc_message in timeout_errors:
+                    raise timeout_errors[rpc_message]
+                results.append(
+                    await self._handle_result_message(rpc_message, task.result(), start_time)
+                )
+            except LightbusException as e:
+                results.append(e)
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    def _make_rpc_message(self, api_name: str, name: str, kwargs: dict) -> RpcMessage:
+        self._validate_name(api_name, "rpc", name)
+        result_transport = self.transport_registry.get_result_transport(api_name)
+
+        kwargs = deform_to_bus(kwargs)
+        rpc_message = RpcMessage(api_name=api_name, procedure_name=name, kwargs=kwargs)
+        rpc_message.return_path = result_transport.get_return_path(rpc_message)
+        return rpc_message
+
+    async def _handle_rpc_timeout(self, rpc_message: RpcMessage, timeout: float):
+        """Clean up after an RPC call has timed out, returning the exception to be raised"""
+        rpc_transport = self.transport_registry.get_rpc_transport(rpc_message.api_name)
+        result_transport = self.transport_registry.get_result_transport(rpc_message.api_name)
+
+        # No point processing calls which have timed out, nor sending their results.
+        # This is best-effort, so errors are logged rather than hiding the timeout
+        errors = await asyncio.gather(
+            rpc_transport.cancel(rpc_message),
+            result_transport.abandon(rpc_message, rpc_message.return_path),
+            return_exceptions=True,
+        )
+        for error in errors:
+            if isinstance(error, Exception):
+                logger.warning(
+                    f"Failed to clean up after timed out call to RPC "
+                    f"{rpc_message.canonical_name}. The error was: {error!r}"
+                )
+
+        return LightbusTimeout(
+            f"Timeout when calling RPC {rpc_message.canonical_name} after {timeout} seconds. "
+            f"It is possible no Lightbus process is serving this API, or perhaps it is taking "
+            f"too long to process the request. In which case consider raising the 'rpc_timeout' "
+            f"config option."
+        )
+
+    async def _handle_result_message(
+        self, rpc_message: RpcMessage, result_message: ResultMessage, start_time: float
+    ):
+        """Get the result of an RPC call from its result message
 
+        Will raise a LightbusServerError if the RPC raised an error.
+        """
         await self._plugin_hook(
             "after_rpc_call", rpc_message=rpc_message, result_message=result_message
         )
@@ -367,7 +689,12 @@ class BusClient(object):
                 )
             )
 
-        self._validate(result_message, "incoming", api_name, procedure_name=name)
+        self._validate(
+            result_message,
+            "incoming",
+            rpc_message.api_name,
+            procedure_name=rpc_message.procedure_name,
+        )
 
         return result_message.result
 
@@ -408,6 +735,41 @@ class BusClient(object):
     # Events
 
     async def fire_event(self, api_name, name, kwargs: dict = None, options: dict = None):
+        event_message = self._make_event_message(api_name, name, kwargs)
+
+        event_transport = self.transport_registry.get_event_transport(api_name)
+        await self._plugin_hook("before_event_sent", event_message=event_message)
+        logger.info(L("📤  Sending event {}.{}".format(Bold(api_name), Bold(name))))
+        await event_transport.send_event(event_message, options=options)
+        await self._plugin_hook("after_event_sent", event_message=event_message)
+
+    async def fire_events_many(self, events: Sequence[Tuple[str, str, dict]], options: dict = None):
+        """Fire many events at once
+
+        Each event is an `(api_name, event_name, kwargs)` tuple. All events are
+        validated before any are sent, and are then passed to each event transport
+        as a single batch. Pass the `atomic` option to have the redis event
+        transport write each batch atomically.
+        """
+        event_messages = [self._make_event_message(*event) for event in events]
+
+        for event_message in event_messages:
+            await self._plugin_hook("before_event_sent", event_message=event_message)
+
+        event_messages_by_transport = defaultdict(list)
+        for event_message in event_messages:
+            event_transport = self.transport_registry.get_event_transport(event_message.api_name)
+            event_messages_by_transport[event_transport].append(event_message)
+
+        logger.info(L("📤  Sending {} events", Bold(len(event_messages))))
+        for event_transport, transport_event_messages in event_messages_by_transport.items():
+            await event_transport.send_events(transport_event_messages, options=options)
+
+        for event_message in event_messages:
+            await self._plugin_hook("after_event_sent", event_message=event_message)
+
+    def _make_event_message(self, api_name, name, kwargs: dict = None) -> EventMessage:
+        """Create an event message, validating it against the locally defined API"""
         kwargs = kwargs or {}
         try:
             api = registry.get(api_name)
@@ -447,12 +809,7 @@ class BusClient(object):
         event_message = EventMessage(api_name=api.meta.name, event_name=name, kwargs=kwargs)
 
         self._validate(event_message, "outgoing")
-
-        event_transport = self.transport_registry.get_event_transport(api_name)
-        await self._plugin_hook("before_event_sent", event_message=event_message)
-        logger.info(L("📤  Sending event {}.{}".format(Bold(api_name), Bold(name))))
-        await event_transport.send_event(event_message, options=options)
-        await self._plugin_hook("after_event_sent", event_message=event_message)
+        return event_message
 
     async def listen_for_event(
         self, api_name, name, listener, options: dict = None
@@ -481,6 +838,21 @@ class BusClient(object):
             rpc_message, result_message, rpc_message.return_path
         )
 
+    async def send_results(self, results: List[Tuple[RpcMessage, ResultMessage]]):
+        """Send multiple results, grouping them by result transport
+
+        Each transport can then send its results in as few round trips as it is able
+        """
+        results_by_transport = defaultdict(list)
+        for rpc_message, result_message in results:
+            result_transport = self.transport_registry.get_result_transport(rpc_message.api_name)
+            results_by_transport[result_transport].append(
+                (rpc_message, result_message, rpc_message.return_path)
+            )
+
+        for result_transport, transport_results in results_by_transport.items():
+            await result_transport.send_results(transport_results)
+
     async def receive_result(self, rpc_message: RpcMessage, return_path: str, options: dict):
         result_transport = self.transport_registry.get_result_transport(rpc_message.api_name)
         return await result_transport.receive_result(rpc_message, return_path, options)
@@ -513,7 +885,52 @@ class BusClient(object):
         """
         return list(self._listeners.keys())
 
-    def _validate(self, message: Message, direction: str, api_name=None, procedure_name=None):
+    async def get_backlog(
+        self, api_names: Sequence[str] = None, events: Sequence[Tuple[str, str]] = None
+    ) -> dict:
+        """Get the RPC backlog for the given APIs, and the consumer lag for the given events
+
+        Defaults to the APIs served by this process, and the events it is
+        listening for. Transports which cannot report this information are skipped.
+
+        Returns a dictionary with the keys `rpcs` (see `RpcTransport.get_backlog()`) and
+        `events` (see `EventTransport.get_lag()`).
+        """
+        if api_names is None:
+            api_names = [api.meta.name for api in registry.public()]
+        if events is None:
+            events = self.listeners
+
+        rpc_backlog = {}
+        for rpc_transport, transport_api_names in self.transport_registry.get_rpc_transports(
+            api_names
+        ):
+            try:
+                rpc_backlog.update(await rpc_transport.get_backlog(transport_api_names))
+            except NotImplementedError:
+                pass
+
+        event_lag = {}
+        event_api_names = {api_name for api_name, _ in events}
+        for event_transport, transport_api_names in self.transport_registry.get_event_transports(
+            event_api_names
+        ):
+            listen_for = [(a, e) for a, e in events if a in transport_api_names]
+            try:
+                event_lag.update(await event_transport.get_lag(listen_for))
+            except NotImplementedError:
+                pass
+
+        return dict(rpcs=rpc_backlog, events=event_lag)
+
+    def _validate(
+        self,
+        message: Message,
+        direction: str,
+        api_name=None,
+        procedure_name=None,
+        parameter_names: Sequence[str] = None,
+    ):
         assert direction in ("incoming", "outgoing")
 
         # Result messages do not carry the api or procedure name, so allow them to be
@@ -546,7 +963,9 @@ class BusClient(object):
                 return
 
         if isinstance(message, (RpcMessage, EventMessage)):
-            self.schema.validate_parameters(api_name, event_or_rpc_name, message.kwargs)
+            self.schema.validate_parameters(
+                api_name, event_or_rpc_name, message.kwargs, parameter_names=parameter_names
+            )
         elif isinstance(message, ResultMessage):
             self.schema.validate_response(api_name, event_or_rpc_name, message.result)
 
@@ -682,10 +1101,14 @@ class _EventListener(object):
     ):
         self.events = events
         self.listener_callable = listener_callable
-        self.options = options or {}
+        self.options = dict(options or {})
         self.bus_client = bus_client
 
         self.options.setdefault("consumer_group", "default")
+        # These options are for the listener, and so are not passed on to the transport
+        self.partition_key = self.options.pop("partition_key", None)
+        self.max_concurrency = self.options.pop("max_concurrency", 1)
+        self.parameters = self.options.pop("parameters", None)
 
         self.event_transports = self.get_event_transports()
 
@@ -775,75 +1198,151 @@ class _EventListener(object):
         consumer = event_transport.consume(listen_for=events, **self.options)
 
         with self.bus_client._register_listener(events):
+            if self.max_concurrency > 1:
+                await self.listen_concurrently(event_transport, consumer)
+            else:
+                async for event_message in consumer:
+                    if not await self.handle_event(event_transport, event_message):
+                        return
+
+    async def listen_concurrently(self, event_transport, consumer):
+        """ Handle up to `max_concurrency` events at once
+
+        Events with the same partition key are handled in the order they were
+        received. Events with different partition keys may be handled concurrently,
+        and may therefore complete (and be acknowledged) out of order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Resolved when the listener should stop, or failed if a listener raised an error
+        stopped = asyncio.Future()
+        # The most recent task for each partition key
+        latest_tasks = {}
+
+        async def handle(event_message, previous_task):
+            try:
+                if previous_task:
+                    # Wait for the previous event with the same key, ignoring its outcome
+                    await asyncio.wait([previous_task])
+                if stopped.done():
+                    return
+                if not await self.handle_event(event_transport, event_message):
+                    if not stopped.done():
+                        stopped.set_result(None)
+            except Exception as e:
+                if not stopped.done():
+                    stopped.set_exception(e)
+            finally:
+                semaphore.release()
+
+        def forget(key, task):
+            if latest_tasks.get(key) is task:
+                del latest_tasks[key]
+
+        async def consume():
             async for event_message in consumer:
-                # TODO: Check events match those requested
-                # TODO: Support event name of '*', but transports should raise
-                # TODO: an exception if it is not supported.
-                logger.info(
-                    L(
-                        "📩  Received event {}.{} with ID {}".format(
-                            Bold(event_message.api_name),
-                            Bold(event_message.event_name),
-                            event_message.id,
-                        )
-                    )
-                )
+                await semaphore.acquire()
+                key = self.get_partition_key(event_message)
+                task = asyncio.ensure_future(handle(event_message, latest_tasks.get(key)))
+                task.add_done_callback(functools.partial(forget, key))
+                latest_tasks[key] = task
+
+        consume_task = asyncio.ensure_future(consume())
+        try:
+            await asyncio.wait([consume_task, stopped], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            await cancel(consume_task, *latest_tasks.values())
+
+        if stopped.done():
+            # Raise any exception a listener raised
+            stopped.result()
+        else:
+            consume_task.result()
+
+    def get_partition_key(self, event_message: EventMessage) -> Hashable:
+        """ Get the key which determines the order in which events must be handled
+
+        If no partition key has been specified then every event has a unique
+        key, and so events may be handled in any order. Unhashable keys
+        (such as dicts) are converted using make_partition_key().
+        """
+        if self.partition_key is None:
+            return event_message
+        elif callable(self.partition_key):
+            return make_partition_key(self.partition_key(event_message))
+        else:
+            return make_partition_key(event_message.kwargs.get(self.partition_key))
 
-                self.bus_client._validate(event_message, "incoming")
+    async def handle_event(self, event_transport, event_message: EventMessage) -> bool:
+        """ Invoke the listener callable for a single event
 
-                await self.bus_client._plugin_hook(
-                    "before_event_execution", event_message=event_message
+        Returns False if the listener should stop.
+        """
+        # TODO: Check events match those requested
+        # TODO: Support event name of '*', but transports should raise
+        # TODO: an exception if it is not supported.
+        logger.info(
+            L(
+                "📩  Received event {}.{} with ID {}".format(
+                    Bold(event_message.api_name), Bold(event_message.event_name), event_message.id
                 )
+            )
+        )
 
-                if self.bus_client.config.api(event_message.api_name).cast_values:
-                    parameters = cast_to_signature(
-                        parameters=event_message.kwargs, callable=self.listener_callable
-                    )
-                else:
-                    parameters = event_message.kwargs
-
-                try:
-                    # Call the listener
-                    co = self.listener_callable(
-                        # Pass the event message as a positional argument,
-                        # thereby allowing listeners to have flexibility in the argument names.
-                        # (And therefore allowing listeners to use the `event` parameter themselves)
-                        event_message,
-                        **parameters,
-                    )
-
-                    # Support awaitable event listeners
-                    if inspect.isawaitable(co):
-                        await co
-
-                except LightbusShutdownInProgress as e:
-                    logger.info("Shutdown in progress: {}".format(e))
-                except Exception as e:
-                    if self.on_error == OnError.IGNORE:
-                        # We're ignore errors, so log it and move on
-                        logger.error(
-                            f"An event listener raised an exception while processing an event. Lightbus will "
-                            f"continue as normal because the on 'on_error' option is set "
-                            f"to '{OnError.IGNORE.value}'."
-                        )
-                    elif self.on_error == OnError.STOP_LISTENER:
-                        logger.error(
-                            f"An event listener raised an exception while processing an event. Lightbus will "
-                            f"stop the listener but keep on running. This is because the 'on_error' option "
-                            f"is set to '{OnError.STOP_LISTENER.value}'."
-                        )
-                        # Stop the listener by returning
-                        return
-                    else:
-                        # We're not ignoring errors, so raise it and
-                        # let the error handler callback deal with it
-                        raise
-
-                # Await the consumer again, which is our way of allowing it to
-                # acknowledge the message. This then allows us to fire the
-                # `after_event_execution` plugin hook immediately afterwards
-                await consumer.__anext__()
-
-                await self.bus_client._plugin_hook(
-                    "after_event_execution", event_message=event_message
+        self.bus_client._validate(event_message, "incoming", parameter_names=self.parameters)
+
+        await self.bus_client._plugin_hook("before_event_execution", event_message=event_message)
+
+        if self.parameters is None:
+            parameters = event_message.kwargs
+        else:
+            # Only pass the parameters the listener asked for. The others are never decoded
+            parameters = {
+                name: event_message.kwargs[name]
+                for name in self.parameters
+                if name in event_message.kwargs
+            }
+
+        if self.bus_client.config.api(event_message.api_name).cast_values:
+            parameters = cast_to_signature(parameters=parameters, callable=self.listener_callable)
+
+        try:
+            # Call the listener
+            co = self.listener_callable(
+                # Pass the event message as a positional argument,
+                # thereby allowing listeners to have flexibility in the argument names.
+                # (And therefore allowing listeners to use the `event` parameter themselves)
+                event_message,
+                **parameters,
+            )
+
+            # Support awaitable event listeners
+            if inspect.isawaitable(co):
+                await co
+
+        except LightbusShutdownInProgress as e:
+            logger.info("Shutdown in progress: {}".format(e))
+        except Exception as e:
+            if self.on_error == OnError.IGNORE:
+                # We're ignore errors, so log it and move on
+                logger.error(
+                    f"An event listener raised an exception while processing an event. Lightbus will "
+                    f"continue as normal because the on 'on_error' option is set "
+                    f"to '{OnError.IGNORE.value}'."
+                )
+            elif self.on_error == OnError.STOP_LISTENER:
+                logger.error(
+                    f"An event listener raised an exception while processing an event. Lightbus will "
+                    f"stop the listener but keep on running. This is because the 'on_error' option "
+                    f"is set to '{OnError.STOP_LISTENER.value}'."
                 )
+                # Stop the listener
+                return False
+            else:
+                # We're not ignoring errors, so raise it and
+                # let the error handler callback deal with it
+                raise
+
+        await event_transport.acknowledge(event_message)
+
+        await self.bus_client._plugin_hook("after_event_execution", event_message=event_message)
+        return True
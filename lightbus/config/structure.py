@@ -21,7 +21,7 @@ import logging
 import os
 import socket
 from enum import Enum
-from typing import NamedTuple, Optional, Union, Dict
+from typing import NamedTuple, Optional, Union, Dict, List
 
 from lightbus.plugins import find_plugins
 from lightbus.transports.base import get_available_transports
@@ -91,6 +91,15 @@ class ApiValidationConfig(NamedTuple):
     incoming: bool = True
 
 
+class RpcCacheConfig(NamedTuple):
+    #: Seconds for which results should be cached. Zero disables caching
+    ttl: float = 0
+    #: Maximum number of results to cache
+    max_size: int = 1000
+    #: Events (in the form api_name.event_name) which should clear the cache
+    invalidate_on: List[str] = []
+
+
 class ApiConfig(object):
     rpc_timeout: int = 5
     event_listener_setup_timeout: int = 1
@@ -103,6 +112,13 @@ class ApiConfig(object):
     #: Cast values before calling event listeners and RPCs
     cast_values: bool = True
     on_error: OnError = OnError.SHUTDOWN
+    #: Maximum number of RPCs to execute concurrently. None executes RPCs one at a time
+    max_concurrency: Optional[int] = None
+    #: Caching of results when calling RPCs, keyed by procedure name. The
+    #: "default" key applies to procedures without their own configuration
+    rpc_cache: Dict[str, RpcCacheConfig] = {}
+    #: Share a single remote call between identical RPC calls made concurrently
+    coalesce_rpcs: bool = False
 
     def __init__(self, **kw):
         for k, v in kw.items():
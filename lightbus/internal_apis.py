@@ -1,5 +1,10 @@
+from typing import List
+
 from lightbus.api import Api, Event
 
+if False:
+    from lightbus.client import BusClient
+
 
 class LightbusStateApi(Api):
     server_started = Event(
@@ -33,11 +38,26 @@ class LightbusStateApi(Api):
     listening_started = Event(parameters=["process_name", "api_name", "event_name", "timestamp"])
     listening_stopped = Event(parameters=["process_name", "api_name", "event_name", "timestamp"])
 
+    server_backlog = Event(parameters=["process_name", "rpcs", "events", "timestamp"])
+
     class Meta:
         name = "internal.state"
         internal = True
         auto_register = False
 
+    def __init__(self, bus_client: "BusClient" = None):
+        self._bus_client = bus_client
+
+    async def get_backlog(self, api_names: List[str], events: List[str]) -> dict:
+        """Get the RPC backlog for the given APIs, and the consumer lag for the given events
+
+        Events should be specified in the form `api_name.event_name`.
+        See `BusClient.get_backlog()`.
+        """
+        return await self._bus_client.get_backlog(
+            api_names=api_names, events=[tuple(event.rsplit(".", 1)) for event in events]
+        )
+
 
 class LightbusMetricsApi(Api):
     rpc_call_sent = Event(
@@ -90,6 +90,26 @@ class BusPath(object):
             api_name=self.api_name, name=self.name, kwargs=kwargs, options=bus_options
         )
 
+    def call_many(self, kwargs_list, *, bus_options=None, return_exceptions=False):
+        rpc_timeout = self.client.config.api(self.api_name).rpc_timeout * 1.5
+        return block(
+            self.call_many_async(
+                kwargs_list, bus_options=bus_options, return_exceptions=return_exceptions
+            ),
+            timeout=rpc_timeout,
+        )
+
+    async def call_many_async(self, kwargs_list, *, bus_options=None, return_exceptions=False):
+        """Call this RPC once for each set of kwargs in `kwargs_list`
+
+        Returns a list of results in the same order as `kwargs_list`.
+        """
+        return await self.client.call_rpc_many(
+            calls=[(self.api_name, self.name, kwargs) for kwargs in kwargs_list],
+            options=bus_options,
+            return_exceptions=return_exceptions,
+        )
+
     # Events
 
     async def listen_async(self, listener, *, bus_options: dict = None):
@@ -32,7 +32,7 @@ class MetricsPlugin(LightbusPlugin):
             id=rpc_message.id,
             api_name=rpc_message.api_name,
             procedure_name=rpc_message.procedure_name,
-            kwargs=rpc_message.kwargs,
+            kwargs=dict(rpc_message.kwargs),
         )
 
     async def after_rpc_call(
@@ -90,7 +90,7 @@ class MetricsPlugin(LightbusPlugin):
             event_id="event_id",
             api_name=event_message.api_name,
             event_name=event_message.event_name,
-            kwargs=event_message.kwargs,
+            kwargs=dict(event_message.kwargs),
         )
 
     # Server-side event hooks
@@ -104,7 +104,7 @@ class MetricsPlugin(LightbusPlugin):
             event_id="event_id",
             api_name=event_message.api_name,
             event_name=event_message.event_name,
-            kwargs=event_message.kwargs,
+            kwargs=dict(event_message.kwargs),
         )
 
     async def after_event_execution(
@@ -116,7 +116,7 @@ class MetricsPlugin(LightbusPlugin):
             event_id="event_id",
             api_name=event_message.api_name,
             event_name=event_message.event_name,
-            kwargs=event_message.kwargs,
+            kwargs=dict(event_message.kwargs),
         )
 
     def send_event(self, client, event_name_, **kwargs) -> Coroutine:
@@ -31,6 +31,7 @@ class StatePlugin(LightbusPlugin):
 
       - Server started events
       - Server ping events - indicate the server is alive. Sent every 60 seconds by default
+      - Server backlog events - the RPC backlog & event consumer lag. Sent along with each ping
       - Server shutdown events
       - Metrics enabled/disabled
       - Api registered/deregistered
@@ -44,6 +45,7 @@ class StatePlugin(LightbusPlugin):
 
     Per-message events are available via the MetricsPlugin, which is substantially higher volume.
     """
+
     priority = 100
 
     def __init__(
@@ -52,19 +54,28 @@ class StatePlugin(LightbusPlugin):
         process_name: str,
         ping_enabled: bool = True,
         ping_interval: int = 60,
+        backlog_enabled: bool = True,
     ):
         self.service_name = service_name
         self.process_name = process_name
         self.ping_enabled = ping_enabled
         self.ping_interval = ping_interval
+        self.backlog_enabled = backlog_enabled
 
     @classmethod
-    def from_config(cls, config: "Config", ping_enabled: bool = True, ping_interval: int = 60):
+    def from_config(
+        cls,
+        config: "Config",
+        ping_enabled: bool = True,
+        ping_interval: int = 60,
+        backlog_enabled: bool = True,
+    ):
         return cls(
             service_name=config.service_name,
             process_name=config.process_name,
             ping_enabled=ping_enabled,
             ping_interval=ping_interval,
+            backlog_enabled=backlog_enabled,
         )
 
     async def before_parse_args(self, *, parser: ArgumentParser, subparsers: _ArgumentGroup):
@@ -135,6 +146,38 @@ class StatePlugin(LightbusPlugin):
                 ),
                 options={},
             )
+            if self.backlog_enabled:
+                # Failing to report the backlog should not stop us pinging
+                try:
+                    await self._send_backlog(client)
+                except asyncio.CancelledError:
+                    raise
+                except NotImplementedError:
+                    logger.debug("Backlog not reported, as the transports cannot provide it")
+                except Exception:
+                    logger.exception(
+                        "Failed to send the backlog, will retry in {} seconds".format(
+                            self.ping_interval
+                        )
+                    )
+
+    async def _send_backlog(self, client: "BusClient"):
+        event_transport = client.transport_registry.get_event_transport("internal.metrics")
+        backlog = await client.get_backlog()
+        await event_transport.send_event(
+            EventMessage(
+                api_name="internal.state",
+                event_name="server_backlog",
+                kwargs=dict(
+                    process_name=self.process_name,
+                    service_name=self.service_name,
+                    rpcs=backlog["rpcs"],
+                    events=backlog["events"],
+                    timestamp=datetime.utcnow().timestamp(),
+                ),
+            ),
+            options={},
+        )
 
     def get_state_kwargs(self, client: "BusClient"):
         """Get the kwargs for a server_started or ping message"""
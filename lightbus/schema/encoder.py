@@ -1,5 +1,14 @@
 from json import JSONEncoder
 
 
+class LightbusEncoder(JSONEncoder):
+    """JSON encoder which uses an object's __to_bus__() method where present"""
+
+    def default(self, o):
+        if hasattr(o, "__to_bus__"):
+            return o.__to_bus__()
+        return super().default(o)
+
+
 def json_encode(obj, indent=2, sort_keys=True, **options):
-    return JSONEncoder(indent=indent, sort_keys=sort_keys, **options).encode(obj)
+    return LightbusEncoder(indent=indent, sort_keys=sort_keys, **options).encode(obj)
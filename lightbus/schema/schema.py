@@ -3,7 +3,7 @@ import json
 import logging
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Optional, TextIO, Union, ChainMap, List, Tuple
+from typing import Optional, TextIO, Union, ChainMap, List, Tuple, Sequence, Mapping
 import jsonschema
 
 import asyncio
@@ -123,13 +123,31 @@ class Schema(object):
             "".format(api_name, name)
         )
 
-    def validate_parameters(self, api_name, event_or_rpc_name, parameters):
+    def validate_parameters(
+        self, api_name, event_or_rpc_name, parameters, parameter_names: Sequence[str] = None
+    ):
         """Validate the parameters for the given event/rpc
 
+        If `parameter_names` is specified then only those parameters will be
+        validated, and any others will be left untouched.
+
         This will raise an `jsonschema.ValidationError` exception on error,
         or return None if valid.
         """
         json_schema = self.get_event_or_rpc_schema(api_name, event_or_rpc_name)["parameters"]
+        if parameter_names is None:
+            if isinstance(parameters, Mapping):
+                # jsonschema only considers dicts to be objects (LazyKwargs is not one)
+                parameters = dict(parameters)
+        else:
+            parameters = {k: parameters[k] for k in parameter_names if k in parameters}
+            json_schema = dict(json_schema)
+            json_schema["properties"] = {
+                k: v for k, v in json_schema.get("properties", {}).items() if k in parameter_names
+            }
+            required = [k for k in json_schema.pop("required", []) if k in parameter_names]
+            if required:
+                json_schema["required"] = required
         try:
             jsonschema.validate(parameters, json_schema)
         except jsonschema.ValidationError as e:
@@ -1,6 +1,7 @@
 import inspect
 import json
-from typing import Union, TypeVar, Type
+from collections.abc import MutableMapping
+from typing import Union, TypeVar, Type, Callable
 
 from lightbus.exceptions import InvalidMessage, InvalidSerializerConfiguration
 from lightbus.schema.encoder import json_encode
@@ -31,6 +32,53 @@ def sanity_check_metadata(message_class, metadata):
             )
 
 
+class LazyKwargs(MutableMapping):
+    """A mapping of message kwargs which are only decoded upon first access
+
+    Values are held in their encoded form until they are requested, at which
+    point they are decoded and cached. Values which are never accessed are
+    therefore never decoded.
+
+    Note that incoming validation accesses every value unless the listener
+    specifies ``parameters``, in which case only those parameters are validated.
+    The laziness therefore only saves decoding work when ``parameters`` is given
+    (or when validation is disabled).
+    """
+
+    def __init__(self, encoded: dict, decoder: Callable):
+        self.decoder = decoder
+        self._encoded = encoded
+        self._decoded = {}
+
+    def __getitem__(self, key):
+        if key not in self._decoded:
+            self._decoded[key] = self.decoder(self._encoded[key])
+        return self._decoded[key]
+
+    def __setitem__(self, key, value):
+        self._encoded[key] = None
+        self._decoded[key] = value
+
+    def __delitem__(self, key):
+        del self._encoded[key]
+        self._decoded.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._encoded)
+
+    def __len__(self):
+        return len(self._encoded)
+
+    def __repr__(self):
+        return "<{}: {}>".format(self.__class__.__name__, ", ".join(self._encoded))
+
+    def __to_bus__(self):
+        return dict(self)
+
+    def is_decoded(self, key) -> bool:
+        return key in self._decoded
+
+
 SerialisedData = TypeVar("SerialisedData")
 
 
@@ -13,6 +13,9 @@ format. The format looks like this::
     kw:username: '"admin"'
     kw:password: '"secret"'
 
+Upon deserialization the kwargs are not decoded immediately. Each value is
+instead decoded when it is first accessed (see LazyKwargs).
+
 """
 
 import lightbus
@@ -21,6 +24,7 @@ from lightbus.serializers import (
     sanity_check_metadata,
     MessageSerializer,
     MessageDeserializer,
+    LazyKwargs,
 )
 
 
@@ -56,8 +60,8 @@ class ByFieldMessageDeserializer(MessageDeserializer):
 
             # kwarg fields start with a ':', everything else is metadata
             if k[0] == ":":
-                # kwarg values need decoding
-                kwargs[k[1:]] = self.decoder(v)
+                # kwarg values need decoding, but we leave that until they are accessed
+                kwargs[k[1:]] = v
             else:
                 # metadata args are implicitly strings, so we don't need to decode them
                 metadata[k] = v
@@ -70,4 +74,6 @@ class ByFieldMessageDeserializer(MessageDeserializer):
                 native_id = native_id.decode("utf8")
             extra["native_id"] = native_id
 
-        return self.message_class.from_dict(metadata=metadata, kwargs=kwargs, **extra)
+        return self.message_class.from_dict(
+            metadata=metadata, kwargs=LazyKwargs(kwargs, self.decoder), **extra
+        )
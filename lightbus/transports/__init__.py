@@ -8,6 +8,7 @@ from .debug import (
 from .direct import DirectRpcTransport, DirectResultTransport, DirectEventTransport
 from .redis import (
     RedisRpcTransport,
+    RedisStreamRpcTransport,
     RedisResultTransport,
     RedisEventTransport,
     RedisSchemaTransport,
@@ -1,6 +1,7 @@
 import logging
+from datetime import datetime
 from itertools import chain
-from typing import Sequence, Tuple, List, Generator, Dict, NamedTuple, TypeVar, Type, Set
+from typing import Sequence, Tuple, List, Generator, Dict, NamedTuple, TypeVar, Type, Set, Optional
 import inspect
 
 from lightbus.api import Api
@@ -54,10 +55,47 @@ class RpcTransport(Transport):
         RpcTransport.from_config()
         raise NotImplementedError()
 
+    async def call_rpcs(self, rpc_messages: Sequence[RpcMessage], options: dict):
+        """Publish many calls to remote procedures
+
+        Transports which can publish many calls more efficiently than
+        one at a time should override this.
+        """
+        for rpc_message in rpc_messages:
+            await self.call_rpc(rpc_message, options=options)
+
     async def consume_rpcs(self, apis: Sequence[Api]) -> Sequence[RpcMessage]:
         """Consume RPC calls for the given API"""
         raise NotImplementedError()
 
+    async def cancel(self, rpc_message: RpcMessage):
+        """Cancel the given RPC call, as the caller is no longer waiting for a result
+
+        Transports should, where possible, prevent the call from being executed.
+        This is optional, and not all transports will support it.
+        """
+        pass
+
+    async def acknowledge(self, *rpc_messages: RpcMessage):
+        """Acknowledge that the given RPC calls have been processed
+
+        Called once the results of the calls have been sent. Transports
+        which can redeliver calls which were never completed should
+        implement this, otherwise it can be ignored.
+        """
+        pass
+
+    async def get_backlog(self, api_names: Sequence[str]) -> Dict[str, Dict[str, Optional[int]]]:
+        """Get the number of RPC calls outstanding for each of the given APIs
+
+        Returns a dictionary keyed by API name. Each value is a dictionary containing
+        `pending` (calls being processed) and `waiting` (calls yet to be processed).
+        Either value may be `None` if the transport cannot report it.
+        """
+        raise NotImplementedError(
+            f"RPC transport {self.__class__.__name__} does not support reporting its backlog"
+        )
+
 
 class ResultTransport(Transport):
     """Implement the send & receiving of results
@@ -80,6 +118,32 @@ class ResultTransport(Transport):
         """
         raise NotImplementedError()
 
+    async def send_results(self, results: Sequence[Tuple[RpcMessage, ResultMessage, str]]):
+        """Send several results back to their callers
+
+        Transports can override this in order to send the results more efficiently
+        than one at a time (using a single pipeline, for example).
+
+        Args:
+            results (): A sequence of `(rpc_message, result_message, return_path)` tuples.
+                See :ref:`send_result()` for details of each value.
+        """
+        for rpc_message, result_message, return_path in results:
+            await self.send_result(rpc_message, result_message, return_path)
+
+    async def abandon(self, rpc_message: RpcMessage, return_path: str):
+        """Stop waiting for the result of the given RPC call
+
+        Transports should, where possible, prevent the result from being sent.
+        This is optional, and not all transports will support it.
+
+        Args:
+            rpc_message (): The original message sent to the server
+            return_path (str): The string indicated where the result would have been received.
+                As generated by :ref:`get_return_path()`.
+        """
+        pass
+
     async def receive_result(
         self, rpc_message: RpcMessage, return_path: str, options: dict
     ) -> ResultMessage:
@@ -102,6 +166,15 @@ class EventTransport(Transport):
         """Publish an event"""
         raise NotImplementedError()
 
+    async def send_events(self, event_messages: Sequence[EventMessage], options: dict):
+        """Publish many events
+
+        Transports which can publish many events more efficiently than
+        one at a time should override this.
+        """
+        for event_message in event_messages:
+            await self.send_event(event_message, options=options)
+
     def consume(self, listen_for: List[Tuple[str, str]], consumer_group: str = None, **kwargs):
         """Consume messages for the given APIs
 
@@ -113,15 +186,60 @@ class EventTransport(Transport):
                     ('mycompany.auth', 'user_created'),
                     ('mycompany.auth', 'user_updated'),
                 ]
-                async with event_transport.consume(listen_for) as event_message:
+                async for event_message in event_transport.consume(listen_for):
                     print(event_message)
+                    await event_transport.acknowledge(event_message)
 
+        Each message should be acknowledged once it has been processed. Transports
+        may yield further messages before earlier messages have been acknowledged.
         """
         raise NotImplementedError(
             f"Event transport {self.__class__.__name__} does not support listening for events"
         )
 
-    def history(self, listen_for: List[Tuple[str, str]]):
+    async def acknowledge(self, *event_messages: EventMessage):
+        """Acknowledge that the given events have been processed
+
+        Transports which can redeliver events which were never processed
+        should implement this, otherwise it can be ignored.
+        """
+        pass
+
+    async def delete_consumer_group(self, listen_for: List[Tuple[str, str]], consumer_group: str):
+        """Delete the given consumer group, as it will not be used again
+
+        Transports which persist consumer groups should implement this,
+        otherwise it can be ignored.
+        """
+        pass
+
+    async def get_lag(self, listen_for: List[Tuple[str, str]]) -> Dict[str, Dict[str, dict]]:
+        """Get how far behind each consumer group is for the given events
+
+        Returns a dictionary keyed by the event's full name (`api_name.event_name`).
+        Each value is a dictionary of consumer group names to their lag.
+        """
+        raise NotImplementedError(
+            f"Event transport {self.__class__.__name__} does not support reporting consumer lag"
+        )
+
+    def history(
+        self,
+        listen_for: List[Tuple[str, str]],
+        since: datetime = None,
+        until: datetime = None,
+        **kwargs,
+    ):
+        """Get past events for the given APIs
+
+        Example::
+
+            async for event_message in event_transport.history(listen_for, since=yesterday):
+                print(event_message)
+
+        Events should be yielded oldest first, and should be fetched lazily
+        so that large histories can be iterated through.
+        """
         raise NotImplementedError(
             f"Event transport {self.__class__.__name__} does not support fetching past events"
         )
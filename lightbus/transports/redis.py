@@ -1,28 +1,52 @@
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import re
 import threading
 import time
-from collections import OrderedDict
+import uuid
+from collections import OrderedDict, defaultdict
 from datetime import datetime
-from typing import Sequence, Optional, Union, Generator, Dict, Mapping, List
+from typing import (
+    Sequence,
+    Optional,
+    Union,
+    Generator,
+    Dict,
+    Mapping,
+    List,
+    Tuple,
+    Container,
+    Hashable,
+    Callable,
+    Awaitable,
+)
 from enum import Enum
 
 import aioredis
-from aioredis import Redis, ReplyError, ConnectionClosedError
+from aioredis import Redis, RedisError, ReplyError, ConnectionClosedError
 from aioredis.pool import ConnectionsPool
 from aioredis.util import decode
 
 from lightbus.api import Api
-from lightbus.exceptions import LightbusException, LightbusShutdownInProgress, TransportIsClosed
+from lightbus.exceptions import (
+    LightbusException,
+    LightbusShutdownInProgress,
+    TransportIsClosed,
+    UnsupportedOptionValue,
+)
 from lightbus.log import L, Bold, LBullets
 from lightbus.message import RpcMessage, ResultMessage, EventMessage
 from lightbus.schema.encoder import json_encode
 from lightbus.serializers.blob import BlobMessageSerializer, BlobMessageDeserializer
 from lightbus.serializers.by_field import ByFieldMessageSerializer, ByFieldMessageDeserializer
 from lightbus.transports.base import ResultTransport, RpcTransport, EventTransport, SchemaTransport
-from lightbus.utilities.async import cancel, check_for_exception
+from lightbus.utilities.async import cancel, check_for_exception, make_exception_checker
+from lightbus.utilities.cache import TtlLruCache
 from lightbus.utilities.frozendict import frozendict
+from lightbus.utilities.hashing import ConsistentHashRing, crc16
 from lightbus.utilities.human import human_time
 from lightbus.utilities.importing import import_from_string
 
@@ -33,6 +57,27 @@ logger = logging.getLogger(__name__)
 
 Since = Union[str, datetime, None]
 
+# Prefixes the fields added to messages which are moved to a dead letter stream
+DEAD_LETTER_PREFIX = b"dead_letter:"
+
+# The largest sequence number a Redis stream ID can have
+MAX_STREAM_ID_SEQUENCE = 2 ** 64 - 1
+
+# The prefix of the expiry keys created alongside queued RPC calls by the previous release
+LEGACY_RPC_EXPIRY_KEY_PREFIX = "rpc_expiry_key:"
+
+# The maximum number of results kept for RPC callers who have yet to start waiting for them
+EARLY_RESULTS_MAX_SIZE = 10000
+
+# The maximum number of events the retention task will scan (and so trim) by
+# length in a single script call, so that Redis is never blocked for long
+RETENTION_MAX_SCAN = 10000
+
+# The number of hash slots keys are divided between in Redis Cluster
+CLUSTER_SLOTS = 16384
+# How often (in seconds) the mapping of hash slots to cluster nodes is reloaded
+CLUSTER_SLOTS_REFRESH_INTERVAL = 30
+
 
 class StreamUse(Enum):
     PER_API = "per_api"
@@ -45,6 +90,231 @@ class StreamUse(Enum):
             return super().__eq__(other)
 
 
+class ResultMode(Enum):
+    # Each RPC call receives its result on its own key
+    PER_CALL = "per_call"
+    # Results for all calls made by a process are received on a single key
+    PER_PROCESS = "per_process"
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            return self.value == other
+        else:
+            return super().__eq__(other)
+
+
+# Enqueue an RPC call. The call's payload is stored in its own key which
+# expires after the RPC timeout, and the call's ID is pushed onto the queue.
+#
+# KEYS[1]: The queue key
+# KEYS[2]: The message key
+# ARGV[1]: The message ID
+# ARGV[2]: The serialized message
+# ARGV[3]: Milliseconds until the message expires
+ENQUEUE_RPC_SCRIPT = """
+redis.call('SET', KEYS[2], ARGV[2], 'PX', ARGV[3])
+redis.call('RPUSH', KEYS[1], ARGV[1])
+return 1
+"""
+
+# Dequeue up to a given number of RPC calls. Calls whose message key has
+# expired have timed out, and are discarded without being returned.
+#
+# The message keys cannot be passed in KEYS as their IDs are only known once popped.
+# In cluster mode the caller must therefore ensure the message key prefix has the
+# same hash tag as the queues, so the message keys are in the same hash slot.
+#
+# Clients of the previous release pushed the whole serialized (JSON) call onto the
+# queue, along with an rpc_expiry_key:<id> key. Such calls are still accepted so
+# servers can be upgraded before their clients. TODO: Remove in the next release
+#
+# KEYS: The queue keys, in the order in which they should be drained
+# ARGV[1]: The maximum number of live messages to return
+# ARGV[2]: The maximum number of IDs to pop from the queues (live or expired)
+# ARGV[3]: The prefix of the message keys, to which the message ID is appended
+# ARGV[4]: The prefix of the legacy expiry keys, or an empty string to ignore legacy calls
+# ARGV[5...]: Pairs of queue key & message ID which the caller has already popped
+#
+# Returns the number of expired calls discarded, followed by
+# pairs of queue key & serialized message
+DEQUEUE_RPC_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local max_pops = tonumber(ARGV[2])
+local discarded = 0
+local results = {}
+
+local function take_legacy(queue, message)
+    local ok, decoded = pcall(cjson.decode, message)
+    local message_id = ok and type(decoded) == 'table' and decoded['metadata']
+        and decoded['metadata']['id']
+    if message_id and redis.call('DEL', ARGV[4] .. message_id) == 1 then
+        table.insert(results, queue)
+        table.insert(results, message)
+        limit = limit - 1
+    else
+        discarded = discarded + 1
+    end
+end
+
+local function take(queue, message_id)
+    if ARGV[4] ~= '' and string.sub(message_id, 1, 1) == '{' then
+        return take_legacy(queue, message_id)
+    end
+    local message_key = ARGV[3] .. message_id
+    local message = redis.call('GET', message_key)
+    if message then
+        redis.call('DEL', message_key)
+        table.insert(results, queue)
+        table.insert(results, message)
+        limit = limit - 1
+    else
+        discarded = discarded + 1
+    end
+end
+
+for i = 5, #ARGV, 2 do
+    take(ARGV[i], ARGV[i + 1])
+end
+
+for _, queue in ipairs(KEYS) do
+    while limit > 0 and max_pops > 0 do
+        local message_id = redis.call('LPOP', queue)
+        if not message_id then
+            break
+        end
+        max_pops = max_pops - 1
+        take(queue, message_id)
+    end
+end
+
+table.insert(results, 1, discarded)
+return results
+"""
+
+
+# Send RPC results back to their callers, skipping any results which
+# the caller has abandoned (because the call timed out).
+#
+# KEYS: Pairs of result key & abandoned marker key
+# ARGV[1]: Seconds until the result keys expire
+# ARGV[2...]: The serialized results, one for each pair of keys
+#
+# Returns the number of results sent
+SEND_RESULTS_SCRIPT = """
+local sent = 0
+for i = 1, #KEYS, 2 do
+    if redis.call('EXISTS', KEYS[i + 1]) == 0 then
+        redis.call('LPUSH', KEYS[i], ARGV[(i + 1) / 2 + 1])
+        redis.call('EXPIRE', KEYS[i], ARGV[1])
+        sent = sent + 1
+    end
+end
+return sent
+"""
+
+# Delete a lock, but only if it is still held by the given owner. The lock
+# may have expired and since been acquired by somebody else.
+#
+# KEYS[1]: The lock key
+# ARGV[1]: The owner of the lock
+#
+# Returns 1 if the lock was deleted, otherwise 0
+DELETE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Get the ID of the event at the given position within a stream, counting from
+# the oldest event (which is at position 0). Events are read in pages, so only
+# the ID itself is returned to the caller. The script runs in time proportional
+# to the position, so callers should keep it below RETENTION_MAX_SCAN.
+#
+# KEYS[1]: The stream key
+# ARGV[1]: The position of the event
+#
+# Returns the event's ID, or nil if the stream holds no event at that position
+STREAM_ID_AT_SCRIPT = """
+local remaining = tonumber(ARGV[1])
+local start = '-'
+while true do
+    local count = math.min(remaining, 1000) + 1
+    local entries = redis.call('XRANGE', KEYS[1], start, '+', 'COUNT', count)
+    if #entries < count then
+        return false
+    end
+    if remaining < count then
+        return entries[remaining + 1][1]
+    end
+    remaining = remaining - (count - 1)
+    start = entries[count][1]
+end
+"""
+
+
+class ClusterRedis(Redis):
+    """A connection to a Redis Cluster node which follows MOVED & ASK redirections
+
+    Commands which are redirected are retried once upon the node given by the
+    redirection. A MOVED redirection also causes the slot map to be reloaded.
+    Pipelines & transactions cannot safely be replayed elsewhere, so they are
+    not retried, but any redirection within them will expire the slot map.
+    """
+
+    def __init__(self, context_redis: Redis, transport: "RedisTransportMixin"):
+        super().__init__(context_redis._pool_or_conn)
+        self._context_redis = context_redis
+        self._transport = transport
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._context_redis.__exit__(*exc_info)
+
+    async def execute(self, command, *args, **kwargs):
+        try:
+            return await super().execute(command, *args, **kwargs)
+        except ReplyError as e:
+            redirect = parse_cluster_redirect(e)
+            if not redirect:
+                raise
+
+        is_ask, address = redirect
+        if not is_ask:
+            # The slot has been permanently moved, so our slot map is out of date
+            await self._transport._load_cluster_slots()
+        node_pool = await self._transport._get_node_pool(address)
+        with await node_pool as redis:
+            if is_ask:
+                await redis.execute(b"ASKING")
+            return await redis.execute(command, *args, **kwargs)
+
+    def pipeline(self):
+        return self._watch_for_redirects(Redis(self._pool_or_conn).pipeline())
+
+    def multi_exec(self):
+        return self._watch_for_redirects(Redis(self._pool_or_conn).multi_exec())
+
+    def _watch_for_redirects(self, pipeline):
+        execute = pipeline.execute
+
+        async def execute_and_watch(*, return_exceptions=False):
+            try:
+                results = await execute(return_exceptions=return_exceptions)
+            except RedisError as e:
+                if parse_cluster_redirect(e):
+                    self._transport._expire_cluster_slots()
+                raise
+            if any(isinstance(r, Exception) and parse_cluster_redirect(r) for r in results):
+                self._transport._expire_cluster_slots()
+            return results
+
+        pipeline.execute = execute_and_watch
+        return pipeline
+
+
 class RedisTransportMixin(object):
     connection_parameters: dict = {"address": "redis://localhost:6379", "maxsize": 100}
 
@@ -53,9 +323,19 @@ class RedisTransportMixin(object):
         redis_pool: Optional[Redis],
         url: str = None,
         connection_parameters: Mapping = frozendict(),
+        cluster: bool = False,
     ):
         self._local = threading.local()
         self._closed = False
+        # When using Redis Cluster, the given URL is used to discover the cluster's nodes,
+        # and each command is sent to the node serving the hash slot of its key
+        self.cluster = cluster
+
+        if cluster and redis_pool:
+            raise InvalidRedisPool(
+                "A redis_pool cannot be used in cluster mode, as a connection pool must be "
+                "created for each node in the cluster. Specify the url option instead."
+            )
 
         if not redis_pool:
             # Connect lazily using the provided parameters
@@ -86,7 +366,12 @@ class RedisTransportMixin(object):
 
             self._local.redis_pool = redis_pool
 
-    async def connection_manager(self) -> Redis:
+    async def connection_manager(self, key: str = None) -> Redis:
+        """Get a connection to Redis
+
+        In cluster mode, the connection is to the node which holds the given `key`. All
+        keys used with the connection must therefore be in the same hash slot as `key`.
+        """
         if self._closed:
             # This was first caught when the state plugin tried to send a
             # message to the bus on upon the after_server_stopped stopped event.
@@ -103,8 +388,13 @@ class RedisTransportMixin(object):
                 )
             self._local.redis_pool = await aioredis.create_redis_pool(**self.connection_parameters)
 
+        redis_pool = self._local.redis_pool
+        use_cluster = self.cluster and key is not None
+        if use_cluster:
+            redis_pool = await self._get_cluster_pool(key)
+
         try:
-            internal_pool = self._local.redis_pool._pool_or_conn
+            internal_pool = redis_pool._pool_or_conn
             if hasattr(internal_pool, "size") and hasattr(internal_pool, "maxsize"):
                 if internal_pool.size == internal_pool.maxsize:
                     logging.critical(
@@ -115,13 +405,180 @@ class RedisTransportMixin(object):
                         "".format(self.connection_parameters.get("maxsize"))
                     )
 
-            return await self._local.redis_pool
+            if use_cluster:
+                return ClusterRedis(await redis_pool, transport=self)
+            else:
+                return await redis_pool
         except aioredis.PoolClosedError:
             raise LightbusShutdownInProgress(
                 "Redis connection pool has been closed. Assuming shutdown in progress."
             )
 
+    async def _get_cluster_pool(self, key: str) -> Redis:
+        """Get the connection pool for the cluster node which serves the given key"""
+        loaded_at = getattr(self._local, "cluster_slots_loaded_at", 0)
+        if time.time() - loaded_at > CLUSTER_SLOTS_REFRESH_INTERVAL:
+            await self._load_cluster_slots()
+
+        return await self._get_node_pool(self._local.cluster_slots[redis_key_slot(key)])
+
+    async def _get_node_pool(self, address: Tuple[str, int]) -> Redis:
+        """Get the connection pool for the cluster node at the given address"""
+        cluster_pools = self._local.__dict__.setdefault("cluster_pools", {})
+        if address not in cluster_pools:
+            connection_parameters = dict(self.connection_parameters, address=address)
+            cluster_pools[address] = await aioredis.create_redis_pool(**connection_parameters)
+        return cluster_pools[address]
+
+    async def _load_cluster_slots(self):
+        """Load which cluster node serves each hash slot, using the node given by our URL"""
+        with await self.connection_manager() as redis:
+            cluster_slots = await redis.execute(b"CLUSTER", b"SLOTS")
+
+        slots = [None] * CLUSTER_SLOTS
+        for start, end, (host, port, *_), *_replicas in cluster_slots:
+            slots[start : end + 1] = [(decode(host, "utf8"), int(port))] * (end - start + 1)
+        self._local.cluster_slots = slots
+        self._local.cluster_slots_loaded_at = time.time()
+
+    def _expire_cluster_slots(self):
+        """Ensure the slot map is reloaded before it is next used"""
+        self._local.cluster_slots_loaded_at = 0
+
+    def _group_by_slot(self, items: Sequence, key: Callable = None) -> List[list]:
+        """Split the given keys into groups which can be used together in a single command
+
+        In cluster mode, each group contains keys within the same hash slot. If `key` is
+        given then it is used to get the Redis key for each item.
+        """
+        if not self.cluster:
+            return [list(items)] if items else []
+        groups = OrderedDict()
+        for item in items:
+            groups.setdefault(redis_key_slot(key(item) if key else item), []).append(item)
+        return list(groups.values())
+
+    def _hash_tag(self, value: str) -> str:
+        """Mark the given part of a key as its hash tag when in cluster mode
+
+        Keys with the same hash tag are placed in the same hash slot, and can
+        therefore be used together in transactions, pipelines and scripts.
+        """
+        return f"{{{value}}}" if self.cluster else value
+
+    async def _read_first(self, reads: Mapping[Hashable, Callable[[], Awaitable]]) -> dict:
+        """Run the given blocking reads concurrently, and return once any of them completes
+
+        Returns the results of the completed reads, keyed as given. Any reads still in
+        progress are left running and picked up by the next call using the same key, as
+        cancelling them could lose anything they have just received.
+        """
+        reading = self._local.__dict__.setdefault("blocking_reads", {})
+        for key, read in reads.items():
+            if key not in reading:
+                reading[key] = asyncio.ensure_future(read())
+
+        done, _ = await asyncio.wait(
+            [reading[key] for key in reads], return_when=asyncio.FIRST_COMPLETED
+        )
+        return {key: reading.pop(key).result() for key in reads if reading[key] in done}
+
+    async def _load_scripts(self, *scripts: str):
+        """Load the given lua scripts into Redis ready to be called by _execute_script()"""
+        with await self.connection_manager() as redis:
+            for script in scripts:
+                await redis.script_load(script)
+
+    async def _execute_script(self, redis: Redis, script: str, keys: Sequence, args: Sequence):
+        """Execute a lua script by its digest, loading the script into Redis if necessary
+
+        Redis will forget any loaded scripts upon restart, so we cannot assume the
+        script is still present just because it was loaded previously.
+        """
+        digest = script_digest(script)
+        try:
+            return await redis.evalsha(digest, keys=list(keys), args=list(args))
+        except ReplyError as e:
+            if "NOSCRIPT" not in str(e):
+                raise
+            await redis.script_load(script)
+            return await redis.evalsha(digest, keys=list(keys), args=list(args))
+
+    async def _claim_timed_out_messages(
+        self,
+        redis,
+        stream: str,
+        consumer_group: str,
+        min_idle: int,
+        batch_size: int,
+        in_progress: Container = None,
+    ):
+        """Claim messages which have been pending for more than `min_idle` milliseconds
+
+        Pages through the consumer group's pending messages `batch_size` at a time,
+        claiming any which have timed out using a single XCLAIM per page.
+
+        If `in_progress` is given, it should contain the IDs of the messages this
+        consumer is still processing, and only these of its own messages are left
+        alone. Otherwise, all messages pending for this consumer are left alone.
+
+        Yields a list of claimed `(message_id, fields, previous_consumer, num_deliveries)`
+        tuples for each page, where `num_deliveries` is the number of times the message
+        had been delivered prior to being claimed.
+        """
+        start = "-"
+        while True:
+            pending_messages = await redis.xpending(
+                stream, consumer_group, start, "+", count=batch_size
+            )
+            lost_messages = {}
+            for message_id, consumer_name, ms_idle, deliveries in pending_messages:
+                message_id = decode(message_id, "utf8")
+                consumer_name = decode(consumer_name, "utf8")
+                if ms_idle <= min_idle:
+                    continue
+                if consumer_name == self.consumer_name and (
+                    in_progress is None or message_id in in_progress
+                ):
+                    continue
+                lost_messages[message_id] = (consumer_name, deliveries)
+            if lost_messages:
+                claimed_messages = await redis.xclaim(
+                    stream, consumer_group, self.consumer_name, min_idle, *lost_messages.keys()
+                )
+                if claimed_messages:
+                    yield [
+                        (message_id, fields, *lost_messages[decode(message_id, "utf8")])
+                        for message_id, fields in claimed_messages
+                    ]
+
+            if len(pending_messages) < batch_size:
+                return
+            start = redis_stream_id_add_one(pending_messages[-1][0])
+
+    async def _create_consumer_groups(self, streams, redis, consumer_group):
+        for stream, since in streams.items():
+            if not await redis.exists(stream):
+                # Add a noop to ensure the stream exists
+                await redis.xadd(stream, fields={"": ""})
+
+            try:
+                # Create the group (it may already exist)
+                await redis.xgroup_create(stream, consumer_group, latest_id=since)
+            except ReplyError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+
     async def close(self):
+        blocking_reads = getattr(self._local, "blocking_reads", {})
+        await cancel(*blocking_reads.values())
+        blocking_reads.clear()
+
+        for redis_pool in getattr(self._local, "cluster_pools", {}).values():
+            redis_pool.close()
+            await redis_pool.wait_closed()
+        self._local.cluster_pools = {}
+
         if getattr(self._local, "redis_pool", None):
             self._local.redis_pool.close()
             await self._local.redis_pool.wait_closed()
@@ -142,10 +599,20 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
     This transport uses a redis list and a blocking pop operation
     to distribute an RPC call to a single RPC consumer.
 
-    Each call also has a corresponding expiry key created. Once the
-    key expires it should be assumed that the RPC call has timed
-    out and that therefore is should be discarded rather than
-    be processed.
+    The list contains only the ID of each call. The serialized call
+    is stored in a corresponding message key which expires after
+    `rpc_timeout` seconds. Once the key expires it should be assumed
+    that the RPC call has timed out and that therefore is should be
+    discarded rather than be processed.
+
+    Both enqueuing and dequeuing are performed by lua scripts, thereby
+    allowing expired calls to be discarded within Redis. Up to
+    `batch_size` queued calls will be consumed each time the transport
+    is woken by a new call.
+
+    Each API has `priority_levels` queues. Callers may specify the
+    `priority` bus option (from zero up to `priority_levels - 1`), and
+    higher priority queues will always be drained first.
     """
 
     def __init__(
@@ -159,14 +626,17 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
         batch_size=10,
         rpc_timeout=5,
         consumption_restart_delay=5,
+        priority_levels=1,
+        cluster: bool = False,
     ):
-        self.set_redis_pool(redis_pool, url, connection_parameters)
+        self.set_redis_pool(redis_pool, url, connection_parameters, cluster)
         self._latest_ids = {}
         self.serializer = serializer
         self.deserializer = deserializer
         self.batch_size = batch_size
         self.rpc_timeout = rpc_timeout
         self.consumption_restart_delay = consumption_restart_delay
+        self.priority_levels = priority_levels
 
     @classmethod
     def from_config(
@@ -179,6 +649,8 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
         deserializer: str = "lightbus.serializers.BlobMessageDeserializer",
         rpc_timeout: int = 5,
         consumption_restart_delay: int = 5,
+        priority_levels: int = 1,
+        cluster: bool = False,
     ):
         serializer = import_from_string(serializer)()
         deserializer = import_from_string(deserializer)(RpcMessage)
@@ -191,11 +663,17 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
             batch_size=batch_size,
             rpc_timeout=rpc_timeout,
             consumption_restart_delay=consumption_restart_delay,
+            priority_levels=priority_levels,
+            cluster=cluster,
         )
 
+    async def open(self):
+        await self._load_scripts(ENQUEUE_RPC_SCRIPT, DEQUEUE_RPC_SCRIPT)
+
     async def call_rpc(self, rpc_message: RpcMessage, options: dict):
-        queue_key = f"{rpc_message.api_name}:rpc_queue"
-        expiry_key = f"rpc_expiry_key:{rpc_message.id}"
+        priority = self._get_priority(rpc_message, options)
+        queue_key = self._get_queue_key(rpc_message.api_name, priority)
+        message_key = self._get_message_key(rpc_message.api_name, rpc_message.id)
         logger.debug(
             LBullets(
                 L("Enqueuing message {} in Redis stream {}", Bold(rpc_message), Bold(queue_key)),
@@ -203,14 +681,14 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
             )
         )
 
-        with await self.connection_manager() as redis:
+        with await self.connection_manager(key=queue_key) as redis:
             start_time = time.time()
-            print("setting " + expiry_key)
-            p = redis.pipeline()
-            p.rpush(key=queue_key, value=self.serializer(rpc_message))
-            p.set(expiry_key, 1)
-            p.expire(expiry_key, timeout=self.rpc_timeout)
-            await p.execute()
+            await self._execute_script(
+                redis,
+                ENQUEUE_RPC_SCRIPT,
+                keys=[queue_key, message_key],
+                args=[rpc_message.id, self.serializer(rpc_message), int(self.rpc_timeout * 1000)],
+            )
 
         logger.debug(
             L(
@@ -221,6 +699,65 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
             )
         )
 
+    async def call_rpcs(self, rpc_messages: Sequence[RpcMessage], options: dict):
+        logger.debug(L("Enqueuing {} messages in Redis", Bold(len(rpc_messages))))
+        digest = script_digest(ENQUEUE_RPC_SCRIPT)
+        timeout_ms = int(self.rpc_timeout * 1000)
+
+        # Validate all the calls before enqueuing any of them
+        calls = []
+        for rpc_message in rpc_messages:
+            priority = self._get_priority(rpc_message, options)
+            calls.append((rpc_message, self._get_queue_key(rpc_message.api_name, priority)))
+
+        start_time = time.time()
+        # In cluster mode, calls are enqueued with one round trip per hash slot
+        for pending in self._group_by_slot(calls, key=lambda call: call[1]):
+            with await self.connection_manager(key=pending[0][1]) as redis:
+                for attempt in range(2):
+                    # Enqueue all the calls in a single round trip
+                    pipeline = redis.pipeline()
+                    for rpc_message, queue_key in pending:
+                        pipeline.evalsha(
+                            digest,
+                            keys=[
+                                queue_key,
+                                self._get_message_key(rpc_message.api_name, rpc_message.id),
+                            ],
+                            args=[rpc_message.id, self.serializer(rpc_message), timeout_ms],
+                        )
+                    results = await pipeline.execute(return_exceptions=True)
+
+                    failed = []
+                    for call, result in zip(pending, results):
+                        if not isinstance(result, Exception):
+                            continue
+                        if attempt > 0 or "NOSCRIPT" not in str(result):
+                            raise result
+                        failed.append(call)
+
+                    if not failed:
+                        break
+                    # Redis has forgotten the script (perhaps it restarted), so
+                    # load it again and retry the calls which failed
+                    await redis.script_load(ENQUEUE_RPC_SCRIPT)
+                    pending = failed
+
+        logger.debug(
+            L(
+                "Enqueued {} messages in Redis in {}",
+                Bold(len(rpc_messages)),
+                human_time(time.time() - start_time),
+            )
+        )
+
+    async def cancel(self, rpc_message: RpcMessage):
+        # The call's ID will remain in the queue, but the dequeue script
+        # will discard it as it has no corresponding message key
+        message_key = self._get_message_key(rpc_message.api_name, rpc_message.id)
+        with await self.connection_manager(key=message_key) as redis:
+            await redis.delete(message_key)
+
     async def consume_rpcs(self, apis: Sequence[Api]) -> Sequence[RpcMessage]:
         while True:
             try:
@@ -233,8 +770,13 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
                 await asyncio.sleep(self.consumption_restart_delay)
 
     async def _consume_rpcs(self, apis: Sequence[Api]) -> Sequence[RpcMessage]:
-        # Get the name of each stream
-        queue_keys = ["{}:rpc_queue".format(api.meta.name) for api in apis]
+        # Get the name of each queue. Both BLPOP and the dequeue script take from the
+        # queues in the order given, so list the queues with the highest priority first
+        queue_keys = [
+            self._get_queue_key(api.meta.name, priority)
+            for priority in reversed(range(0, self.priority_levels))
+            for api in apis
+        ]
 
         logger.debug(
             LBullets(
@@ -243,9 +785,72 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
             )
         )
 
-        with await self.connection_manager() as redis:
+        if self.cluster:
+            # Each API's queues are in their own hash slot, so must be read from separately
+            api_names = [api.meta.name for api in apis]
+            queue_groups = [
+                [
+                    self._get_queue_key(api_name, priority)
+                    for priority in reversed(range(0, self.priority_levels))
+                ]
+                for api_name in api_names
+            ]
+        else:
+            api_names = [None]
+            queue_groups = [queue_keys]
+
+        # Try to take any calls which are already waiting
+        discarded = 0
+        results = []
+        for api_name, group_keys in zip(api_names, queue_groups):
+            with await self.connection_manager(key=group_keys[0]) as redis:
+                group_discarded, *group_results = await self._dequeue(redis, api_name, group_keys)
+            discarded += group_discarded
+            results.extend(group_results)
+
+        if not results:
+            # Nothing waiting, so block until a call arrives
+            if len(queue_groups) == 1:
+                popped = {0: await self._blpop(queue_groups[0])}
+            else:
+                popped = await self._read_first(
+                    {
+                        n: functools.partial(self._blpop, group_keys)
+                        for n, group_keys in enumerate(queue_groups)
+                    }
+                )
+
+            # Now we have been woken up, take the call we were given along with any others
+            # that are waiting
+            for n, (queue_key, message_id) in popped.items():
+                with await self.connection_manager(key=queue_key) as redis:
+                    group_discarded, *group_results = await self._dequeue(
+                        redis, api_names[n], queue_groups[n], popped=[(queue_key, message_id)]
+                    )
+                discarded += group_discarded
+                results.extend(group_results)
+
+        if discarded:
+            logger.debug(L("Discarded {} expired RPC messages", Bold(discarded)))
+
+        rpc_messages = []
+        for queue_key, data in zip(results[::2], results[1::2]):
+            rpc_message = self.deserializer(data)
+            logger.debug(
+                LBullets(
+                    L("⬅ Received RPC message on stream {}", Bold(decode(queue_key, "utf8"))),
+                    items=dict(**rpc_message.get_metadata(), kwargs=rpc_message.get_kwargs()),
+                )
+            )
+            rpc_messages.append(rpc_message)
+
+        return rpc_messages
+
+    async def _blpop(self, queue_keys: Sequence[str]) -> Tuple:
+        """Block until a call is pushed to any of the given queues, and pop it"""
+        with await self.connection_manager(key=queue_keys[0]) as redis:
             try:
-                stream, data = await redis.blpop(*queue_keys)
+                return await redis.blpop(*queue_keys)
             except RuntimeError:
                 # For some reason aio-redis likes to eat the CancelledError and
                 # turn it into a Runtime error:
@@ -254,23 +859,462 @@ class RedisRpcTransport(RedisTransportMixin, RpcTransport):
                     "aio-redis task was cancelled and decided it should be a RuntimeError"
                 )
 
+    async def _dequeue(
+        self,
+        redis,
+        api_name: Optional[str],
+        queue_keys: Sequence[str],
+        popped: Sequence[Tuple] = (),
+    ):
+        """Take up to batch_size live calls from the given queues
+
+        Calls which have already been popped from a queue (by BLPOP) can
+        be passed in `popped` as `(queue_key, message_id)` pairs. In cluster
+        mode, all of the queues must belong to the API `api_name`.
+        """
+        message_key_prefix = self._get_message_key(api_name, "")
+        if self.cluster and any(
+            redis_key_slot(queue_key) != redis_key_slot(message_key_prefix)
+            for queue_key in queue_keys
+        ):
+            # The dequeue script accesses message keys not given in KEYS, so they
+            # must be in the same hash slot as the queues
+            raise CrossSlotKeys(
+                f"Cannot dequeue from queues {queue_keys} as they are not all in the same hash "
+                f"slot as their message keys ({message_key_prefix}*)"
+            )
+        # There were no legacy calls in cluster mode, as it was not supported
+        legacy_expiry_key_prefix = "" if self.cluster else LEGACY_RPC_EXPIRY_KEY_PREFIX
+        args = [
+            self.batch_size,
+            self.batch_size * 10,
+            message_key_prefix,
+            legacy_expiry_key_prefix,
+        ]
+        for queue_key, message_id in popped:
+            args.extend([queue_key, message_id])
+        return await self._execute_script(redis, DEQUEUE_RPC_SCRIPT, keys=queue_keys, args=args)
+
+    async def get_backlog(self, api_names: Sequence[str]) -> Dict[str, Dict[str, Optional[int]]]:
+        """Get the number of RPC calls queued for each of the given APIs
+
+        Returns a dictionary keyed by API name. Each value is a dictionary containing:
+
+            * `pending` – Always `None`, as calls leave the queue once consumed
+            * `waiting` – Calls in the queue across all priorities. This may include
+              calls which have timed out but have not yet been discarded
+        """
+        queue_keys = [
+            self._get_queue_key(api_name, priority)
+            for api_name in api_names
+            for priority in range(0, self.priority_levels)
+        ]
+        lengths = {}
+        for group_keys in self._group_by_slot(queue_keys):
+            with await self.connection_manager(key=group_keys[0]) as redis:
+                pipeline = redis.pipeline()
+                for queue_key in group_keys:
+                    pipeline.llen(queue_key)
+                lengths.update(zip(group_keys, await pipeline.execute()))
+
+        backlog = {}
+        for api_name in api_names:
+            waiting = sum(
+                lengths[self._get_queue_key(api_name, priority)]
+                for priority in range(0, self.priority_levels)
+            )
+            backlog[api_name] = dict(pending=None, waiting=waiting)
+        return backlog
+
+    def _get_priority(self, rpc_message: RpcMessage, options: dict) -> int:
+        priority = options.get("priority", 0)
+        # Note that 1.0 and True would both be found within the range
+        is_int = isinstance(priority, int) and not isinstance(priority, bool)
+        if not is_int or priority not in range(0, self.priority_levels):
+            raise UnsupportedOptionValue(
+                f"Invalid priority {priority!r} for RPC {rpc_message.canonical_name}. Priority "
+                f"must be an integer from 0 to {self.priority_levels - 1}. You can increase the "
+                f"number of priorities available using the priority_levels transport option."
+            )
+        return priority
+
+    def _get_queue_key(self, api_name: str, priority: int) -> str:
+        if priority:
+            return f"{self._hash_tag(api_name)}:rpc_queue:{priority}"
+        else:
+            return f"{self._hash_tag(api_name)}:rpc_queue"
+
+    def _get_message_key(self, api_name: Optional[str], message_id: str) -> str:
+        # In cluster mode the message key must be in the same hash slot as its queue
+        if self.cluster:
+            return f"{self._hash_tag(api_name)}:rpc_message:{message_id}"
+        else:
+            return f"rpc_message:{message_id}"
+
+
+class RedisStreamRpcTransport(RedisTransportMixin, RpcTransport):
+    """ Redis RPC transport providing at-least-once delivery
+
+    This transport adds each RPC call to a per-API redis stream. All
+    RPC consumers for an API read from the stream as members of a single
+    consumer group, so each call is distributed to a single RPC consumer.
+
+    Calls are acknowledged once their results have been sent. Calls
+    which remain unacknowledged for `acknowledgement_timeout` seconds
+    (perhaps because the consumer died mid-call) will be reclaimed by
+    another consumer. This timeout must therefore be longer than any RPC
+    takes to execute, otherwise slow calls will be executed more than once.
+    It defaults to `rpc_timeout`, after which the caller will have given up
+    anyway. Set a shorter timeout to have calls from failed consumers
+    retried sooner.
+
+    Calls older than `rpc_timeout` are assumed to have timed out and are
+    discarded rather than processed. The age of a call is determined by its
+    stream ID, so consumer clocks should be reasonably in sync with Redis.
+    """
+
+    def __init__(
+        self,
+        *,
+        consumer_name: str,
+        consumer_group: str = "rpc_consumers",
+        redis_pool=None,
+        url=None,
+        serializer=ByFieldMessageSerializer(),
+        deserializer=ByFieldMessageDeserializer(RpcMessage),
+        connection_parameters: Mapping = frozendict(maxsize=100),
+        batch_size=10,
+        rpc_timeout=5,
+        acknowledgement_timeout: Optional[float] = None,
+        max_stream_length: Optional[int] = 100000,
+        consumption_restart_delay=5,
+        cluster: bool = False,
+    ):
+        self.set_redis_pool(redis_pool, url, connection_parameters, cluster)
+        self.consumer_name = consumer_name
+        self.consumer_group = consumer_group
+        self.serializer = serializer
+        self.deserializer = deserializer
+        self.batch_size = batch_size
+        self.rpc_timeout = rpc_timeout
+        # Reclaiming a call before it could have timed out risks executing it twice
+        if acknowledgement_timeout is None:
+            acknowledgement_timeout = rpc_timeout
+        self.acknowledgement_timeout = acknowledgement_timeout
+        self.max_stream_length = max_stream_length
+        self.consumption_restart_delay = consumption_restart_delay
+
+        # When lost calls were last reclaimed, keyed by the streams they were reclaimed from
+        self._last_reclaimed = {}
+        # Streams upon which we have created (or found) our consumer group
+        self._created_groups = set()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "Config",
+        consumer_name: str = None,
+        consumer_group: str = "rpc_consumers",
+        url: str = "redis://127.0.0.1:6379/0",
+        connection_parameters: Mapping = frozendict(maxsize=100),
+        batch_size: int = 10,
+        serializer: str = "lightbus.serializers.ByFieldMessageSerializer",
+        deserializer: str = "lightbus.serializers.ByFieldMessageDeserializer",
+        rpc_timeout: int = 5,
+        acknowledgement_timeout: Optional[float] = None,
+        max_stream_length: Optional[int] = 100000,
+        consumption_restart_delay: int = 5,
+        cluster: bool = False,
+    ):
+        serializer = import_from_string(serializer)()
+        deserializer = import_from_string(deserializer)(RpcMessage)
+        consumer_name = consumer_name or config.process_name
+
+        return cls(
+            consumer_name=consumer_name,
+            consumer_group=consumer_group,
+            url=url,
+            serializer=serializer,
+            deserializer=deserializer,
+            connection_parameters=connection_parameters,
+            batch_size=batch_size,
+            rpc_timeout=rpc_timeout,
+            acknowledgement_timeout=acknowledgement_timeout,
+            max_stream_length=max_stream_length,
+            consumption_restart_delay=consumption_restart_delay,
+            cluster=cluster,
+        )
+
+    async def call_rpc(self, rpc_message: RpcMessage, options: dict):
+        stream = self._get_stream_name(rpc_message.api_name)
+        logger.debug(
+            LBullets(
+                L("Enqueuing message {} in Redis stream {}", Bold(rpc_message), Bold(stream)),
+                items=dict(**rpc_message.get_metadata(), kwargs=rpc_message.get_kwargs()),
+            )
+        )
+
+        with await self.connection_manager(key=stream) as redis:
+            start_time = time.time()
+            message_id = await redis.xadd(
+                stream=stream,
+                fields=self.serializer(rpc_message),
+                max_len=self.max_stream_length or None,
+                exact_len=False,
+            )
+        # Store the stream ID in case we need to cancel the call
+        rpc_message.native_id = decode(message_id, "utf8")
+
+        logger.debug(
+            L(
+                "Enqueued message {} in Redis in {} stream {}",
+                Bold(rpc_message),
+                human_time(time.time() - start_time),
+                Bold(stream),
+            )
+        )
+
+    async def call_rpcs(self, rpc_messages: Sequence[RpcMessage], options: dict):
+        logger.debug(L("Enqueuing {} messages in Redis", Bold(len(rpc_messages))))
+
+        start_time = time.time()
+        # Add all the calls to their streams in a single round trip (per hash slot, in cluster mode)
+        for group in self._group_by_slot(
+            rpc_messages, key=lambda m: self._get_stream_name(m.api_name)
+        ):
+            with await self.connection_manager(
+                key=self._get_stream_name(group[0].api_name)
+            ) as redis:
+                pipeline = redis.pipeline()
+                for rpc_message in group:
+                    pipeline.xadd(
+                        stream=self._get_stream_name(rpc_message.api_name),
+                        fields=self.serializer(rpc_message),
+                        max_len=self.max_stream_length or None,
+                        exact_len=False,
+                    )
+                message_ids = await pipeline.execute()
+
+            for rpc_message, message_id in zip(group, message_ids):
+                rpc_message.native_id = decode(message_id, "utf8")
+
+        logger.debug(
+            L(
+                "Enqueued {} messages in Redis in {}",
+                Bold(len(rpc_messages)),
+                human_time(time.time() - start_time),
+            )
+        )
+
+    async def cancel(self, rpc_message: RpcMessage):
+        if not rpc_message.native_id:
+            # The call was never added to the stream
+            return
+
+        # Deleted calls will not be delivered to consumers
+        stream = self._get_stream_name(rpc_message.api_name)
+        with await self.connection_manager(key=stream) as redis:
+            await redis.execute(b"XDEL", stream, rpc_message.native_id)
+
+    async def consume_rpcs(self, apis: Sequence[Api]) -> Sequence[RpcMessage]:
+        while True:
+            try:
+                return await self._consume_rpcs(apis)
+            except ConnectionClosedError:
+                logger.warning(
+                    f"Redis connection lost while consuming RPCs, reconnecting "
+                    f"in {self.consumption_restart_delay} seconds..."
+                )
+                await asyncio.sleep(self.consumption_restart_delay)
+            except ReplyError as e:
+                if "NOGROUP" not in str(e):
+                    raise
+                # The stream or group has been deleted since we created it, so create it again
+                self._created_groups.clear()
+
+    async def _consume_rpcs(self, apis: Sequence[Api]) -> Sequence[RpcMessage]:
+        streams = [self._get_stream_name(api.meta.name) for api in apis]
+        reclaim_key = tuple(streams)
+
+        logger.debug(
+            LBullets(
+                L(
+                    "Consuming RPCs as consumer {} in group {} on streams",
+                    Bold(self.consumer_name),
+                    Bold(self.consumer_group),
+                ),
+                items=streams,
+            )
+        )
+
+        # In cluster mode, streams in different hash slots must be read from separately
+        stream_groups = self._group_by_slot(streams)
+        for group_streams in stream_groups:
+            new_streams = [s for s in group_streams if s not in self._created_groups]
+            if not new_streams:
+                continue
+            # The group starts at the beginning of the stream, so calls made before
+            # any consumer started are not missed. Old calls will be discarded as expired
+            with await self.connection_manager(key=new_streams[0]) as redis:
+                await self._create_consumer_groups(
+                    OrderedDict((stream, "0") for stream in new_streams),
+                    redis,
+                    self.consumer_group,
+                )
+            self._created_groups.update(new_streams)
+
+        while True:
+            last_reclaimed = self._last_reclaimed.get(reclaim_key, 0.0)
+            if time.time() - last_reclaimed > self.acknowledgement_timeout:
+                # Take over any calls which other consumers failed to complete
+                stream_messages = []
+                for group_streams in stream_groups:
+                    with await self.connection_manager(key=group_streams[0]) as redis:
+                        stream_messages.extend(
+                            await self._reclaim_lost_messages(redis, group_streams)
+                        )
+                self._last_reclaimed[reclaim_key] = time.time()
+                rpc_messages = await self._to_rpc_messages(stream_messages)
+                if rpc_messages:
+                    return rpc_messages
+
+            # Block until calls arrive, but wake up in time to reclaim lost calls
+            if len(stream_groups) == 1:
+                stream_messages = await self._read_new_messages(stream_groups[0])
+            else:
+                results = await self._read_first(
+                    {
+                        tuple(group_streams): functools.partial(
+                            self._read_new_messages, group_streams
+                        )
+                        for group_streams in stream_groups
+                    }
+                )
+                stream_messages = [m for messages in results.values() for m in messages]
+            rpc_messages = await self._to_rpc_messages(stream_messages)
+            if rpc_messages:
+                return rpc_messages
+
+    async def _read_new_messages(self, streams: Sequence[str]) -> List[Tuple]:
+        """Block until new calls arrive on the given streams, or the acknowledgement timeout"""
+        with await self.connection_manager(key=streams[0]) as redis:
+            stream_messages = await redis.xread_group(
+                group_name=self.consumer_group,
+                consumer_name=self.consumer_name,
+                streams=list(streams),
+                # Using ID '>' indicates we only want new messages which have not
+                # been passed to other consumers in this group
+                latest_ids=[">"] * len(streams),
+                timeout=int(self.acknowledgement_timeout * 1000),
+                count=self.batch_size,
+            )
+        return stream_messages or []
+
+    async def _reclaim_lost_messages(self, redis, streams: Sequence[str]) -> List[Tuple]:
+        """Claim calls which other consumers have failed to acknowledge in time
+
+        Returns a list of `(stream, message_id, fields)` tuples.
+        """
+        timeout = int(self.acknowledgement_timeout * 1000)
+        reclaimed = []
+        for stream in streams:
+            async for claimed_messages in self._claim_timed_out_messages(
+                redis, stream, self.consumer_group, timeout, batch_size=self.batch_size * 10
+            ):
+                for message_id, fields, *_ in claimed_messages:
+                    logger.info(
+                        L(
+                            "Reclaimed timed out RPC message {} on stream {}",
+                            Bold(decode(message_id, "utf8")),
+                            Bold(stream),
+                        )
+                    )
+                    reclaimed.append((stream, message_id, fields))
+        return reclaimed
+
+    async def _to_rpc_messages(self, stream_messages) -> List[RpcMessage]:
+        """Deserialize the given stream messages, discarding any which have expired"""
+        rpc_messages = []
+        discarded = []
+        expired_before = int((time.time() - self.rpc_timeout) * 1000)
+
+        for stream, message_id, fields in stream_messages:
             stream = decode(stream, "utf8")
-            rpc_message = self.deserializer(data)
-            expiry_key = f"rpc_expiry_key:{rpc_message.id}"
-            print("deleting " + expiry_key)
-            key_deleted = await redis.delete(expiry_key)
+            message_id = decode(message_id, "utf8")
 
-            if not key_deleted:
-                return []
+            is_noop = tuple(fields.items()) == ((b"", b""),)
+            if is_noop or int(message_id.split("-")[0]) < expired_before:
+                discarded.append((stream, message_id))
+                continue
 
+            rpc_message = self.deserializer(fields, native_id=message_id)
             logger.debug(
                 LBullets(
-                    L("⬅ Received RPC message on stream {}", Bold(stream)),
+                    L("⬅ Received RPC message {} on stream {}", Bold(message_id), Bold(stream)),
                     items=dict(**rpc_message.get_metadata(), kwargs=rpc_message.get_kwargs()),
                 )
             )
+            rpc_messages.append(rpc_message)
+
+        if discarded:
+            # Nobody is waiting for the results of these calls, so simply acknowledge them
+            for group in self._group_by_slot(discarded, key=lambda d: d[0]):
+                with await self.connection_manager(key=group[0][0]) as redis:
+                    p = redis.pipeline()
+                    for stream, message_id in group:
+                        p.xack(stream, self.consumer_group, message_id)
+                    await p.execute()
+            logger.debug(L("Discarded {} expired RPC messages", Bold(len(discarded))))
+
+        return rpc_messages
+
+    async def acknowledge(self, *rpc_messages: RpcMessage):
+        if not rpc_messages:
+            return
+
+        for group in self._group_by_slot(
+            rpc_messages, key=lambda m: self._get_stream_name(m.api_name)
+        ):
+            with await self.connection_manager(
+                key=self._get_stream_name(group[0].api_name)
+            ) as redis:
+                p = redis.pipeline()
+                for rpc_message in group:
+                    stream = self._get_stream_name(rpc_message.api_name)
+                    p.xack(stream, self.consumer_group, rpc_message.native_id)
+                await p.execute()
+
+    async def get_backlog(self, api_names: Sequence[str]) -> Dict[str, Dict[str, Optional[int]]]:
+        """Get the number of RPC calls outstanding for each of the given APIs
+
+        Returns a dictionary keyed by API name. Each value is a dictionary containing:
+
+            * `pending` – Calls delivered to a consumer but not yet acknowledged
+            * `waiting` – Calls not yet delivered to any consumer. This will be
+              `None` if Redis cannot report it (Redis 7 or above is required)
+        """
+        backlog = {}
+        for api_name in api_names:
+            stream = self._get_stream_name(api_name)
+            backlog[api_name] = dict(pending=0, waiting=0)
+            with await self.connection_manager(key=stream) as redis:
+                if not await redis.exists(stream):
+                    continue
 
-        return [rpc_message]
+                for group in await redis.execute(b"XINFO", b"GROUPS", stream):
+                    group = dict(zip(group[::2], group[1::2]))
+                    if decode(group[b"name"], "utf8") == self.consumer_group:
+                        backlog[api_name] = dict(
+                            pending=group[b"pending"], waiting=group.get(b"lag")
+                        )
+                        break
+                else:
+                    # No consumers have yet started, so every call is waiting
+                    backlog[api_name]["waiting"] = await redis.xlen(stream)
+        return backlog
+
+    def _get_stream_name(self, api_name: str) -> str:
+        return f"{self._hash_tag(api_name)}:rpc_stream"
 
 
 class RedisResultTransport(RedisTransportMixin, ResultTransport):
@@ -285,13 +1329,16 @@ class RedisResultTransport(RedisTransportMixin, ResultTransport):
         connection_parameters: Mapping = frozendict(maxsize=100),
         result_ttl=60,
         rpc_timeout=5,
+        result_mode: ResultMode = ResultMode.PER_CALL,
+        cluster: bool = False,
     ):
         # NOTE: We use the blob message_serializer here, as the results come back as values in a list
-        self.set_redis_pool(redis_pool, url, connection_parameters)
+        self.set_redis_pool(redis_pool, url, connection_parameters, cluster)
         self.serializer = serializer
         self.deserializer = deserializer
         self.result_ttl = result_ttl
         self.rpc_timeout = rpc_timeout
+        self.result_mode = result_mode
 
     @classmethod
     def from_config(
@@ -303,9 +1350,13 @@ class RedisResultTransport(RedisTransportMixin, ResultTransport):
         connection_parameters: Mapping = frozendict(maxsize=100),
         result_ttl=60,
         rpc_timeout=5,
+        result_mode: ResultMode = ResultMode.PER_CALL,
+        cluster: bool = False,
     ):
         serializer = import_from_string(serializer)()
         deserializer = import_from_string(deserializer)(ResultMessage)
+        if isinstance(result_mode, str):
+            result_mode = ResultMode[result_mode.upper()]
 
         return cls(
             url=url,
@@ -314,12 +1365,20 @@ class RedisResultTransport(RedisTransportMixin, ResultTransport):
             connection_parameters=connection_parameters,
             result_ttl=result_ttl,
             rpc_timeout=rpc_timeout,
+            result_mode=result_mode,
+            cluster=cluster,
         )
 
+    async def open(self):
+        await self._load_scripts(SEND_RESULTS_SCRIPT)
+
     def get_return_path(self, rpc_message: RpcMessage) -> str:
-        return "redis+key://{}.{}:result:{}".format(
-            rpc_message.api_name, rpc_message.procedure_name, rpc_message.id
-        )
+        if self.result_mode == ResultMode.PER_PROCESS:
+            return "redis+key://{}".format(self._get_reply_key())
+        else:
+            return "redis+key://{}.{}:result:{}".format(
+                rpc_message.api_name, rpc_message.procedure_name, rpc_message.id
+            )
 
     async def send_result(
         self, rpc_message: RpcMessage, result_message: ResultMessage, return_path: str
@@ -331,39 +1390,71 @@ class RedisResultTransport(RedisTransportMixin, ResultTransport):
                 Bold(return_path),
             )
         )
-        redis_key = self._parse_return_path(return_path)
+        await self.send_results([(rpc_message, result_message, return_path)])
 
-        with await self.connection_manager() as redis:
-            start_time = time.time()
-            p = redis.pipeline()
-            p.lpush(redis_key, self.serializer(result_message))
-            p.expire(redis_key, timeout=self.result_ttl)
-            await p.execute()
+    async def send_results(self, results: Sequence[Tuple[RpcMessage, ResultMessage, str]]):
+        """Send several results back to their callers using a single script call
+
+        Results for calls which have been abandoned by the caller will not be sent.
+        """
+        if not results:
+            return
+
+        start_time = time.time()
+        sent = 0
+        # In cluster mode the script is run once for each hash slot
+        for group in self._group_by_slot(results, key=lambda r: self._parse_return_path(r[2])):
+            keys = []
+            args = [self.result_ttl]
+            for rpc_message, result_message, return_path in group:
+                keys.append(self._parse_return_path(return_path))
+                keys.append(self._get_abandoned_key(rpc_message, return_path))
+                args.append(self.serializer(result_message))
+
+            with await self.connection_manager(key=keys[0]) as redis:
+                sent += await self._execute_script(redis, SEND_RESULTS_SCRIPT, keys=keys, args=args)
 
         logger.debug(
             L(
-                "➡ Sent result {} into Redis in {} using return path {}",
-                Bold(result_message),
+                "➡ Sent {} results into Redis in {}. {} abandoned results were not sent.",
+                Bold(sent),
                 human_time(time.time() - start_time),
-                Bold(return_path),
+                Bold(len(results) - sent),
             )
         )
 
+    async def abandon(self, rpc_message: RpcMessage, return_path: str):
+        redis_key = self._parse_return_path(return_path)
+        with await self.connection_manager(key=redis_key) as redis:
+            p = redis.pipeline()
+            # Mark the call as abandoned so the server doesn't send its result
+            p.set(self._get_abandoned_key(rpc_message, return_path), 1, expire=self.result_ttl)
+            if self.result_mode == ResultMode.PER_CALL:
+                # The result may have already arrived
+                p.delete(redis_key)
+            await p.execute()
+
     async def receive_result(
         self, rpc_message: RpcMessage, return_path: str, options: dict
     ) -> ResultMessage:
         logger.debug(L("Awaiting Redis result for RPC message: {}", Bold(rpc_message)))
+        if self.result_mode == ResultMode.PER_PROCESS:
+            return await self._receive_result_per_process(rpc_message)
+
         redis_key = self._parse_return_path(return_path)
 
-        with await self.connection_manager() as redis:
-            start_time = time.time()
-            result = None
-            while not result:
-                # Sometimes blpop() will return None in the case of timeout or
-                # cancellation. We therefore perform this step with a loop to catch
-                # this. A more elegant solution is welcome.
-                result = await redis.blpop(redis_key, timeout=self.rpc_timeout)
-            _, serialized = result
+        # Results wait in Redis until we are ready for them, so a call
+        # which cannot start waiting immediately will not miss its result
+        start_time = time.time()
+        async with self._get_result_waits():
+            with await self.connection_manager(key=redis_key) as redis:
+                result = None
+                while not result:
+                    # Sometimes blpop() will return None in the case of timeout or
+                    # cancellation. We therefore perform this step with a loop to catch
+                    # this. A more elegant solution is welcome.
+                    result = await redis.blpop(redis_key, timeout=self.rpc_timeout)
+                _, serialized = result
 
         result_message = self.deserializer(serialized)
 
@@ -378,11 +1469,172 @@ class RedisResultTransport(RedisTransportMixin, ResultTransport):
 
         return result_message
 
+    async def _receive_result_per_process(self, rpc_message: RpcMessage) -> ResultMessage:
+        """Wait for the reply reader to receive the result for the given RPC message"""
+        start_time = time.time()
+        try:
+            result_message = self._get_early_results().pop(rpc_message.id)
+            if result_message is None:
+                result_message = await self._wait_for_reply(rpc_message)
+        finally:
+            # Any further results for this call (such as duplicates, or results
+            # arriving after a timeout) can now be discarded
+            self._get_finished_calls().set(rpc_message.id, True)
+
+        logger.debug(
+            L(
+                "⬅ Received Redis result in {} for RPC message {}: {}",
+                human_time(time.time() - start_time),
+                rpc_message,
+                Bold(result_message.result),
+            )
+        )
+        return result_message
+
+    async def _wait_for_reply(self, rpc_message: RpcMessage) -> ResultMessage:
+        """Wait for the reply reader to receive the result, starting the reader if needed"""
+        reply_futures = self._get_reply_futures()
+        future = reply_futures[rpc_message.id] = asyncio.Future()
+
+        if not getattr(self._local, "reply_reader", None):
+            self._local.reply_reader = asyncio.ensure_future(self._read_replies())
+            self._local.reply_reader.add_done_callback(self._handle_reply_reader_done)
+
+        try:
+            return await future
+        finally:
+            # Ensure we don't keep hold of futures for calls which have timed out
+            reply_futures.pop(rpc_message.id, None)
+
+    async def _read_replies(self):
+        """Read results from this process' reply key and dispatch them to the waiting callers
+
+        A single connection is used to receive the results of all RPCs made by this process.
+        """
+        reply_key = self._get_reply_key()
+        reply_futures = self._get_reply_futures()
+        early_results = self._get_early_results()
+        finished_calls = self._get_finished_calls()
+
+        with await self.connection_manager(key=reply_key) as redis:
+            while True:
+                result = await redis.blpop(reply_key, timeout=self.rpc_timeout)
+                if not result:
+                    continue
+                _, serialized = result
+
+                result_message = self.deserializer(serialized)
+                rpc_message_id = result_message.rpc_message_id
+                future = reply_futures.get(rpc_message_id)
+                if future is not None and not future.done():
+                    future.set_result(result_message)
+                elif future is not None or finished_calls.get(rpc_message_id):
+                    # A duplicate result, or the caller stopped waiting (most
+                    # likely because the call timed out) before it arrived
+                    logger.debug(
+                        L(
+                            "Discarding result for RPC message {} as nothing is waiting for it",
+                            Bold(rpc_message_id),
+                        )
+                    )
+                else:
+                    # The caller may not have started waiting for the result yet, so keep
+                    # it for them. Results which are never collected will expire
+                    early_results.set(rpc_message_id, result_message)
+
+    def _handle_reply_reader_done(self, reply_reader: asyncio.Task):
+        """The reply reader has stopped, so fail any calls still waiting for results"""
+        self._local.reply_reader = None
+        if reply_reader.cancelled():
+            exception = LightbusShutdownInProgress(
+                "Reading of RPC results was stopped before a result was received"
+            )
+        else:
+            exception = reply_reader.exception()
+
+        for future in self._get_reply_futures().values():
+            if not future.done():
+                future.set_exception(exception)
+
+    def _get_reply_key(self) -> str:
+        """Get the key upon which this process receives the results of its RPC calls"""
+        if not hasattr(self._local, "reply_key"):
+            self._local.reply_key = "result_queue:{}".format(uuid.uuid4().hex)
+        return self._local.reply_key
+
+    def _get_reply_futures(self) -> Dict[str, asyncio.Future]:
+        """Get the futures awaiting results, keyed by RPC message ID"""
+        if not hasattr(self._local, "reply_futures"):
+            self._local.reply_futures = {}
+        return self._local.reply_futures
+
+    def _get_early_results(self) -> TtlLruCache:
+        """Get the results received before their caller started waiting, keyed by RPC message ID"""
+        if not hasattr(self._local, "early_results"):
+            self._local.early_results = TtlLruCache(
+                max_size=EARLY_RESULTS_MAX_SIZE, ttl=self.rpc_timeout
+            )
+        return self._local.early_results
+
+    def _get_result_waits(self) -> asyncio.Semaphore:
+        """Get the semaphore limiting how many per-call results are awaited at once
+
+        Each wait holds a pooled connection for its BLPOP, so without a limit a large
+        batch of calls (see `call_rpc_many()`) would exhaust the pool, leaving no
+        connections with which to make the calls themselves.
+        """
+        if not hasattr(self._local, "result_waits"):
+            if self.connection_parameters is not None:
+                pool_size = self.connection_parameters.get("maxsize", 10)
+            elif hasattr(self._local, "redis_pool"):
+                pool_size = self._local.redis_pool._pool_or_conn.maxsize
+            else:
+                # connection_manager() will explain why there is no pool
+                pool_size = 10
+            self._local.result_waits = asyncio.Semaphore(max(pool_size // 2, 1))
+        return self._local.result_waits
+
+    def _get_finished_calls(self) -> TtlLruCache:
+        """Get the IDs of RPC messages whose callers are no longer waiting for a result"""
+        if not hasattr(self._local, "finished_calls"):
+            self._local.finished_calls = TtlLruCache(
+                max_size=EARLY_RESULTS_MAX_SIZE, ttl=self.rpc_timeout
+            )
+        return self._local.finished_calls
+
+    async def close(self):
+        reply_reader = getattr(self._local, "reply_reader", None)
+        if reply_reader:
+            await cancel(reply_reader)
+        await super().close()
+
+    def _get_abandoned_key(self, rpc_message: RpcMessage, return_path: str) -> str:
+        if self.cluster:
+            # Tag the key with the result key, so the send results
+            # script can access both within the same hash slot
+            result_key = self._parse_return_path(return_path)
+            return f"{self._hash_tag(result_key)}:rpc_abandoned:{rpc_message.id}"
+        else:
+            return f"rpc_abandoned:{rpc_message.id}"
+
     def _parse_return_path(self, return_path: str) -> str:
         assert return_path.startswith("redis+key://")
         return return_path[12:]
 
 
+class RedisShard(RedisTransportMixin):
+    """One of the Redis instances which event streams are sharded across
+
+    Each shard has its own connection pool.
+    """
+
+    def __init__(
+        self, url: str, connection_parameters: Mapping = frozendict(), cluster: bool = False
+    ):
+        self.url = url
+        self.set_redis_pool(None, url, connection_parameters, cluster)
+
+
 class RedisEventTransport(RedisTransportMixin, EventTransport):
 
     def __init__(
@@ -397,26 +1649,97 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
         connection_parameters: Mapping = frozendict(maxsize=100),
         batch_size=10,
         reclaim_batch_size: int = None,
+        reclaim_interval: float = None,
+        prefetch: int = 10,
+        max_in_flight: int = 20,
         acknowledgement_timeout: float = 60,
+        acknowledgement_batch_size: int = 100,
+        acknowledgement_linger: float = 0.05,
+        max_deliveries: Optional[int] = None,
+        publish_linger: float = 0,
+        publish_max_batch: int = 100,
         max_stream_length: Optional[int] = 100000,
+        max_stream_age: Optional[float] = None,
+        hard_max_stream_length: Optional[int] = 1000000,
+        abandoned_group_timeout: Optional[float] = 86400,
+        retention_interval: float = 60,
+        replay_segments: int = 0,
+        shard_urls: Sequence[str] = (),
+        shard_mapping: Mapping[str, str] = frozendict(),
         stream_use: StreamUse = StreamUse.PER_API,
         consumption_restart_delay: int = 5,
+        cluster: bool = False,
     ):
-        self.set_redis_pool(redis_pool, url, connection_parameters)
+        self.set_redis_pool(redis_pool, url, connection_parameters, cluster)
         self.serializer = serializer
         self.deserializer = deserializer
         self.batch_size = batch_size
         self.reclaim_batch_size = reclaim_batch_size if reclaim_batch_size else batch_size * 10
+        self.reclaim_interval = reclaim_interval or acknowledgement_timeout
+        self.prefetch = prefetch
+        self.max_in_flight = max_in_flight
         self.consumer_group_prefix = consumer_group_prefix
         self.consumer_name = consumer_name
         self.acknowledgement_timeout = acknowledgement_timeout
+        self.acknowledgement_batch_size = acknowledgement_batch_size
+        self.acknowledgement_linger = acknowledgement_linger
+        self.max_deliveries = max_deliveries
+        self.publish_linger = publish_linger
+        self.publish_max_batch = publish_max_batch
         self.max_stream_length = max_stream_length
+        self.max_stream_age = max_stream_age
+        self.hard_max_stream_length = hard_max_stream_length
+        self.abandoned_group_timeout = abandoned_group_timeout
+        self.retention_interval = retention_interval
+        self.replay_segments = replay_segments
+        self.shard_urls = list(shard_urls)
+        self.shard_mapping = dict(shard_mapping)
         self.stream_use = stream_use
         self.consumption_restart_delay = consumption_restart_delay
 
         self._task = None
         self._reload = False
 
+        # Message IDs awaiting acknowledgement, keyed by (stream, consumer group)
+        self._ack_buffer = defaultdict(list)
+        self._ack_buffer_size = 0
+        self._ack_flush_task = None
+        # Events awaiting publishing, as (message, future) pairs
+        self._publish_buffer = []
+        self._publish_timer = None
+        self._publish_tasks = set()
+        # Messages which have been consumed but not yet acknowledged. Values
+        # are (stream, consumer group, in-flight semaphore)
+        self._in_flight = {}
+        # Replayed messages (which are not tracked by their consumer group), and the
+        # futures to resolve once they are acknowledged
+        self._replay_acks = {}
+        # The number of messages reclaimed from other consumers since startup
+        self.total_reclaimed_messages = 0
+        # The number of messages moved to dead letter streams since startup
+        self.total_dead_lettered_messages = 0
+        # The IDs of messages received from each (stream, consumer group) which have yet to be
+        # acknowledged. Other messages pending for this consumer may be reclaimed
+        self._in_progress = defaultdict(set)
+        # Streams we have published to, and which are therefore trimmed by the retention task
+        self._published_streams = set()
+        self._retention_task = None
+        # Whether Redis supports trimming streams by ID (Redis 6.2 and above). Checked upon open
+        self._supports_min_id_trimming = None
+
+        # When sharding, each API's streams are placed upon one of the shards, either as
+        # given by shard_mapping or by consistent hashing of the API name
+        unknown_urls = set(self.shard_mapping.values()) - set(self.shard_urls)
+        if unknown_urls:
+            raise UnsupportedOptionValue(
+                f"The shard_mapping option refers to Redis URLs which are not listed in "
+                f"shard_urls: {', '.join(sorted(unknown_urls))}"
+            )
+        self._shards = OrderedDict(
+            (url, RedisShard(url, connection_parameters, cluster)) for url in self.shard_urls
+        )
+        self._hash_ring = ConsistentHashRing(self.shard_urls)
+
     @classmethod
     def from_config(
         cls,
@@ -427,12 +1750,28 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
         connection_parameters: Mapping = frozendict(maxsize=100),
         batch_size: int = 10,
         reclaim_batch_size: int = None,
+        reclaim_interval: float = None,
+        prefetch: int = 10,
+        max_in_flight: int = 20,
         serializer: str = "lightbus.serializers.ByFieldMessageSerializer",
         deserializer: str = "lightbus.serializers.ByFieldMessageDeserializer",
         acknowledgement_timeout: float = 60,
+        acknowledgement_batch_size: int = 100,
+        acknowledgement_linger: float = 0.05,
+        max_deliveries: Optional[int] = None,
+        publish_linger: float = 0,
+        publish_max_batch: int = 100,
         max_stream_length: Optional[int] = 100000,
+        max_stream_age: Optional[float] = None,
+        hard_max_stream_length: Optional[int] = 1000000,
+        abandoned_group_timeout: Optional[float] = 86400,
+        retention_interval: float = 60,
+        replay_segments: int = 0,
+        shard_urls: Sequence[str] = (),
+        shard_mapping: Mapping[str, str] = frozendict(),
         stream_use: StreamUse = StreamUse.PER_API,
         consumption_restart_delay: int = 5,
+        cluster: bool = False,
     ):
         serializer = import_from_string(serializer)()
         deserializer = import_from_string(deserializer)(EventMessage)
@@ -449,16 +1788,87 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
             connection_parameters=connection_parameters,
             batch_size=batch_size,
             reclaim_batch_size=reclaim_batch_size,
+            reclaim_interval=reclaim_interval,
+            prefetch=prefetch,
+            max_in_flight=max_in_flight,
             serializer=serializer,
             deserializer=deserializer,
             acknowledgement_timeout=acknowledgement_timeout,
+            acknowledgement_batch_size=acknowledgement_batch_size,
+            acknowledgement_linger=acknowledgement_linger,
+            max_deliveries=max_deliveries,
+            publish_linger=publish_linger,
+            publish_max_batch=publish_max_batch,
             max_stream_length=max_stream_length,
+            max_stream_age=max_stream_age,
+            hard_max_stream_length=hard_max_stream_length,
+            abandoned_group_timeout=abandoned_group_timeout,
+            retention_interval=retention_interval,
+            replay_segments=replay_segments,
+            shard_urls=shard_urls,
+            shard_mapping=shard_mapping,
             stream_use=stream_use,
             consumption_restart_delay=consumption_restart_delay,
+            cluster=cluster,
         )
 
+    async def open(self):
+        await self._check_min_id_trimming()
+
+    async def _check_min_id_trimming(self) -> bool:
+        """Check whether every Redis server we publish to can trim streams by ID
+
+        If not, streams are instead trimmed to approximately `max_stream_length`
+        events, as XTRIM's MINID option requires Redis 6.2 or above.
+        """
+        if self._supports_min_id_trimming is None:
+            supported = True
+            for shard in list(self._shards.values()) or [self]:
+                with await shard.connection_manager() as redis:
+                    version = (await redis.info("server"))["server"]["redis_version"]
+                if tuple(map(int, version.split(".")[:2])) < (6, 2):
+                    supported = False
+
+            if not supported and self.retention_interval:
+                logger.warning(
+                    "Redis 6.2 or above is required to trim event streams without removing "
+                    "events which have yet to be processed. Streams will instead be trimmed to "
+                    f"approximately max_stream_length ({self.max_stream_length}) events, and "
+                    "max_stream_age will be ignored."
+                )
+            self._supports_min_id_trimming = supported
+        return self._supports_min_id_trimming
+
+    async def _get_publish_max_len(self) -> Optional[int]:
+        """Get the approximate MAXLEN to publish events with
+
+        If streams cannot be trimmed by ID then this is `max_stream_length`. Otherwise it
+        is `hard_max_stream_length`, which caps streams which the retention task does
+        not trim (such as those only written to by short-lived processes).
+        """
+        if self.retention_interval and not await self._check_min_id_trimming():
+            return self.max_stream_length or None
+        return self.hard_max_stream_length or None
+
     async def send_event(self, event_message: EventMessage, options: dict):
-        """Publish an event"""
+        """Publish an event
+
+        If `publish_linger` is set then the event will be buffered and published
+        along with any other events sent within `publish_linger` seconds (up to
+        `publish_max_batch` events). This will return once the event has been published.
+        """
+        if self.publish_linger:
+            future = asyncio.Future()
+            self._publish_buffer.append((event_message, future))
+            if len(self._publish_buffer) >= self.publish_max_batch:
+                self._publish_buffered()
+            elif not self._publish_timer:
+                self._publish_timer = asyncio.get_event_loop().call_later(
+                    self.publish_linger, self._publish_buffered
+                )
+            await future
+            return
+
         stream = self._get_stream_names(
             listen_for=[(event_message.api_name, event_message.event_name)]
         )[0]
@@ -476,21 +1886,108 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
 
         # Performance: I suspect getting a connection from the connection manager each time is causing
         # performance issues. Need to confirm.
-        with await self.connection_manager() as redis:
+        max_len = await self._get_publish_max_len()
+        with await self._stream_connection(stream) as redis:
             start_time = time.time()
             await redis.xadd(
                 stream=stream,
                 fields=self.serializer(event_message),
-                max_len=self.max_stream_length or None,
+                max_len=max_len,
                 exact_len=False,
             )
+        self._start_retention(stream)
 
         logger.debug(
             L(
                 "Enqueued event message {} in Redis in {} stream {}",
                 Bold(event_message),
                 human_time(time.time() - start_time),
-                Bold(stream),
+                Bold(stream),
+            )
+        )
+
+    def _publish_buffered(self):
+        """Start publishing all buffered events as a single batch"""
+        if self._publish_timer:
+            self._publish_timer.cancel()
+            self._publish_timer = None
+
+        batch = self._publish_buffer
+        self._publish_buffer = []
+        if batch:
+            task = asyncio.ensure_future(self._publish_batch(batch))
+            self._publish_tasks.add(task)
+            task.add_done_callback(self._publish_tasks.discard)
+
+    async def _publish_batch(self, batch: List[Tuple[EventMessage, asyncio.Future]]):
+        try:
+            await self.send_events([event_message for event_message, _ in batch], options={})
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+    async def send_events(self, event_messages: Sequence[EventMessage], options: dict):
+        """Publish many events in a single round trip
+
+        If the `atomic` option is set then the events will be written in a single
+        transaction, so either all or none of the events will be published. When
+        sharding, this is only possible if all the events' streams are on the same shard.
+        """
+        options = options or {}
+        logger.debug(L("Enqueuing {} event messages in Redis", Bold(len(event_messages))))
+
+        # Events are written with one round trip per shard (and per hash slot, in cluster mode)
+        by_shard = OrderedDict()
+        for event_message in event_messages:
+            stream = self._get_stream_names(
+                listen_for=[(event_message.api_name, event_message.event_name)]
+            )[0]
+            shard = self._get_shard(event_message.api_name)
+            slot = redis_key_slot(stream) if self.cluster else None
+            by_shard.setdefault((shard, slot), []).append((stream, event_message))
+
+        if options.get("atomic") and len(by_shard) > 1:
+            raise UnsupportedOptionValue(
+                "Events cannot be sent atomically as their streams are on different Redis shards "
+                "or cluster hash slots"
+            )
+
+        max_len = await self._get_publish_max_len()
+
+        async def send_to_shard(shard, messages):
+            with await shard.connection_manager(key=messages[0][0]) as redis:
+                if options.get("atomic"):
+                    pipeline = redis.multi_exec()
+                else:
+                    pipeline = redis.pipeline()
+                for stream, event_message in messages:
+                    pipeline.xadd(
+                        stream=stream,
+                        fields=self.serializer(event_message),
+                        max_len=max_len,
+                        exact_len=False,
+                    )
+                await pipeline.execute()
+
+        start_time = time.time()
+        await asyncio.gather(
+            *[send_to_shard(shard, messages) for (shard, _), messages in by_shard.items()]
+        )
+
+        streams = {stream for messages in by_shard.values() for stream, _ in messages}
+        for stream in streams:
+            self._start_retention(stream)
+
+        logger.debug(
+            L(
+                "Enqueued {} event messages in Redis in {}",
+                Bold(len(event_messages)),
+                human_time(time.time() - start_time),
             )
         )
 
@@ -500,7 +1997,22 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
         consumer_group: str = None,
         since: Union[Since, Sequence[Since]] = "$",
         forever=True,
+        prefetch: int = None,
+        max_in_flight: int = None,
+        replay_segments: int = None,
     ) -> Generator[EventMessage, None, None]:
+        """Consume events for the given APIs
+
+        Up to `prefetch` messages will be fetched ahead of time, and up to
+        `max_in_flight` messages will be yielded before any are acknowledged.
+
+        If `replay_segments` is set and the consumer group does not yet exist, then
+        events since `since` will be replayed by reading that many segments of the
+        stream concurrently (see _replay()). Consumption of new events begins once the
+        replay is complete.
+
+        These all default to the values given to the transport's constructor.
+        """
         self._sanity_check_listen_for(listen_for)
 
         if self.consumer_group_prefix:
@@ -527,18 +2039,43 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
         )
 
         # Here we use a queue to combine messages coming from both the
-        # fetch messages loop and the reclaim messages loop.
-        queue = asyncio.Queue(maxsize=1)
-
-        async def consume_loop():
+        # fetch messages loop and the reclaim messages loop. Messages are fetched
+        # into the queue ahead of time, so fetching & decoding messages can happen
+        # while the caller is still processing earlier messages.
+        queue = asyncio.Queue(maxsize=prefetch or self.prefetch)
+        # Limits the number of messages which have been fetched but not yet acknowledged
+        in_flight = asyncio.Semaphore(max_in_flight or self.max_in_flight)
+        if replay_segments is None:
+            replay_segments = self.replay_segments
+
+        async def enqueue(message, stream):
+            await in_flight.acquire()
+            self._in_flight[message] = (stream, consumer_group, in_flight)
+            await queue.put(message)
+
+        async def enqueue_replayed(message, stream) -> asyncio.Future:
+            acknowledged = asyncio.Future()
+            self._replay_acks[message] = acknowledged
+            await enqueue(message, stream)
+            return acknowledged
+
+        async def consume_loop(shard_streams):
+            replaying = bool(replay_segments)
             while True:
                 try:
+                    if replaying:
+                        await self._replay(
+                            shard_streams,
+                            consumer_group,
+                            expected_events,
+                            replay_segments,
+                            enqueue_replayed,
+                        )
+                        replaying = False
                     async for message, stream in self._fetch_new_messages(
-                        streams, consumer_group, expected_events, forever
+                        shard_streams, consumer_group, expected_events, forever
                     ):
-                        await queue.put((message, stream))
-                        # Wait for the queue to empty before getting trying to get another message
-                        await queue.join()
+                        await enqueue(message, stream)
                 except ConnectionClosedError:
                     logger.warning(
                         f"Redis connection lost while consuming events, reconnecting "
@@ -547,36 +2084,322 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
                     await asyncio.sleep(self.consumption_restart_delay)
 
         async def reclaim_loop():
-            await asyncio.sleep(self.acknowledgement_timeout)
-            async for message, stream in self._reclaim_lost_messages(
-                stream_names, consumer_group, expected_events
-            ):
-                await queue.put((message, stream))
-                # Wait for the queue to empty before getting trying to get another message
-                await queue.join()
+            # Periodically check for messages which other consumers have failed to process
+            while True:
+                await asyncio.sleep(self.reclaim_interval)
+                try:
+                    async for message, stream in self._reclaim_lost_messages(
+                        stream_names, consumer_group, expected_events
+                    ):
+                        await enqueue(message, stream)
+                except ConnectionClosedError:
+                    logger.warning(
+                        f"Redis connection lost while reclaiming events, will retry "
+                        f"in {self.reclaim_interval} seconds..."
+                    )
 
-        # Make sure we surface any exceptions that occur in either task
-        fetch_task = asyncio.ensure_future(consume_loop())
+        # Each shard (and each hash slot, in cluster mode) is read from separately, as
+        # XREADGROUP cannot span Redis instances.
+        # Make sure we surface any exceptions that occur in any of the tasks
+        fetch_tasks = [
+            asyncio.ensure_future(consume_loop(shard_streams))
+            for shard_streams in self._group_by_shard(streams).values()
+        ]
         reclaim_task = asyncio.ensure_future(reclaim_loop())
 
-        fetch_task.add_done_callback(check_for_exception)
+        for fetch_task in fetch_tasks:
+            fetch_task.add_done_callback(check_for_exception)
         reclaim_task.add_done_callback(check_for_exception)
 
         try:
             while True:
                 try:
-                    message, stream = await queue.get()
-                    yield message
-                    await self._ack(stream, consumer_group, message.native_id)
-                    queue.task_done()
-                    yield True
+                    yield await queue.get()
                 except GeneratorExit:
                     return
         finally:
-            await cancel(fetch_task, reclaim_task)
+            await cancel(*fetch_tasks, reclaim_task)
+            # Forget any messages which were never acknowledged. They
+            # will be redelivered once the acknowledgement timeout expires
+            for message, (*_, semaphore) in list(self._in_flight.items()):
+                if semaphore is in_flight:
+                    del self._in_flight[message]
+                    self._replay_acks.pop(message, None)
+            await self._flush_acks()
+            # Any messages we were still processing can now be reclaimed
+            for stream in streams:
+                self._in_progress.pop((stream, consumer_group), None)
+
+    async def _replay(self, streams, consumer_group, expected_events, segments, enqueue):
+        """Replay past events for a new consumer group
+
+        The consumer group is created at the current end of each stream. The events
+        between `since` and that point are then split into segments by time, and the
+        segments are read concurrently. The progress of each segment is checkpointed in
+        Redis, so an interrupted replay will resume where it left off. Other processes
+        in the same consumer group will share the work of replaying the segments.
+
+        Returns once all segments have been replayed. Note that events from
+        different segments will be interleaved, so ordering is not preserved.
+        """
+        for stream, since in streams.items():
+            with await self._stream_connection(stream) as redis:
+                await self._plan_replay(redis, stream, since, consumer_group, segments)
+
+        while True:
+            remaining = []
+            for stream in streams:
+                with await self._stream_connection(stream) as redis:
+                    segment_keys = await redis.hkeys(self._replay_key(stream, consumer_group))
+                remaining.extend((stream, decode(segment, "utf8")) for segment in segment_keys)
+            if not remaining:
+                return
+
+            tasks = [
+                asyncio.ensure_future(
+                    self._replay_segment(stream, segment, consumer_group, expected_events, enqueue)
+                )
+                for stream, segment in remaining
+            ]
+            try:
+                replayed = await asyncio.gather(*tasks)
+            finally:
+                await cancel(*tasks)
+
+            if not all(replayed):
+                # Some segments are being replayed by other processes. Wait, and then
+                # check they have not been abandoned
+                await asyncio.sleep(self.reclaim_interval)
+
+    async def _plan_replay(self, redis, stream, since, consumer_group, segments):
+        """Create the consumer group, and store the segments of the stream to be replayed"""
+        if since == "$":
+            return
+
+        if not await redis.exists(stream):
+            await redis.xadd(stream, fields={"": ""})
+        first_id = (await redis.xrange(stream, count=1))[0][0]
+        last_id = (await redis.xrevrange(stream, count=1))[0][0]
+
+        try:
+            # Live consumption will start after the last event in the stream
+            await redis.xgroup_create(stream, consumer_group, latest_id=last_id)
+        except ReplyError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+            # The group already exists, so any replay has already been planned
+            return
+
+        # Split the range by time, ignoring any time before the first event in the stream
+        start_ms = max(parse_redis_stream_id(since)[0], parse_redis_stream_id(first_id)[0])
+        end_ms, _ = parse_redis_stream_id(last_id)
+        width = (end_ms - start_ms) // segments + 1
+        pipeline = redis.pipeline()
+        for n in range(0, segments):
+            segment_start_ms = start_ms + n * width
+            if segment_start_ms > end_ms:
+                break
+            # Incomplete IDs are accepted by XRANGE, as the first & last IDs in that millisecond
+            segment_start = redis_stream_id_add_one(since) if n == 0 else str(segment_start_ms)
+            segment_end_ms = segment_start_ms + width - 1
+            segment_end = (
+                str(segment_end_ms) if segment_end_ms < end_ms else decode(last_id, "utf8")
+            )
+            pipeline.hset(
+                self._replay_key(stream, consumer_group),
+                str(n),
+                json.dumps([segment_start, segment_end]),
+            )
+        await pipeline.execute()
+
+    async def _replay_segment(
+        self, stream, segment, consumer_group, expected_events, enqueue
+    ) -> bool:
+        """Replay a single segment of a stream
+
+        Returns False if another process is already replaying the segment
+        """
+        replay_key = self._replay_key(stream, consumer_group)
+        lock_key = f"{replay_key}:lock:{segment}"
+        lock_timeout = int(self.acknowledgement_timeout * 1000)
+
+        with await self._stream_connection(stream) as redis:
+            locked = await redis.set(
+                lock_key, self.consumer_name, pexpire=lock_timeout, exist=redis.SET_IF_NOT_EXIST
+            )
+            # We may have been replaying this segment before we were restarted
+            if not locked and decode(await redis.get(lock_key), "utf8") != self.consumer_name:
+                return False
+
+        try:
+            while True:
+                with await self._stream_connection(stream) as redis:
+                    checkpoint = await redis.hget(replay_key, segment)
+                    if not checkpoint:
+                        return True
+                    start, end = json.loads(checkpoint)
+                    page = await redis.xrange(stream, start=start, stop=end, count=self.batch_size)
+
+                acknowledged = []
+                for message_id, fields in page:
+                    message_id = decode(message_id, "utf8")
+                    event_message = self._fields_to_message(
+                        fields, expected_events, native_id=message_id, consumer_group=consumer_group
+                    )
+                    if event_message:
+                        acknowledged.append(await enqueue(event_message, stream))
+
+                # Only move the checkpoint on once the whole page has been processed
+                if acknowledged:
+                    await asyncio.wait(acknowledged)
+
+                with await self._stream_connection(stream) as redis:
+                    if len(page) < self.batch_size:
+                        await redis.hdel(replay_key, segment)
+                        return True
+                    else:
+                        checkpoint = [redis_stream_id_add_one(page[-1][0]), end]
+                        await redis.hset(replay_key, segment, json.dumps(checkpoint))
+                        await redis.pexpire(lock_key, lock_timeout)
+        finally:
+            with await self._stream_connection(stream) as redis:
+                await self._execute_script(
+                    redis, DELETE_LOCK_SCRIPT, keys=[lock_key], args=[self.consumer_name]
+                )
+
+    def _replay_key(self, stream, consumer_group):
+        return f"{stream}:{consumer_group}:replay"
+
+    async def delete_consumer_group(self, listen_for, consumer_group: str):
+        """Delete the given consumer group, and any replay progress, from the events' streams"""
+        if self.consumer_group_prefix:
+            consumer_group = f"{self.consumer_group_prefix}-{consumer_group}"
+
+        for stream in set(self._get_stream_names(listen_for)):
+            with await self._stream_connection(stream) as redis:
+                if await redis.exists(stream):
+                    await redis.execute(b"XGROUP", b"DESTROY", stream, consumer_group)
+                await redis.delete(self._replay_key(stream, consumer_group))
+
+    async def get_lag(self, listen_for) -> Dict[str, Dict[str, dict]]:
+        """Get how far behind each consumer group is for the given events
+
+        Returns a dictionary keyed by the event's full name (`api_name.event_name`).
+        Each value is a dictionary of consumer group names to a dictionary containing:
+
+            * `pending` – Events delivered to a consumer but not yet acknowledged
+            * `waiting` – Events not yet delivered to any consumer. This will be
+              `None` if Redis cannot report it (Redis 7 or above is required)
+            * `consumers` – The number of consumers in the group
+            * `oldest_pending_age` – Seconds since the oldest pending event was
+              fired, or `None` if there are no pending events
+
+        Note that when using `StreamUse.PER_API` all events within an API share a
+        stream, and so the figures cover all events within that API.
+        """
+        lag = {}
+        for api_name, event_name in listen_for:
+            stream = self._get_stream_names([(api_name, event_name)])[0]
+            groups = lag[f"{api_name}.{event_name}"] = {}
+            with await self._stream_connection(stream) as redis:
+                if not await redis.exists(stream):
+                    continue
+
+                for group in await redis.execute(b"XINFO", b"GROUPS", stream):
+                    group = dict(zip(group[::2], group[1::2]))
+                    oldest_pending_age = None
+                    if group[b"pending"]:
+                        _, oldest_pending, *_ = await redis.execute(
+                            b"XPENDING", stream, group[b"name"]
+                        )
+                        oldest_pending_ms, _ = parse_redis_stream_id(oldest_pending)
+                        oldest_pending_age = time.time() - oldest_pending_ms / 1000
+
+                    groups[decode(group[b"name"], "utf8")] = dict(
+                        pending=group[b"pending"],
+                        waiting=group.get(b"lag"),
+                        consumers=group[b"consumers"],
+                        oldest_pending_age=oldest_pending_age,
+                    )
+        return lag
+
+    async def history(
+        self,
+        listen_for,
+        since: Since = None,
+        until: Since = None,
+        reverse: bool = False,
+        batch_size: int = 100,
+    ) -> Generator[EventMessage, None, None]:
+        """Get past events for the given APIs
+
+        Events are yielded oldest first (or newest first if `reverse` is set),
+        optionally limited to those fired between `since` and `until`. Events are
+        fetched from Redis `batch_size` at a time, so memory use does not grow with
+        the length of the stream.
+        """
+        self._sanity_check_listen_for(listen_for)
+
+        start = normalise_since_value(since) if since else "-"
+        stop = normalise_since_value(until) if until else "+"
+        expected_events = {event_name for _, event_name in listen_for}
+
+        # Each stream is already in order, so we merge them by taking whichever
+        # stream has the oldest (or newest) message next
+        streams = [
+            self._history_stream(stream_name, start, stop, reverse, batch_size)
+            for stream_name in self._get_stream_names(listen_for)
+        ]
+        heads = {}
+
+        async def next_from(stream):
+            try:
+                heads[stream] = await stream.__anext__()
+            except StopAsyncIteration:
+                pass
+
+        for stream in streams:
+            await next_from(stream)
+
+        choose = max if reverse else min
+        while heads:
+            stream = choose(heads, key=lambda s: parse_redis_stream_id(heads[s][0]))
+            message_id, fields = heads.pop(stream)
+            await next_from(stream)
+
+            message = self._fields_to_message(
+                fields, expected_events, native_id=decode(message_id, "utf8")
+            )
+            if message:
+                yield message
+
+    async def _history_stream(self, stream, start, stop, reverse, batch_size):
+        """Yield (message ID, fields) for messages in the stream, one page at a time"""
+        while True:
+            with await self._stream_connection(stream) as redis:
+                if reverse:
+                    page = await redis.xrevrange(stream, start=stop, stop=start, count=batch_size)
+                else:
+                    page = await redis.xrange(stream, start=start, stop=stop, count=batch_size)
+
+            for message_id, fields in page:
+                yield message_id, fields
+
+            if len(page) < batch_size:
+                return
+
+            # Ranges are inclusive, so start the next page just beyond the message we finished on
+            last_id = page[-1][0]
+            if reverse:
+                stop = redis_stream_id_previous(last_id)
+                if stop is None:
+                    return
+            else:
+                start = redis_stream_id_add_one(last_id)
 
     async def _fetch_new_messages(self, streams, consumer_group, expected_events, forever):
-        with await self.connection_manager() as redis:
+        # The caller ensures all of the streams are on the same shard and hash slot
+        with await self._stream_connection(next(iter(streams))) as redis:
             # Firstly create the consumer group if we need to
             await self._create_consumer_groups(streams, redis, consumer_group)
 
@@ -590,13 +2413,35 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
                 latest_ids=["0"] * len(streams),
                 timeout=None,  # Don't block, return immediately
             )
+            self._mark_in_progress(pending_messages, consumer_group)
+            pending_info = {}
+            if self.max_deliveries and pending_messages:
+                pending_info = await self._get_own_pending_info(
+                    redis, pending_messages, consumer_group
+                )
+
             for stream, message_id, fields in pending_messages:
                 message_id = decode(message_id, "utf8")
+                # Reading our pending messages counts as a delivery, hence '>' rather than '>='
+                num_deliveries = pending_info.get((decode(stream, "utf8"), message_id), 0)
+                if self.max_deliveries and num_deliveries > self.max_deliveries:
+                    await self._dead_letter(
+                        redis,
+                        stream,
+                        consumer_group,
+                        message_id,
+                        fields,
+                        self.consumer_name,
+                        num_deliveries - 1,
+                    )
+                    continue
+
                 event_message = self._fields_to_message(
-                    fields, expected_events, native_id=message_id
+                    fields, expected_events, native_id=message_id, consumer_group=consumer_group
                 )
                 if not event_message:
                     # noop message, or message an event we don't care about
+                    await self._ack(stream, consumer_group, message_id)
                     continue
                 logger.debug(
                     LBullets(
@@ -627,15 +2472,17 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
                     latest_ids=[">"] * len(streams),
                     count=self.batch_size,
                 )
+                self._mark_in_progress(stream_messages, consumer_group)
 
                 # Handle the messages we have received
                 for stream, message_id, fields in stream_messages:
                     message_id = decode(message_id, "utf8")
                     event_message = self._fields_to_message(
-                        fields, expected_events, native_id=message_id
+                        fields, expected_events, native_id=message_id, consumer_group=consumer_group
                     )
                     if not event_message:
                         # noop message, or message an event we don't care about
+                        await self._ack(stream, consumer_group, message_id)
                         continue
                     logger.debug(
                         LBullets(
@@ -658,49 +2505,60 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
         self, stream_names: List[str], consumer_group: str, expected_events: set
     ):
         """Reclaim messages that other consumers in the group failed to acknowledge"""
-        with await self.connection_manager() as redis:
-            for stream in stream_names:
-                old_messages = await redis.xpending(
-                    stream, consumer_group, "-", "+", count=self.reclaim_batch_size
-                )
-                timeout = self.acknowledgement_timeout * 1000
-                for (
-                    message_id,
-                    consumer_name,
-                    ms_since_last_delivery,
-                    num_deliveries,
-                ) in old_messages:
-                    message_id = decode(message_id, "utf8")
-                    consumer_name = decode(consumer_name, "utf8")
+        timeout = int(self.acknowledgement_timeout * 1000)
+        total_reclaimed = 0
+        for stream in stream_names:
+            with await self._stream_connection(stream) as redis:
+                async for claimed_messages in self._claim_timed_out_messages(
+                    redis,
+                    stream,
+                    consumer_group,
+                    timeout,
+                    batch_size=self.reclaim_batch_size,
+                    in_progress=self._in_progress[(stream, consumer_group)],
+                ):
+                    self._mark_in_progress(
+                        [
+                            (stream, message_id, fields)
+                            for message_id, fields, *_ in claimed_messages
+                        ],
+                        consumer_group,
+                    )
+                    total_reclaimed += len(claimed_messages)
+                    self.total_reclaimed_messages += len(claimed_messages)
 
-                    if ms_since_last_delivery > timeout:
-                        logger.info(
-                            L(
-                                "Found timed out event {} in stream {}. Abandoned by {}. Attempting to reclaim...",
-                                Bold(message_id),
-                                Bold(stream),
-                                Bold(consumer_name),
+                    for claimed_message_id, fields, consumer, deliveries in claimed_messages:
+                        claimed_message_id = decode(claimed_message_id, "utf8")
+                        if self.max_deliveries and deliveries >= self.max_deliveries:
+                            # Every consumer which received this message has failed to process
+                            # it, so stop it from being redelivered forever
+                            await self._dead_letter(
+                                redis,
+                                stream,
+                                consumer_group,
+                                claimed_message_id,
+                                fields,
+                                consumer,
+                                deliveries,
                             )
-                        )
+                            continue
 
-                    result = await redis.xclaim(
-                        stream, consumer_group, self.consumer_name, int(timeout), message_id
-                    )
-                    for claimed_message_id, fields in result:
-                        claimed_message_id = decode(claimed_message_id, "utf8")
                         event_message = self._fields_to_message(
-                            fields, expected_events, native_id=claimed_message_id
+                            fields,
+                            expected_events,
+                            native_id=claimed_message_id,
+                            consumer_group=consumer_group,
                         )
                         if not event_message:
                             # noop message, or message an event we don't care about
+                            await self._ack(stream, consumer_group, claimed_message_id)
                             continue
                         logger.debug(
                             LBullets(
                                 L(
-                                    "⬅ Reclaimed timed out event {} on stream {}. Abandoned by {}.",
-                                    Bold(message_id),
+                                    "⬅ Reclaimed timed out event {} on stream {}",
+                                    Bold(claimed_message_id),
                                     Bold(stream),
-                                    Bold(consumer_name),
                                 ),
                                 items=dict(
                                     **event_message.get_metadata(),
@@ -710,27 +2568,612 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
                         )
                         yield event_message, stream
 
-    async def _ack(self, stream, consumer_group, message_id):
-        logger.debug(f"Acknowledging successful processing of message {message_id}")
-        with await self.connection_manager() as redis:
-            await redis.xack(stream, consumer_group, message_id)
+        if total_reclaimed:
+            logger.info(
+                L(
+                    "Reclaimed {} timed out events in consumer group {}",
+                    Bold(total_reclaimed),
+                    Bold(consumer_group),
+                )
+            )
 
-    async def _create_consumer_groups(self, streams, redis, consumer_group):
+    async def _get_own_pending_info(self, redis, pending_messages, consumer_group) -> Dict:
+        """Get the number of times each of this consumer's pending messages has been delivered
+
+        Returns a dictionary keyed by `(stream, message_id)`.
+        """
+        totals = defaultdict(int)
+        for stream, *_ in pending_messages:
+            totals[decode(stream, "utf8")] += 1
+
+        pending_info = {}
+        for stream, total in totals.items():
+            pending = await redis.execute(
+                b"XPENDING", stream, consumer_group, b"-", b"+", total, self.consumer_name
+            )
+            for message_id, _, _, num_deliveries in pending:
+                pending_info[(stream, decode(message_id, "utf8"))] = num_deliveries
+        return pending_info
+
+    async def _dead_letter(
+        self, redis, stream, consumer_group, message_id, fields, consumer_name, num_deliveries
+    ):
+        """Move a message which has repeatedly failed to be processed to a dead letter stream
+
+        Each API has its own dead letter stream. The message is acknowledged on its
+        original stream, so it will no longer be redelivered to the consumer group.
+        """
+        stream = decode(stream, "utf8")
+        dead_letter_stream = self._get_dead_letter_stream_name(self._get_api_name(stream))
+        fields, _ = split_dead_letter_fields(fields)
+        dead_letter_fields = {
+            DEAD_LETTER_PREFIX + b"stream": stream,
+            DEAD_LETTER_PREFIX + b"message_id": message_id,
+            DEAD_LETTER_PREFIX + b"consumer_group": consumer_group,
+            DEAD_LETTER_PREFIX + b"consumer": consumer_name,
+            DEAD_LETTER_PREFIX + b"deliveries": num_deliveries,
+            DEAD_LETTER_PREFIX + b"time": time.time(),
+        }
+
+        transaction = redis.multi_exec()
+        transaction.xadd(dead_letter_stream, fields={**fields, **dead_letter_fields})
+        transaction.xack(stream, consumer_group, message_id)
+        await transaction.execute()
+        self._in_progress[(decode(stream, "utf8"), consumer_group)].discard(
+            decode(message_id, "utf8")
+        )
+
+        self.total_dead_lettered_messages += 1
+        logger.warning(
+            L(
+                "Moved event {} on stream {} to dead letter stream {} after {} failed deliveries",
+                Bold(message_id),
+                Bold(stream),
+                Bold(dead_letter_stream),
+                Bold(num_deliveries),
+            )
+        )
+
+    async def get_dead_letters(
+        self, api_name: str, start: str = "-", count: int = 100
+    ) -> List[dict]:
+        """Get events which were moved to the given API's dead letter stream
+
+        Returns up to `count` events, oldest first, starting from the dead letter ID
+        `start` (inclusive). Each is a dictionary containing:
+
+            * `id` – The event's ID within the dead letter stream
+            * `event_message` – The `EventMessage`, or `None` if it could not be deserialized
+            * `fields` – The raw fields of the event as stored in Redis
+            * `stream` – The stream the event was originally fired on
+            * `message_id` – The event's original ID within `stream`
+            * `consumer_group` – The consumer group which failed to process the event
+            * `consumer` – The consumer which last received the event
+            * `deliveries` – The number of times the event was delivered
+            * `dead_lettered_at` – The unix time at which the event was moved
+        """
+        dead_letter_stream = self._get_dead_letter_stream_name(api_name)
+        with await self._get_shard(api_name).connection_manager(key=dead_letter_stream) as redis:
+            entries = await redis.xrange(dead_letter_stream, start=start, stop="+", count=count)
+
+        dead_letters = []
+        for dead_letter_id, fields in entries:
+            fields, dead_letter_fields = split_dead_letter_fields(fields)
+            message_id = decode(dead_letter_fields[b"message_id"], "utf8")
+            try:
+                event_message = self.deserializer(fields, native_id=message_id)
+            except Exception as e:
+                # The event may well be in the dead letter stream because it cannot be decoded
+                logger.warning(f"Failed to deserialize dead lettered event {message_id}: {e}")
+                event_message = None
+
+            dead_letters.append(
+                dict(
+                    id=decode(dead_letter_id, "utf8"),
+                    event_message=event_message,
+                    fields=fields,
+                    stream=decode(dead_letter_fields[b"stream"], "utf8"),
+                    message_id=message_id,
+                    consumer_group=decode(dead_letter_fields[b"consumer_group"], "utf8"),
+                    consumer=decode(dead_letter_fields[b"consumer"], "utf8"),
+                    deliveries=int(dead_letter_fields[b"deliveries"]),
+                    dead_lettered_at=float(dead_letter_fields[b"time"]),
+                )
+            )
+        return dead_letters
+
+    async def requeue_dead_letters(
+        self, api_name: str, ids: Sequence[str] = None, batch_size: int = 100
+    ) -> int:
+        """Return events in the given API's dead letter stream to the streams they came from
+
+        All dead lettered events are requeued, or only those with the given dead letter
+        `ids` (see get_dead_letters()). Events are moved `batch_size` at a time. A
+        requeued event is only delivered to the consumer group which failed to process
+        it, and will be dead lettered again if it continues to fail.
+
+        Returns the number of events requeued.
+        """
+        dead_letter_stream = self._get_dead_letter_stream_name(api_name)
+        remaining_ids = None if ids is None else list(ids)
+        total_requeued = 0
+
+        while True:
+            # Events are always requeued onto the same shard, as an API's streams share a shard
+            shard = self._get_shard(api_name)
+            with await shard.connection_manager(key=dead_letter_stream) as redis:
+                if remaining_ids is None:
+                    entries = await redis.xrange(dead_letter_stream, count=batch_size)
+                else:
+                    batch_ids = remaining_ids[:batch_size]
+                    remaining_ids = remaining_ids[batch_size:]
+                    pipeline = redis.pipeline()
+                    for dead_letter_id in batch_ids:
+                        pipeline.xrange(
+                            dead_letter_stream, start=dead_letter_id, stop=dead_letter_id
+                        )
+                    entries = [entry for result in await pipeline.execute() for entry in result]
+
+                if entries:
+                    transaction = redis.multi_exec()
+                    for _, fields in entries:
+                        fields, dead_letter_fields = split_dead_letter_fields(fields)
+                        stream = decode(dead_letter_fields[b"stream"], "utf8")
+                        requeued_for = dead_letter_fields[b"consumer_group"]
+                        transaction.xadd(
+                            stream,
+                            fields={**fields, DEAD_LETTER_PREFIX + b"requeued_for": requeued_for},
+                        )
+                        self._start_retention(stream)
+                    await transaction.execute()
+
+                    # Removed only once requeued, so a failure here may duplicate
+                    # events, but will never lose them
+                    await redis.execute(
+                        b"XDEL", dead_letter_stream, *[entry_id for entry_id, _ in entries]
+                    )
+                    total_requeued += len(entries)
+
+            if remaining_ids is None and len(entries) < batch_size:
+                break
+            if remaining_ids is not None and not remaining_ids:
+                break
+
+        if total_requeued:
+            logger.info(
+                L(
+                    "Requeued {} events from dead letter stream {}",
+                    Bold(total_requeued),
+                    Bold(dead_letter_stream),
+                )
+            )
+        return total_requeued
+
+    def _get_api_name(self, stream: str) -> str:
+        # Event stream names are either 'api_name.event_name:stream' or 'api_name.*:stream',
+        # with the API name in braces when in cluster mode
+        return stream.rsplit(":", 1)[0].rsplit(".", 1)[0].strip("{}")
+
+    def _get_dead_letter_stream_name(self, api_name: str) -> str:
+        return f"{self._hash_tag(api_name)}:dead_letters"
+
+    def _get_shard(self, api_name: str) -> RedisTransportMixin:
+        """Get the Redis instance which holds the streams for the given API
+
+        All of an API's streams are kept on the same shard, along with its dead letter
+        stream and any replay state, so that they can be used within a single transaction.
+        """
+        if not self._shards:
+            return self
+        url = self.shard_mapping.get(api_name) or self._hash_ring.get_node(api_name)
+        return self._shards[url]
+
+    def _stream_connection(self, stream: str):
+        """Get a connection to the shard which holds the given stream"""
+        return self._get_shard(self._get_api_name(stream)).connection_manager(key=stream)
+
+    def _group_by_shard(self, streams: Mapping[str, Since]) -> Dict[Tuple, dict]:
+        """Split the given {stream: since} mapping by the shard which holds each stream
+
+        In cluster mode, the streams are also split by hash slot. Returns a dictionary
+        keyed by `(shard, slot)`, where `slot` is `None` when not in cluster mode.
+        """
+        by_shard = OrderedDict()
         for stream, since in streams.items():
-            if not await redis.exists(stream):
-                # Add a noop to ensure the stream exists
-                await redis.xadd(stream, fields={"": ""})
+            shard = self._get_shard(self._get_api_name(stream))
+            slot = redis_key_slot(stream) if self.cluster else None
+            by_shard.setdefault((shard, slot), OrderedDict())[stream] = since
+        return by_shard
+
+    async def move_stream(
+        self, stream: str, from_url: str, to_url: str, batch_size: int = 1000
+    ) -> int:
+        """Move a stream from one shard to another
+
+        This copies the stream's events (keeping their IDs), its consumer groups and any
+        replay progress to the shard at `to_url`, and then deletes them from the shard at
+        `from_url`. Each group keeps its position, so acknowledged events are not delivered
+        again. Events which were pending remain pending for the same consumer, so will be
+        redelivered once that consumer restarts (or once they are reclaimed).
+
+        Publishers and consumers of the stream should be stopped while it is moved, and
+        restarted with a `shard_mapping` (or `shard_urls`) which places the stream's API
+        on the new shard. Returns the number of events moved.
+        """
+        source = self._shards[from_url]
+        destination = self._shards[to_url]
+        total_moved = 0
+
+        source_redis = await source.connection_manager(key=stream)
+        destination_redis = await destination.connection_manager(key=stream)
+        with source_redis, destination_redis:
+            if await destination_redis.exists(stream):
+                raise StreamAlreadyExists(
+                    f"Cannot move stream {stream} to {to_url}, as the stream already exists there"
+                )
+            if not await source_redis.exists(stream):
+                return 0
+
+            start = "-"
+            while True:
+                page = await source_redis.xrange(stream, start=start, stop="+", count=batch_size)
+                if page:
+                    pipeline = destination_redis.pipeline()
+                    for message_id, fields in page:
+                        pipeline.xadd(stream, fields=fields, message_id=message_id)
+                    await pipeline.execute()
+                    total_moved += len(page)
+                if len(page) < batch_size:
+                    break
+                start = redis_stream_id_add_one(page[-1][0])
+
+            for group in await source_redis.execute(b"XINFO", b"GROUPS", stream):
+                group = dict(zip(group[::2], group[1::2]))
+                await self._move_consumer_group(
+                    source_redis, destination_redis, stream, group, batch_size
+                )
+
+                replay_key = self._replay_key(stream, decode(group[b"name"], "utf8"))
+                checkpoints = await source_redis.hgetall(replay_key)
+                if checkpoints:
+                    await destination_redis.hmset_dict(replay_key, checkpoints)
+                    await source_redis.delete(replay_key)
+
+            await source_redis.delete(stream)
+
+        logger.info(
+            L(
+                "Moved {} events in stream {} from {} to {}",
+                Bold(total_moved),
+                Bold(stream),
+                Bold(from_url),
+                Bold(to_url),
+            )
+        )
+        return total_moved
+
+    async def _move_consumer_group(
+        self, source_redis, destination_redis, stream, group, batch_size
+    ):
+        """Recreate the given consumer group (as returned by XINFO GROUPS) on the destination
 
+        The events must already have been copied to the destination. The group keeps its
+        last delivered ID, and each pending event is kept pending for the same consumer
+        (with the same idle time & delivery count).
+        """
+        group_name = group[b"name"]
+        last_delivered_id = decode(group[b"last-delivered-id"], "utf8")
+        if not group[b"pending"]:
+            await destination_redis.xgroup_create(stream, group_name, latest_id=last_delivered_id)
+            return
+
+        pending = OrderedDict()
+        start = "-"
+        while True:
+            page = await source_redis.xpending(stream, group_name, start, "+", count=batch_size)
+            for message_id, consumer_name, ms_idle, deliveries in page:
+                pending[decode(message_id, "utf8")] = (consumer_name, ms_idle, deliveries)
+            if len(page) < batch_size:
+                break
+            start = redis_stream_id_add_one(page[-1][0])
+
+        # Pending events can only be created by delivering them. So start the group just
+        # before the oldest pending event, and deliver everything up to the last delivered
+        # ID to a temporary consumer. The pending events are then claimed by their original
+        # consumers, and everything else is acknowledged.
+        oldest_pending_id = next(iter(pending))
+        await destination_redis.xgroup_create(
+            stream, group_name, latest_id=redis_stream_id_previous(oldest_pending_id) or "0-0"
+        )
+        mover_name = f"{self.consumer_name}:move"
+        last_delivered = parse_redis_stream_id(last_delivered_id)
+        while True:
+            messages = await destination_redis.xread_group(
+                group_name, mover_name, [stream], latest_ids=[">"], count=batch_size, timeout=None
+            )
+            commands = []
+            for _, message_id, _ in messages:
+                message_id = decode(message_id, "utf8")
+                if message_id in pending:
+                    consumer_name, ms_idle, deliveries = pending[message_id]
+                    commands.append(
+                        destination_redis.execute(
+                            b"XCLAIM",
+                            stream,
+                            group_name,
+                            consumer_name,
+                            0,
+                            message_id,
+                            b"IDLE",
+                            ms_idle,
+                            b"RETRYCOUNT",
+                            deliveries,
+                            b"JUSTID",
+                        )
+                    )
+                else:
+                    # Either already acknowledged, or not yet delivered (the
+                    # group's position is restored below)
+                    commands.append(destination_redis.xack(stream, group_name, message_id))
+            await asyncio.gather(*commands)
+
+            if not messages or parse_redis_stream_id(messages[-1][1]) >= last_delivered:
+                break
+
+        await destination_redis.execute(b"XGROUP", b"SETID", stream, group_name, last_delivered_id)
+        await destination_redis.execute(b"XGROUP", b"DELCONSUMER", stream, group_name, mover_name)
+
+    async def acknowledge(self, *event_messages: EventMessage):
+        for event_message in event_messages:
             try:
-                # Create the group (it may already exist)
-                await redis.xgroup_create(stream, consumer_group, latest_id=since)
-            except ReplyError as e:
-                if "BUSYGROUP" not in str(e):
-                    raise
+                stream, consumer_group, in_flight = self._in_flight.pop(event_message)
+            except KeyError:
+                # Consumption has since stopped, so the message will be redelivered
+                logger.debug(f"Cannot acknowledge unknown message {event_message.native_id}")
+                continue
+            replay_ack = self._replay_acks.pop(event_message, None)
+            if replay_ack is not None:
+                # Replayed messages are checkpointed rather than acknowledged
+                replay_ack.set_result(None)
+            else:
+                await self._ack(stream, consumer_group, event_message.native_id)
+            in_flight.release()
+
+    async def close(self):
+        # Ensure any buffered events are published before we close
+        self._publish_buffered()
+        if self._publish_tasks:
+            await asyncio.wait(self._publish_tasks)
+        await self._flush_acks()
+        await cancel(self._retention_task)
+        self._retention_task = None
+        for shard in self._shards.values():
+            await shard.close()
+        await super().close()
+
+    def _start_retention(self, stream):
+        """Ensure the given stream will be trimmed by the retention task"""
+        self._published_streams.add(stream)
+        if self.retention_interval and not self._retention_task:
+            self._retention_task = asyncio.ensure_future(self._retention_loop())
+            self._retention_task.add_done_callback(check_for_exception)
+
+    async def _retention_loop(self):
+        # Trimming happens here, rather than upon each publish, so publishers
+        # don't pay for it and we know which events have been processed
+        while True:
+            await asyncio.sleep(self.retention_interval)
+            try:
+                await self.trim_streams(list(self._published_streams))
+            except (ConnectionClosedError, ReplyError) as e:
+                logger.warning(
+                    f"Failed to trim Redis event streams, will retry "
+                    f"in {self.retention_interval} seconds. The error was: {e}"
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Retention should never take down the process, so log and carry on
+                logger.exception(e)
+
+    async def trim_streams(self, streams: Sequence[str]) -> int:
+        """Remove old events from the given streams
+
+        Events are removed once the stream is longer than `max_stream_length`, or
+        once they are older than `max_stream_age` seconds. However, an event
+        will never be removed until all consumer groups have processed it, including
+        any events still to be replayed into a new group. Groups which have been
+        abandoned (see `_is_group_abandoned()`) are not waited for.
+
+        At most `RETENTION_MAX_SCAN` events are located by length in each script call,
+        so a long stream is trimmed in several passes rather than blocking Redis.
+
+        Before Redis 6.2, streams are instead trimmed to approximately `max_stream_length`
+        events, regardless of whether they have been processed. Returns the number of
+        events removed.
+        """
+        supports_min_id_trimming = await self._check_min_id_trimming()
+        total_trimmed = 0
+        for stream in streams:
+            with await self._stream_connection(stream) as redis:
+                if not supports_min_id_trimming:
+                    if self.max_stream_length:
+                        total_trimmed += await redis.execute(
+                            b"XTRIM", stream, b"MAXLEN", b"~", self.max_stream_length
+                        )
+                    continue
+
+                while True:
+                    min_id = await self._get_retention_min_id(redis, stream)
+                    if not min_id:
+                        break
+                    trimmed = await redis.execute(b"XTRIM", stream, b"MINID", min_id)
+                    total_trimmed += trimmed
+                    if trimmed < RETENTION_MAX_SCAN:
+                        # Otherwise the scan may have been capped, so there may be more to trim
+                        break
+
+        if total_trimmed:
+            logger.debug(L("Trimmed {} old events from Redis streams", Bold(total_trimmed)))
+        return total_trimmed
+
+    async def _get_retention_min_id(self, redis, stream) -> Optional[str]:
+        """Get the ID of the oldest event which should be kept in the given stream
+
+        Returns None if no events should be removed
+        """
+        if not await redis.exists(stream):
+            return None
 
-    def _fields_to_message(self, fields, expected_event_names, native_id) -> Optional[EventMessage]:
+        min_id = None
+        if self.max_stream_age:
+            min_id = "{}-0".format(round((time.time() - self.max_stream_age) * 1000))
+
+        if self.max_stream_length:
+            excess = await redis.xlen(stream) - self.max_stream_length
+            if excess > 0:
+                # The first event to keep is the one following the excess events.
+                # Only scan a bounded number of these, the rest go in a later pass
+                length_min_id = await self._execute_script(
+                    redis,
+                    STREAM_ID_AT_SCRIPT,
+                    keys=[stream],
+                    args=[min(excess, RETENTION_MAX_SCAN)],
+                )
+                if length_min_id:
+                    length_min_id = decode(length_min_id, "utf8")
+                    min_id = max(filter(None, [min_id, length_min_id]), key=parse_redis_stream_id)
+
+        if not min_id:
+            return None
+
+        # Never remove events which a consumer group has yet to process,
+        # unless the group has been abandoned
+        for group in await redis.execute(b"XINFO", b"GROUPS", stream):
+            group = dict(zip(group[::2], group[1::2]))
+
+            # Events being replayed into a new group are below its last delivered ID,
+            # so the start of each unfinished replay segment must be kept too. The group
+            # has no consumers until the replay is complete, but is not abandoned
+            replay_key = self._replay_key(stream, decode(group[b"name"], "utf8"))
+            checkpoints = await redis.hvals(replay_key)
+            for checkpoint in checkpoints:
+                segment_start, _ = json.loads(checkpoint)
+                segment_start = "{}-{}".format(*parse_redis_stream_id(segment_start))
+                min_id = min(min_id, segment_start, key=parse_redis_stream_id)
+
+            if not checkpoints and await self._is_group_abandoned(redis, stream, group):
+                continue
+            if group[b"pending"]:
+                # Events which have been delivered but not acknowledged
+                _, oldest_pending, *_ = await redis.execute(b"XPENDING", stream, group[b"name"])
+                group_min_id = decode(oldest_pending, "utf8")
+            else:
+                group_min_id = redis_stream_id_add_one(group[b"last-delivered-id"])
+            min_id = min(min_id, group_min_id, key=parse_redis_stream_id)
+
+        return min_id
+
+    async def _is_group_abandoned(self, redis, stream, group: dict) -> bool:
+        """Should the given consumer group (as returned by XINFO GROUPS) be ignored by retention?
+
+        A group is abandoned if it has no consumers, or if all of its consumers have been
+        idle for longer than `abandoned_group_timeout` seconds. Otherwise a group which is
+        no longer in use would prevent the stream from ever being trimmed.
+        """
+        if not group[b"consumers"]:
+            return True
+        if not self.abandoned_group_timeout:
+            return False
+
+        consumers = await redis.execute(b"XINFO", b"CONSUMERS", stream, group[b"name"])
+        idle_times = [dict(zip(c[::2], c[1::2]))[b"idle"] for c in consumers]
+        return all(idle > self.abandoned_group_timeout * 1000 for idle in idle_times)
+
+    def _mark_in_progress(self, stream_messages, consumer_group):
+        """Record that the given `(stream, message_id, fields)` messages are being processed
+
+        Stops the messages being reclaimed by this consumer until they are acknowledged.
+        """
+        for stream, message_id, _ in stream_messages:
+            key = (decode(stream, "utf8"), consumer_group)
+            self._in_progress[key].add(decode(message_id, "utf8"))
+
+    async def _ack(self, stream, consumer_group, message_id):
+        """Acknowledge the successful processing of a message
+
+        Acknowledgements are buffered and sent in batches. The buffer is flushed once it
+        contains `acknowledgement_batch_size` messages, or once `acknowledgement_linger`
+        seconds have passed since the first message was added to it.
+        """
+        self._in_progress[(decode(stream, "utf8"), consumer_group)].discard(
+            decode(message_id, "utf8")
+        )
+        logger.debug(f"Acknowledging successful processing of message {message_id}")
+        self._ack_buffer[(stream, consumer_group)].append(message_id)
+        self._ack_buffer_size += 1
+
+        if self._ack_buffer_size >= self.acknowledgement_batch_size:
+            await self._flush_acks()
+        elif not self._ack_flush_task:
+            self._ack_flush_task = asyncio.ensure_future(self._flush_acks_after_linger())
+            self._ack_flush_task.add_done_callback(make_exception_checker(die=False))
+
+    async def _flush_acks_after_linger(self):
+        await asyncio.sleep(self.acknowledgement_linger)
+        self._ack_flush_task = None
+        await self._flush_acks()
+
+    async def _flush_acks(self):
+        """Send any buffered acknowledgements, using one XACK per stream & consumer group"""
+        if self._ack_flush_task:
+            self._ack_flush_task.cancel()
+            self._ack_flush_task = None
+
+        ack_buffer = self._ack_buffer
+        self._ack_buffer = defaultdict(list)
+        self._ack_buffer_size = 0
+        if not ack_buffer:
+            return
+
+        # Any messages we fail to acknowledge here will be redelivered
+        # once the acknowledgement_timeout expires
+        by_shard = OrderedDict()
+        for (stream, consumer_group), message_ids in ack_buffer.items():
+            stream = decode(stream, "utf8")
+            shard = self._get_shard(self._get_api_name(stream))
+            slot = redis_key_slot(stream) if self.cluster else None
+            by_shard.setdefault((shard, slot), []).append((stream, consumer_group, message_ids))
+
+        for (shard, _), acks in by_shard.items():
+            with await shard.connection_manager(key=acks[0][0]) as redis:
+                pipeline = redis.pipeline()
+                for stream, consumer_group, message_ids in acks:
+                    pipeline.xack(stream, consumer_group, *message_ids)
+                await pipeline.execute()
+
+    def _fields_to_message(
+        self, fields, expected_event_names, native_id, consumer_group=None
+    ) -> Optional[EventMessage]:
         if tuple(fields.items()) == ((b"", b""),):
             return None
+
+        fields, dead_letter_fields = split_dead_letter_fields(fields)
+        requeued_for = decode(dead_letter_fields.get(b"requeued_for"), "utf8")
+        if consumer_group and requeued_for and requeued_for != consumer_group:
+            # This message was requeued from a dead letter stream for a different consumer group
+            logger.debug(f"Ignoring message {native_id} requeued for consumer group {requeued_for}")
+            return None
+
+        if self.stream_use == StreamUse.PER_API and "*" not in expected_event_names:
+            # Check the event name before going to the expense of deserializing
+            # the message. This is only possible if the serializer stores the
+            # event name in its own field (as the ByField serializer does).
+            event_name = decode(fields.get(b"event_name"), "utf8")
+            if event_name is not None and event_name not in expected_event_names:
+                logger.debug(f"Ignoring message {native_id} for unexpected event {event_name}")
+                return None
+
         message = self.deserializer(fields, native_id=native_id)
 
         want_message = ("*" in expected_event_names) or (message.event_name in expected_event_names)
@@ -749,9 +3192,9 @@ class RedisEventTransport(RedisTransportMixin, EventTransport):
         stream_names = []
         for api_name, event_name in listen_for:
             if self.stream_use == StreamUse.PER_EVENT:
-                stream_name = f"{api_name}.{event_name}:stream"
+                stream_name = f"{self._hash_tag(api_name)}.{event_name}:stream"
             elif self.stream_use == StreamUse.PER_API:
-                stream_name = f"{api_name}.*:stream"
+                stream_name = f"{self._hash_tag(api_name)}.*:stream"
             else:
                 raise ValueError(
                     "Invalid value for stream_use config option. This should have been caught "
@@ -770,8 +3213,9 @@ class RedisSchemaTransport(RedisTransportMixin, SchemaTransport):
         redis_pool=None,
         url: str = "redis://127.0.0.1:6379/0",
         connection_parameters: Mapping = frozendict(),
+        cluster: bool = False,
     ):
-        self.set_redis_pool(redis_pool, url, connection_parameters)
+        self.set_redis_pool(redis_pool, url, connection_parameters, cluster)
         self._latest_ids = {}
 
     @classmethod
@@ -780,8 +3224,9 @@ class RedisSchemaTransport(RedisTransportMixin, SchemaTransport):
         config,
         url: str = "redis://127.0.0.1:6379/0",
         connection_parameters: Mapping = frozendict(),
+        cluster: bool = False,
     ):
-        return cls(url=url, connection_parameters=connection_parameters)
+        return cls(url=url, connection_parameters=connection_parameters, cluster=cluster)
 
     def schema_key(self, api_name):
         return "schema:{}".format(api_name)
@@ -792,38 +3237,55 @@ class RedisSchemaTransport(RedisTransportMixin, SchemaTransport):
 
     async def store(self, api_name: str, schema: Dict, ttl_seconds: Optional[int]):
         """Store an individual schema"""
-        with await self.connection_manager() as redis:
-            schema_key = self.schema_key(api_name)
-
+        schema_key = self.schema_key(api_name)
+        with await self.connection_manager(key=schema_key) as redis:
             p = redis.pipeline()
             p.set(schema_key, json_encode(schema))
             if ttl_seconds is not None:
                 p.expire(schema_key, ttl_seconds)
-            p.sadd(self.schema_set_key(), api_name)
+            if not self.cluster:
+                p.sadd(self.schema_set_key(), api_name)
             await p.execute()
 
+        if self.cluster:
+            # The schema set will likely be served by a different cluster node
+            with await self.connection_manager(key=self.schema_set_key()) as redis:
+                await redis.sadd(self.schema_set_key(), api_name)
+
     async def load(self) -> Dict[str, Dict]:
         """Load all schemas"""
         schemas = {}
-        with await self.connection_manager() as redis:
+        with await self.connection_manager(key=self.schema_set_key()) as redis:
             # Get & decode the api names
             api_names = list(await redis.smembers(self.schema_set_key()))
             api_names = [api_name.decode("utf8") for api_name in api_names]
 
-            # Convert the api names into redis keys
-            keys = [self.schema_key(api_name) for api_name in api_names]
+        if not api_names:
+            return {}
 
-            if not keys:
-                return {}
-
-            # Get the schemas from the keys
-            encoded_schemas = await redis.mget(*keys)
-            for api_name, schema in zip(api_names, encoded_schemas):
+        # Get the schemas from their keys. In cluster mode each schema may be in a different
+        # hash slot, so fetch each slot's schemas concurrently
+        groups = self._group_by_slot(api_names, key=self.schema_key)
+        encoded_schemas = await asyncio.gather(*[self._load_schemas(group) for group in groups])
+        for group, group_schemas in zip(groups, encoded_schemas):
+            for api_name, schema in zip(group, group_schemas):
                 # Schema may have expired
                 if schema:
                     schemas[api_name] = json.loads(schema)
         return schemas
 
+    async def _load_schemas(self, api_names: Sequence[str]) -> List[Optional[bytes]]:
+        """Get the encoded schemas for the given APIs, which must all be in the same hash slot"""
+        keys = [self.schema_key(api_name) for api_name in api_names]
+        with await self.connection_manager(key=keys[0]) as redis:
+            return await redis.mget(*keys)
+
+
+@functools.lru_cache()
+def script_digest(script: str) -> str:
+    """Get the SHA1 digest Redis will use to identify the given lua script"""
+    return hashlib.sha1(script.encode("utf8")).hexdigest()
+
 
 def redis_stream_id_subtract_one(message_id):
     """Subtract one from the message ID
@@ -845,6 +3307,77 @@ def redis_stream_id_subtract_one(message_id):
     return "{:13d}-{}".format(milliseconds, n)
 
 
+def redis_stream_id_add_one(message_id):
+    """Add one to the message ID
+
+    This is useful when paging through a range of messages, as Redis
+    ranges are inclusive of the given start ID.
+    """
+    milliseconds, n = parse_redis_stream_id(message_id)
+    return "{}-{}".format(milliseconds, n + 1)
+
+
+def redis_stream_id_previous(message_id) -> Optional[str]:
+    """Get the ID which immediately precedes the given message ID
+
+    Unlike redis_stream_id_subtract_one(), this will not skip any possible IDs. Returns
+    `None` if there is no preceding ID (i.e. the message ID is '0-0').
+    """
+    milliseconds, n = parse_redis_stream_id(message_id)
+    if n > 0:
+        return "{}-{}".format(milliseconds, n - 1)
+    elif milliseconds > 0:
+        return "{}-{}".format(milliseconds - 1, MAX_STREAM_ID_SEQUENCE)
+    else:
+        return None
+
+
+def parse_redis_stream_id(message_id) -> Tuple[int, int]:
+    """Parse a message ID into a tuple of integers, which will sort correctly"""
+    milliseconds, _, n = decode(message_id, "utf8").partition("-")
+    return int(milliseconds), int(n or 0)
+
+
+def redis_key_slot(key) -> int:
+    """Get the Redis Cluster hash slot for the given key
+
+    Only the key's hash tag (the part within the first `{...}`) is hashed, if it has one.
+    """
+    key = key.encode("utf8") if isinstance(key, str) else key
+    start = key.find(b"{")
+    if start != -1:
+        end = key.find(b"}", start + 1)
+        if end > start + 1:
+            key = key[start + 1 : end]
+    return crc16(key) % CLUSTER_SLOTS
+
+
+def parse_cluster_redirect(error) -> Optional[Tuple[bool, Tuple[str, int]]]:
+    """Parse a MOVED or ASK redirection error returned by Redis Cluster
+
+    Returns `(is_ask, (host, port))`, or `None` if the error is not a redirection.
+    """
+    match = re.search(r"\b(MOVED|ASK) \d+ (\S+):(\d+)", str(error))
+    if not match:
+        return None
+    return match.group(1) == "ASK", (match.group(2), int(match.group(3)))
+
+
+def split_dead_letter_fields(fields: dict) -> Tuple[dict, dict]:
+    """Separate a message's fields from any dead letter fields added to it
+
+    Returns the message's own fields, and the dead letter fields without their prefix.
+    """
+    message_fields = {}
+    dead_letter_fields = {}
+    for key, value in fields.items():
+        if isinstance(key, bytes) and key.startswith(DEAD_LETTER_PREFIX):
+            dead_letter_fields[key[len(DEAD_LETTER_PREFIX) :]] = value
+        else:
+            message_fields[key] = value
+    return message_fields, dead_letter_fields
+
+
 def normalise_since_value(since):
     """Take a 'since' value and normalise it to be a redis message ID"""
     if not since:
@@ -867,3 +3400,11 @@ def redis_steam_id_to_datetime(message_id):
 
 class InvalidRedisPool(LightbusException):
     pass
+
+
+class StreamAlreadyExists(LightbusException):
+    pass
+
+
+class CrossSlotKeys(LightbusException):
+    pass
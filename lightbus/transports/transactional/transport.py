@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import threading
 from asyncio import AbstractEventLoop
@@ -24,6 +25,7 @@ class TransactionalEventTransport(EventTransport):
 
     Additionally, incoming messages are de-duplicated.
     """
+
     # TODO: Note in docs that this transport will not work with the metrics and state APIs
 
     def __init__(
@@ -37,6 +39,8 @@ class TransactionalEventTransport(EventTransport):
         self.auto_migrate = auto_migrate
         self._migrated = False
         self._local = threading.local()
+        # Events set once the corresponding message has been acknowledged
+        self._acknowledged = {}
 
     @property
     def connection(self):
@@ -184,13 +188,22 @@ class TransactionalEventTransport(EventTransport):
                     f"Duplicate event {message.canonical_name} detected with ID {message.id}. "
                     f"Skipping."
                 )
-                await consumer.__anext__()
+                await self.child_transport.acknowledge(message)
                 continue
             else:
                 await database.store_processed_event(message)
 
-            yield message
-            yield await consumer.__anext__()
+            # Each message is processed within its own transaction, so wait for this
+            # message to be acknowledged before committing and moving on to the next.
+            # Messages are therefore processed one at a time, regardless of any
+            # in-flight window configured on the child transport.
+            acknowledged = asyncio.Event()
+            self._acknowledged[message] = acknowledged
+            try:
+                yield message
+                await acknowledged.wait()
+            finally:
+                self._acknowledged.pop(message, None)
 
             try:
                 await database.commit_transaction()
@@ -204,6 +217,13 @@ class TransactionalEventTransport(EventTransport):
                 )
                 await database.rollback_transaction()
 
+    async def acknowledge(self, *event_messages: EventMessage):
+        await self.child_transport.acknowledge(*event_messages)
+        for event_message in event_messages:
+            acknowledged = self._acknowledged.get(event_message)
+            if acknowledged:
+                acknowledged.set()
+
     async def publish_pending(self, message_id=None):
         async for message, options in self.database.consume_pending_events(message_id):
             await self.child_transport.send_event(message, options)
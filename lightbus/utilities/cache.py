@@ -0,0 +1,76 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Hashable, Any
+
+from lightbus.utilities.deforming import deform_to_bus
+
+# Used to detect cache misses, as None may be a legitimate cached value
+MISSING = object()
+
+
+class TtlLruCache(object):
+    """A size-bounded cache which discards the least recently used entries
+
+    Entries also expire `ttl` seconds after being set.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            expires_at, value = self._entries[key]
+        except KeyError:
+            return default
+
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove the given key, returning its value if it has not expired"""
+        try:
+            expires_at, value = self._entries.pop(key)
+        except KeyError:
+            return default
+        return value if expires_at > time.monotonic() else default
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def make_rpc_key(api_name: str, procedure_name: str, kwargs: dict) -> str:
+    """Get a key which uniquely identifies a call to the given RPC with the given kwargs
+
+    Calls with equal kwargs will have equal keys, regardless of the order of the kwargs.
+    """
+    return json.dumps([api_name, procedure_name, deform_to_bus(kwargs)], sort_keys=True)
+
+
+def make_partition_key(value: Any) -> Hashable:
+    """Get a hashable key for the given value
+
+    Hashable values are returned as-is. Others (such as dicts & lists) are
+    encoded, such that equal values will have equal keys.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return json.dumps(deform_to_bus(value), sort_keys=True)
+    else:
+        return value
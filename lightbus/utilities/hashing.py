@@ -0,0 +1,51 @@
+import bisect
+import hashlib
+from typing import Sequence
+
+
+def _make_crc16_table():
+    table = []
+    for byte in range(0, 256):
+        crc = byte << 8
+        for _ in range(0, 8):
+            crc = ((crc << 1) ^ 0x1021 if crc & 0x8000 else crc << 1) & 0xFFFF
+        table.append(crc)
+    return table
+
+
+_CRC16_TABLE = _make_crc16_table()
+
+
+def crc16(data: bytes) -> int:
+    """The CRC16 (XMODEM) checksum of the given data, as used by Redis Cluster"""
+    crc = 0
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ _CRC16_TABLE[(crc >> 8) ^ byte]
+    return crc
+
+
+class ConsistentHashRing(object):
+    """Maps keys onto a set of nodes using consistent hashing
+
+    Adding or removing a node only changes the node for the keys which it gains
+    or loses. Each node is placed at `replicas` points on the ring, so that keys
+    are spread evenly between the nodes.
+    """
+
+    def __init__(self, nodes: Sequence[str], replicas: int = 100):
+        self.nodes = list(nodes)
+        self._ring = sorted(
+            (self._hash(f"{node}:{n}"), node) for node in self.nodes for n in range(replicas)
+        )
+        self._hashes = [hash_ for hash_, _ in self._ring]
+
+    def get_node(self, key: str) -> str:
+        if not self._ring:
+            raise ValueError("Cannot get a node from a hash ring with no nodes")
+        index = bisect.bisect(self._hashes, self._hash(key)) % len(self._ring)
+        return self._ring[index][1]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        # Python's own hash() is randomised per process, so is no use here
+        return int(hashlib.md5(value.encode("utf8")).hexdigest()[:16], 16)
@@ -61,6 +61,7 @@ setup(
         ],
         "lightbus_rpc_transports": [
             "redis = lightbus:RedisRpcTransport",
+            "redis_streams = lightbus:RedisStreamRpcTransport",
             "debug = lightbus:DebugRpcTransport",
             "direct = lightbus:DirectRpcTransport",
         ],
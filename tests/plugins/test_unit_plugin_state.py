@@ -58,11 +58,13 @@ async def test_ping(dummy_bus: BusPath, loop, get_dummy_events):
     await cancel(task)
 
     dummy_events = get_dummy_events()
-    assert len(dummy_events) == 1
+    # A ping, followed by the backlog
+    assert len(dummy_events) == 2
     event_message = dummy_events[0]
 
     assert event_message.api_name == "internal.state"
     assert event_message.event_name == "server_ping"
+    assert dummy_events[1].event_name == "server_backlog"
 
     assert event_message.kwargs["api_names"] == ["example.test"]
     assert event_message.kwargs["listening_for"] == ["example.test.my_event"]
@@ -73,6 +75,50 @@ async def test_ping(dummy_bus: BusPath, loop, get_dummy_events):
     assert event_message.kwargs["process_name"] == "bar"
 
 
+@pytest.mark.asyncio
+async def test_ping_backlog_error(dummy_bus: BusPath, loop, get_dummy_events, mocker):
+    """Errors getting the backlog should not stop the pings"""
+
+    async def get_backlog():
+        raise ValueError("Something went wrong")
+
+    mocker.patch.object(dummy_bus.client, "get_backlog", get_backlog)
+
+    state_plugin = StatePlugin(service_name="foo", process_name="bar")
+    state_plugin.ping_interval = 0.05
+    task = asyncio.ensure_future(state_plugin._send_ping(client=dummy_bus.client), loop=loop)
+    await asyncio.sleep(0.12)
+    assert not task.done()
+    await cancel(task)
+
+    dummy_events = get_dummy_events()
+    assert [e.event_name for e in dummy_events] == ["server_ping", "server_ping"]
+
+
+@pytest.mark.asyncio
+async def test_send_backlog(dummy_bus: BusPath, loop, get_dummy_events, mocker):
+    backlog = {"rpcs": {"example.test": {"pending": None, "waiting": 3}}, "events": {}}
+
+    async def get_backlog():
+        return backlog
+
+    mocker.patch.object(dummy_bus.client, "get_backlog", get_backlog)
+
+    state_plugin = StatePlugin(service_name="foo", process_name="bar")
+    await state_plugin._send_backlog(client=dummy_bus.client)
+
+    dummy_events = get_dummy_events()
+    assert len(dummy_events) == 1
+    event_message = dummy_events[0]
+
+    assert event_message.api_name == "internal.state"
+    assert event_message.event_name == "server_backlog"
+    assert event_message.kwargs["rpcs"] == backlog["rpcs"]
+    assert event_message.kwargs["events"] == {}
+    assert event_message.kwargs["service_name"] == "foo"
+    assert event_message.kwargs["process_name"] == "bar"
+
+
 @pytest.mark.asyncio
 async def test_after_server_stopped(dummy_bus: BusPath, loop, get_dummy_events):
     registry.add(TestApi())
@@ -18,6 +18,14 @@ def redis_rpc_transport(new_redis_pool, server, loop):
     return lightbus.RedisRpcTransport(redis_pool=new_redis_pool(maxsize=10000))
 
 
+@pytest.fixture
+def redis_stream_rpc_transport(new_redis_pool, server, loop):
+    """Get a redis transport backed by a running redis server."""
+    return lightbus.RedisStreamRpcTransport(
+        redis_pool=new_redis_pool(maxsize=10000), consumer_name="test_consumer"
+    )
+
+
 @pytest.fixture
 def redis_result_transport(new_redis_pool, server, loop):
     """Get a redis transport backed by a running redis server."""
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import logging
 
 import jsonschema
@@ -7,7 +8,7 @@ from aioredis.util import decode
 
 import lightbus
 import lightbus.path
-from lightbus.config.structure import OnError
+from lightbus.config.structure import OnError, RpcCacheConfig
 from lightbus.path import BusPath
 from lightbus.api import registry
 from lightbus.config import Config
@@ -87,6 +88,47 @@ async def test_rpc_timeout(bus: lightbus.path.BusPath, dummy_api):
         call_task.result()
 
 
+@pytest.mark.asyncio
+async def test_rpc_timeout_cancels_call(bus: lightbus.path.BusPath, dummy_api, redis_client):
+    """Timed out calls should neither be executed nor have their results sent"""
+    with pytest.raises(LightbusTimeout):
+        # Nothing is consuming RPCs, so this will timeout
+        await bus.my.dummy.my_proc.call_async(field="x", bus_options={"timeout": 0.1})
+
+    assert not await redis_client.keys("rpc_message:*")
+    assert len(await redis_client.keys("rpc_abandoned:*")) == 1
+
+
+@pytest.mark.asyncio
+async def test_rpc_cache_invalidation(
+    bus: lightbus.path.BusPath, dummy_api, redis_client, mocker
+):
+    """Cached results should be cleared when the configured event is fired"""
+    bus.client.config.api("default").rpc_cache = {
+        "my_proc": RpcCacheConfig(ttl=60, invalidate_on=["my.dummy.my_event"])
+    }
+    rpc_transport = bus.client.transport_registry.get_rpc_transport("default")
+    mocker.spy(rpc_transport, "call_rpc")
+    consume_task = asyncio.ensure_future(bus.client.consume_rpcs(apis=[dummy_api]))
+
+    await bus.my.dummy.my_proc.call_async(field="x")
+    await bus.my.dummy.my_proc.call_async(field="x")
+    assert rpc_transport.call_rpc.call_count == 1
+
+    await bus.my.dummy.my_event.fire_async(field="x")
+    await asyncio.sleep(0.1)
+
+    await bus.my.dummy.my_proc.call_async(field="x")
+    assert rpc_transport.call_rpc.call_count == 2
+
+    await cancel(consume_task)
+
+    # The consumer group used for invalidation is only used by this process, so is deleted
+    await bus.client._delete_rpc_cache_consumer_groups()
+    groups = await redis_client.execute(b"XINFO", b"GROUPS", "my.dummy.my_event:stream")
+    assert not groups
+
+
 @pytest.mark.asyncio
 async def test_rpc_error(bus: lightbus.path.BusPath, dummy_api):
     """Test what happens when the remote procedure throws an error"""
@@ -109,6 +151,57 @@ async def test_rpc_error(bus: lightbus.path.BusPath, dummy_api):
         await call_task.result()
 
 
+@pytest.mark.asyncio
+async def test_rpc_max_concurrency(bus: lightbus.path.BusPath, dummy_api):
+    """RPCs should be executed concurrently, but never more than max_concurrency at once"""
+    running = 0
+    max_running = 0
+
+    class SlowApi(lightbus.Api):
+        class Meta:
+            name = "slow"
+
+        async def slow_proc(self, n):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(running, max_running)
+            await asyncio.sleep(0.1)
+            running -= 1
+            return n
+
+    registry.add(SlowApi())
+    # Only the slow API has a concurrency limit
+    slow_config = copy.copy(bus.client.config.api("default"))
+    slow_config.max_concurrency = 3
+    bus.client.config.apis()["slow"] = slow_config
+
+    try:
+        consume_task = asyncio.ensure_future(
+            bus.client.consume_rpcs(apis=[registry.get("slow"), dummy_api])
+        )
+        await asyncio.sleep(0.1)
+
+        start = asyncio.get_event_loop().time()
+        slow_calls = asyncio.gather(*[bus.slow.slow_proc.call_async(n=n) for n in range(0, 6)])
+        await asyncio.sleep(0.02)
+
+        # Other APIs are still consumed while the slow API is at its limit
+        assert await bus.my.dummy.my_proc.call_async(field="x") == "value: x"
+        assert asyncio.get_event_loop().time() - start < 0.1
+
+        results = await slow_calls
+        duration = asyncio.get_event_loop().time() - start
+
+        await cancel(consume_task)
+        assert sorted(results) == [0, 1, 2, 3, 4, 5]
+        assert max_running == 3
+        # Two rounds of three concurrent calls, rather than six sequential calls
+        assert duration < 0.5
+    finally:
+        del bus.client.config.apis()["slow"]
+        del registry._apis["slow"]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "stream_use", stream_use_test_data, ids=["stream_per_event", "stream_per_api"]
@@ -147,14 +240,13 @@ async def test_ids(bus: lightbus.path.BusPath, dummy_api, mocker):
     async def co_consume_rpcs():
         return await bus.client.consume_rpcs(apis=[dummy_api])
 
-    mocker.spy(bus.client, "send_result")
+    mocker.spy(bus.client, "send_results")
 
     (call_task,), (consume_task,) = await asyncio.wait(
         [co_call_rpc(), co_consume_rpcs()], return_when=asyncio.FIRST_COMPLETED
     )
-    _, kw = bus.client.send_result.call_args
-    rpc_message = kw["rpc_message"]
-    result_message = kw["result_message"]
+    (results,), _ = bus.client.send_results.call_args
+    (rpc_message, result_message), = results
     consume_task.cancel()
 
     assert rpc_message.id
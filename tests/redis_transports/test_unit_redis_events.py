@@ -1,10 +1,13 @@
 import asyncio
+import json
 import logging
 from datetime import datetime
 
 import pytest
+from aioredis.util import decode
 
 from lightbus.config import Config
+from lightbus.exceptions import UnsupportedOptionValue
 from lightbus.message import EventMessage
 from lightbus.serializers import (
     ByFieldMessageSerializer,
@@ -12,7 +15,7 @@ from lightbus.serializers import (
     BlobMessageSerializer,
     BlobMessageDeserializer,
 )
-from lightbus.transports.redis import RedisEventTransport, StreamUse
+from lightbus.transports.redis import RedisEventTransport, StreamUse, StreamAlreadyExists
 from lightbus.utilities.async import cancel
 
 pytestmark = pytest.mark.unit
@@ -43,6 +46,63 @@ async def test_send_event(redis_event_transport: RedisEventTransport, redis_clie
     }
 
 
+@pytest.mark.parametrize("atomic", [True, False], ids=["atomic", "non_atomic"])
+@pytest.mark.asyncio
+async def test_send_events(redis_event_transport: RedisEventTransport, redis_client, atomic):
+    await redis_event_transport.send_events(
+        [
+            EventMessage(api_name="my.api", event_name="my_event", id="1", kwargs={"field": 1}),
+            EventMessage(api_name="my.api", event_name="my_event", id="2", kwargs={"field": 2}),
+            EventMessage(api_name="my.api", event_name="other_event", id="3", kwargs={}),
+        ],
+        options={"atomic": atomic},
+    )
+    messages = await redis_client.xrange("my.api.my_event:stream")
+    assert [fields[b"id"] for _, fields in messages] == [b"1", b"2"]
+    messages = await redis_client.xrange("my.api.other_event:stream")
+    assert [fields[b"id"] for _, fields in messages] == [b"3"]
+
+
+@pytest.mark.asyncio
+async def test_send_event_batched(redis_event_transport: RedisEventTransport, redis_client, mocker):
+    """Concurrent sends should be published together once the linger time has passed"""
+    redis_event_transport.publish_linger = 0.05
+    redis_event_transport.publish_max_batch = 2
+    mocker.spy(redis_event_transport, "send_events")
+
+    await asyncio.gather(
+        *[
+            redis_event_transport.send_event(
+                EventMessage(api_name="my.api", event_name="my_event", id=str(n), kwargs={}),
+                options={},
+            )
+            for n in range(0, 3)
+        ]
+    )
+    messages = await redis_client.xrange("my.api.my_event:stream")
+    assert [fields[b"id"] for _, fields in messages] == [b"0", b"1", b"2"]
+    # The first two hit the max batch size, the last was sent after the linger time
+    assert [len(c[0][0]) for c in redis_event_transport.send_events.call_args_list] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_send_event_batched_flushed_on_close(
+    redis_event_transport: RedisEventTransport, redis_client
+):
+    redis_event_transport.publish_linger = 10
+    task = asyncio.ensure_future(
+        redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", id="1", kwargs={}), options={}
+        )
+    )
+    await asyncio.sleep(0.01)
+    assert not await redis_client.xrange("my.api.my_event:stream")
+
+    await redis_event_transport.close()
+    await task
+    assert len(await redis_client.xrange("my.api.my_event:stream")) == 1
+
+
 @pytest.mark.asyncio
 async def test_send_event_per_api_stream(redis_event_transport: RedisEventTransport, redis_client):
     redis_event_transport.stream_use = StreamUse.PER_API
@@ -123,8 +183,8 @@ async def test_consume_events_multiple_consumers(loop, redis_pool, redis_client,
     await asyncio.sleep(0.1)
     await cancel(task1, task2)
 
-    # Two messages, to dummy values which indicate events have been acked
-    assert len(messages) == 4
+    # One message for each consumer group
+    assert len(messages) == 2
 
 
 @pytest.mark.asyncio
@@ -163,8 +223,8 @@ async def test_consume_events_multiple_consumers_one_group(
     await asyncio.sleep(0.1)
     await cancel(task1, task2)
 
-    # One message, one dummy value which indicate events have been acked
-    assert len(messages) == 2
+    # One message, as both consumers are in the same group
+    assert len(messages) == 1
 
 
 @pytest.mark.asyncio
@@ -219,14 +279,9 @@ async def test_consume_events_since_id(
     await asyncio.sleep(0.1)
     await cancel(task)
 
-    messages_ids = [m.native_id for m in yields if isinstance(m, EventMessage)]
-
-    assert len(messages_ids) == 2
-    assert len(yields) == 4
+    assert len(yields) == 2
     assert yields[0].kwargs["field"] == "2"
-    assert yields[1] is True
-    assert yields[2].kwargs["field"] == "3"
-    assert yields[3] is True
+    assert yields[1].kwargs["field"] == "3"
 
 
 @pytest.mark.asyncio
@@ -283,11 +338,9 @@ async def test_consume_events_since_datetime(
     await asyncio.sleep(0.1)
     await cancel(task)
 
-    assert len(yields) == 4
+    assert len(yields) == 2
     assert yields[0].kwargs["field"] == "2"
-    assert yields[1] is True
-    assert yields[2].kwargs["field"] == "3"
-    assert yields[3] is True
+    assert yields[1].kwargs["field"] == "3"
 
 
 @pytest.mark.asyncio
@@ -302,6 +355,20 @@ async def test_from_config(redis_client):
         # Non default serializers, event though they wouldn't make sense in this context
         serializer="lightbus.serializers.BlobMessageSerializer",
         deserializer="lightbus.serializers.BlobMessageDeserializer",
+        acknowledgement_batch_size=50,
+        acknowledgement_linger=0.5,
+        prefetch=5,
+        max_in_flight=15,
+        publish_linger=0.2,
+        publish_max_batch=30,
+        max_stream_age=3600,
+        hard_max_stream_length=5000000,
+        abandoned_group_timeout=600,
+        retention_interval=30,
+        replay_segments=8,
+        max_deliveries=3,
+        shard_urls=[f"redis://127.0.0.1:{port}/6", f"redis://127.0.0.1:{port}/7"],
+        shard_mapping={"my.api": f"redis://127.0.0.1:{port}/7"},
     )
     with await transport.connection_manager() as transport_client:
         assert transport_client.connection.address == ("127.0.0.1", port)
@@ -312,6 +379,20 @@ async def test_from_config(redis_client):
     assert transport._local.redis_pool.connection.maxsize == 123
     assert isinstance(transport.serializer, BlobMessageSerializer)
     assert isinstance(transport.deserializer, BlobMessageDeserializer)
+    assert transport.acknowledgement_batch_size == 50
+    assert transport.acknowledgement_linger == 0.5
+    assert transport.prefetch == 5
+    assert transport.max_in_flight == 15
+    assert transport.publish_linger == 0.2
+    assert transport.publish_max_batch == 30
+    assert transport.max_stream_age == 3600
+    assert transport.hard_max_stream_length == 5000000
+    assert transport.abandoned_group_timeout == 600
+    assert transport.retention_interval == 30
+    assert transport.replay_segments == 8
+    assert transport.max_deliveries == 3
+    assert list(transport._shards) == [f"redis://127.0.0.1:{port}/6", f"redis://127.0.0.1:{port}/7"]
+    assert transport.shard_mapping == {"my.api": f"redis://127.0.0.1:{port}/7"}
 
 
 @pytest.mark.asyncio
@@ -357,6 +438,138 @@ async def test_reclaim_lost_messages(loop, redis_client, redis_pool, dummy_api):
     assert type(reclaimed_messages[0].native_id) == str
 
 
+@pytest.mark.asyncio
+async def test_reclaim_own_lost_messages(loop, redis_client, redis_pool, dummy_api):
+    """Our own timed out messages are reclaimed, unless we are still processing them"""
+    for n in range(0, 2):
+        await redis_client.xadd(
+            "my.dummy.my_event:stream",
+            fields={
+                b"api_name": b"my.dummy",
+                b"event_name": b"my_event",
+                b"id": str(n).encode("utf8"),
+                b"version": b"1",
+                b":field": b'"value"',
+            },
+        )
+    await redis_client.xgroup_create("my.dummy.my_event:stream", "test_group", latest_id="0")
+
+    # Received by this consumer (perhaps by a listener which has since stopped)
+    received = await redis_client.xread_group(
+        "test_group", "good_consumer", ["my.dummy.my_event:stream"], latest_ids=[0]
+    )
+    await asyncio.sleep(0.02)
+
+    event_transport = RedisEventTransport(
+        redis_pool=redis_pool,
+        consumer_group_prefix="test_group",
+        consumer_name="good_consumer",
+        acknowledgement_timeout=0.01,  # in ms, short for the sake of testing
+        stream_use=StreamUse.PER_EVENT,
+    )
+    # The first message is still being processed
+    event_transport._mark_in_progress(received[:1], "test_group")
+
+    reclaimer = event_transport._reclaim_lost_messages(
+        stream_names=["my.dummy.my_event:stream"],
+        consumer_group="test_group",
+        expected_events={"my_event"},
+    )
+    reclaimed_messages = [m async for m, id_ in reclaimer]
+    assert [m.id for m in reclaimed_messages] == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_reclaim_lost_messages_paged(loop, redis_client, redis_pool, dummy_api):
+    """All timed out messages should be reclaimed, not just the first page"""
+    for n in range(0, 5):
+        await redis_client.xadd(
+            "my.dummy.my_event:stream",
+            fields={
+                b"api_name": b"my.dummy",
+                b"event_name": b"my_event",
+                b"id": str(n).encode("utf8"),
+                b"version": b"1",
+                b":field": b'"value"',
+            },
+        )
+    await redis_client.xgroup_create("my.dummy.my_event:stream", "test_group", latest_id="0")
+
+    # Four are claimed by another consumer, one by ourselves
+    await redis_client.xread_group(
+        "test_group", "bad_consumer", ["my.dummy.my_event:stream"], latest_ids=[0], count=4
+    )
+    received = await redis_client.xread_group(
+        "test_group", "good_consumer", ["my.dummy.my_event:stream"], latest_ids=[">"]
+    )
+    await asyncio.sleep(0.02)
+
+    event_transport = RedisEventTransport(
+        redis_pool=redis_pool,
+        consumer_group_prefix="test_group",
+        consumer_name="good_consumer",
+        acknowledgement_timeout=0.01,
+        reclaim_batch_size=2,
+        stream_use=StreamUse.PER_EVENT,
+    )
+    event_transport._mark_in_progress(received, "test_group")
+    reclaimer = event_transport._reclaim_lost_messages(
+        stream_names=["my.dummy.my_event:stream"],
+        consumer_group="test_group",
+        expected_events={"my_event"},
+    )
+    reclaimed_messages = [m async for m, stream in reclaimer]
+    # Our own message is not reclaimed, as we are still processing it
+    assert [m.id for m in reclaimed_messages] == ["0", "1", "2", "3"]
+    assert event_transport.total_reclaimed_messages == 4
+
+
+@pytest.mark.asyncio
+async def test_reclaim_lost_messages_periodically(loop, redis_client, redis_pool, dummy_api):
+    """Messages lost after consumption has started should also be reclaimed"""
+    event_transport = RedisEventTransport(
+        redis_pool=redis_pool,
+        consumer_group_prefix="",
+        consumer_name="good_consumer",
+        acknowledgement_timeout=0.01,
+        reclaim_interval=0.05,
+        stream_use=StreamUse.PER_EVENT,
+    )
+    consumer = event_transport.consume(
+        listen_for=[("my.dummy", "my_event")], since="0", consumer_group="test_group"
+    )
+    messages = []
+
+    async def consume():
+        async for message in consumer:
+            messages.append(message)
+
+    task = asyncio.ensure_future(consume())
+    await asyncio.sleep(0.12)
+
+    # A message is lost by another consumer after the first reclaim has run. Do this
+    # in a transaction so the other consumer receives the message before we do
+    transaction = redis_client.multi_exec()
+    transaction.xadd(
+        "my.dummy.my_event:stream",
+        fields={
+            b"api_name": b"my.dummy",
+            b"event_name": b"my_event",
+            b"id": b"123",
+            b"version": b"1",
+            b":field": b'"value"',
+        },
+    )
+    transaction.xread_group(
+        "test_group", "bad_consumer", ["my.dummy.my_event:stream"], latest_ids=[">"]
+    )
+    await transaction.execute()
+    await asyncio.sleep(0.1)
+    await cancel(task)
+
+    assert [m.id for m in messages] == ["123"]
+
+
 @pytest.mark.asyncio
 async def test_reclaim_lost_messages_ignores_non_timed_out_messages(
     loop, redis_client, redis_pool, dummy_api
@@ -491,8 +704,8 @@ async def test_reclaim_pending_messages(loop, redis_client, redis_pool, dummy_ap
 
     async def consume():
         async for message in consumer:
-            if isinstance(message, EventMessage):
-                messages.append(message)
+            messages.append(message)
+            await event_transport.acknowledge(message)
 
     task = asyncio.ensure_future(consume())
     await asyncio.sleep(0.1)
@@ -535,10 +748,7 @@ async def test_consume_events_create_consumer_group_first(
 
 @pytest.mark.asyncio
 async def test_max_len_truncating(redis_event_transport: RedisEventTransport, redis_client, caplog):
-    """Make sure the event stream gets truncated
-
-    Note that truncation is approximate
-    """
+    """Make sure the event stream gets truncated"""
     caplog.set_level(logging.WARNING)
     redis_event_transport.max_stream_length = 100
     for x in range(0, 200):
@@ -546,9 +756,184 @@ async def test_max_len_truncating(redis_event_transport: RedisEventTransport, re
             EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
             options={},
         )
-    messages = await redis_client.xrange("my.api.my_event:stream")
-    assert len(messages) >= 100
-    assert len(messages) < 150
+    # Publishing does not truncate the stream
+    assert await redis_client.xlen("my.api.my_event:stream") == 200
+
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 100
+    assert await redis_client.xlen("my.api.my_event:stream") == 100
+
+
+@pytest.mark.asyncio
+async def test_max_len_truncating_keeps_unprocessed(
+    redis_event_transport: RedisEventTransport, redis_client
+):
+    """Events must not be removed until every consumer group has processed them"""
+    redis_event_transport.max_stream_length = 100
+    for x in range(0, 200):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+            options={},
+        )
+    message_ids = [id_ for id_, _ in await redis_client.xrange("my.api.my_event:stream")]
+
+    # One group has processed 50 events, and has 30 more in progress
+    await redis_client.xgroup_create("my.api.my_event:stream", "test_group", latest_id="0")
+    await redis_client.xread_group(
+        "test_group", "test_consumer", ["my.api.my_event:stream"], latest_ids=[0], count=80
+    )
+    await redis_client.xack("my.api.my_event:stream", "test_group", *message_ids[:50])
+
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 50
+    remaining = await redis_client.xrange("my.api.my_event:stream", count=1)
+    assert remaining[0][0] == message_ids[50]
+
+    # The group catches up, so the stream can now be truncated fully
+    await redis_client.xread_group(
+        "test_group", "test_consumer", ["my.api.my_event:stream"], latest_ids=[">"], count=200
+    )
+    await redis_client.xack("my.api.my_event:stream", "test_group", *message_ids[50:])
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 50
+    assert await redis_client.xlen("my.api.my_event:stream") == 100
+
+
+@pytest.mark.asyncio
+async def test_max_len_truncating_ignores_abandoned_groups(
+    redis_event_transport: RedisEventTransport, redis_client
+):
+    """Groups without (active) consumers must not prevent the stream being trimmed"""
+    redis_event_transport.max_stream_length = 100
+    for x in range(0, 200):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+            options={},
+        )
+
+    # This group has no consumers
+    await redis_client.xgroup_create("my.api.my_event:stream", "empty_group", latest_id="0")
+    # This group's consumer has processed nothing, and then gone away
+    await redis_client.xgroup_create("my.api.my_event:stream", "idle_group", latest_id="0")
+    await redis_client.xread_group(
+        "idle_group", "test_consumer", ["my.api.my_event:stream"], latest_ids=[">"], count=10
+    )
+
+    redis_event_transport.abandoned_group_timeout = 60
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 0
+
+    await asyncio.sleep(0.05)
+    redis_event_transport.abandoned_group_timeout = 0.01
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 100
+    assert await redis_client.xlen("my.api.my_event:stream") == 100
+
+
+@pytest.mark.asyncio
+async def test_hard_max_len_applied_when_publishing(
+    redis_event_transport: RedisEventTransport, redis_client
+):
+    """Streams are capped upon publishing, even if the retention task never trims them"""
+    assert await redis_event_transport._check_min_id_trimming()
+    redis_event_transport.retention_interval = 0
+    redis_event_transport.hard_max_stream_length = 100
+    for x in range(0, 250):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+            options={},
+        )
+    assert 100 <= await redis_client.xlen("my.api.my_event:stream") < 250
+
+
+@pytest.mark.asyncio
+async def test_max_len_truncating_before_redis_6_2(
+    redis_event_transport: RedisEventTransport, redis_client
+):
+    """Without XTRIM MINID, streams are trimmed approximately as events are published"""
+    assert await redis_event_transport._check_min_id_trimming()
+    redis_event_transport._supports_min_id_trimming = False
+    redis_event_transport.max_stream_length = 100
+    for x in range(0, 250):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+            options={},
+        )
+    assert 100 <= await redis_client.xlen("my.api.my_event:stream") < 250
+
+    # Trimming is also approximate, and does not fail
+    await redis_event_transport.trim_streams(["my.api.my_event:stream"])
+    assert await redis_client.xlen("my.api.my_event:stream") >= 100
+
+
+@pytest.mark.asyncio
+async def test_max_age_truncating(redis_event_transport: RedisEventTransport, redis_client):
+    redis_event_transport.max_stream_length = None
+    redis_event_transport.max_stream_age = 0.05
+    for x in range(0, 10):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+            options={},
+        )
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 0
+
+    await asyncio.sleep(0.1)
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 10
+    assert await redis_client.xlen("my.api.my_event:stream") == 0
+
+
+@pytest.mark.asyncio
+async def test_truncating_periodically(redis_event_transport: RedisEventTransport, redis_client):
+    redis_event_transport.max_stream_length = 5
+    redis_event_transport.retention_interval = 0.05
+    for x in range(0, 10):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+            options={},
+        )
+    assert await redis_client.xlen("my.api.my_event:stream") == 10
+
+    await asyncio.sleep(0.1)
+    assert await redis_client.xlen("my.api.my_event:stream") == 5
+    await redis_event_transport.close()
+
+
+@pytest.mark.asyncio
+async def test_max_len_truncating_in_passes(
+    redis_event_transport: RedisEventTransport, redis_client, mocker
+):
+    """Long streams are trimmed in several bounded passes"""
+    mocker.patch("lightbus.transports.redis.RETENTION_MAX_SCAN", 30)
+    execute_script_spy = mocker.spy(redis_event_transport, "_execute_script")
+    redis_event_transport.max_stream_length = 100
+    for x in range(0, 200):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+            options={},
+        )
+
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 100
+    assert await redis_client.xlen("my.api.my_event:stream") == 100
+    # Positions 30, 30, 30 and then the remaining 10
+    assert [c[1]["args"] for c in execute_script_spy.call_args_list] == [[30], [30], [30], [10]]
+
+
+@pytest.mark.asyncio
+async def test_truncating_periodically_survives_errors(
+    redis_event_transport: RedisEventTransport, redis_client, mocker
+):
+    """An unexpected error while trimming should be logged, not stop the retention task"""
+    redis_event_transport.max_stream_length = 5
+    redis_event_transport.retention_interval = 0.05
+    mocker.patch.object(
+        redis_event_transport,
+        "trim_streams",
+        side_effect=[ValueError("Something went wrong"), 0, 0, 0, 0, 0],
+    )
+    await redis_event_transport.send_event(
+        EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
+        options={},
+    )
+
+    await asyncio.sleep(0.12)
+    assert redis_event_transport.trim_streams.call_count >= 2
+    assert not redis_event_transport._retention_task.done()
+    await redis_event_transport.close()
 
 
 @pytest.mark.asyncio
@@ -565,6 +950,7 @@ async def test_max_len_set_to_none(
             EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "value"}),
             options={},
         )
+    assert await redis_event_transport.trim_streams(["my.api.my_event:stream"]) == 0
     messages = await redis_client.xrange("my.api.my_event:stream")
     assert len(messages) == 200
 
@@ -581,7 +967,7 @@ async def test_consume_events_per_api_stream(
         consumer = redis_event_transport.consume([("my.dummy", event_name)], {})
         async for message_ in consumer:
             event_names.append(message_.event_name)
-            await consumer.__anext__()
+            await redis_event_transport.acknowledge(message_)
 
     task1 = asyncio.ensure_future(co_consume("my_event1"))
     task2 = asyncio.ensure_future(co_consume("my_event2"))
@@ -671,7 +1057,7 @@ async def test_reconnect_while_listening(
         consumer = redis_event_transport.consume([("my.dummy", "my_event")], {})
         async for message_ in consumer:
             total_messages += 1
-            await consumer.__anext__()
+            await redis_event_transport.acknowledge(message_)
 
     enque_task = asyncio.ensure_future(co_enqeue())
     consume_task = asyncio.ensure_future(co_consume())
@@ -684,3 +1070,639 @@ async def test_reconnect_while_listening(
     assert total_messages > 0
 
     await cancel(enque_task, consume_task)
+
+
+async def _add_pending_messages(redis_client, total):
+    """Add messages to a stream, and have them delivered to (but not acked by) a consumer"""
+    message_ids = []
+    for _ in range(0, total):
+        message_id = await redis_client.xadd("my.dummy.my_event:stream", fields={b"a": b"b"})
+        message_ids.append(message_id.decode("utf8"))
+    await redis_client.xgroup_create("my.dummy.my_event:stream", "test_group", latest_id="0")
+    await redis_client.xread_group(
+        "test_group", "test_consumer", ["my.dummy.my_event:stream"], latest_ids=[">"]
+    )
+    return message_ids
+
+
+@pytest.mark.asyncio
+async def test_ack_batched(redis_event_transport: RedisEventTransport, redis_client):
+    """Acks should be sent once the batch size is reached"""
+    redis_event_transport.acknowledgement_batch_size = 2
+    redis_event_transport.acknowledgement_linger = 10
+    message_ids = await _add_pending_messages(redis_client, total=3)
+
+    await redis_event_transport._ack("my.dummy.my_event:stream", "test_group", message_ids[0])
+    total_pending, *_ = await redis_client.xpending("my.dummy.my_event:stream", "test_group")
+    assert total_pending == 3
+
+    await redis_event_transport._ack("my.dummy.my_event:stream", "test_group", message_ids[1])
+    total_pending, *_ = await redis_client.xpending("my.dummy.my_event:stream", "test_group")
+    assert total_pending == 1
+
+    # Remaining acks are flushed upon close
+    await redis_event_transport._ack("my.dummy.my_event:stream", "test_group", message_ids[2])
+    await redis_event_transport.close()
+    total_pending, *_ = await redis_client.xpending("my.dummy.my_event:stream", "test_group")
+    assert total_pending == 0
+
+
+@pytest.mark.asyncio
+async def test_ack_linger(redis_event_transport: RedisEventTransport, redis_client):
+    """Acks should be sent once the linger time has passed, even if the batch is not full"""
+    redis_event_transport.acknowledgement_batch_size = 100
+    redis_event_transport.acknowledgement_linger = 0.05
+    message_ids = await _add_pending_messages(redis_client, total=2)
+
+    for message_id in message_ids:
+        await redis_event_transport._ack("my.dummy.my_event:stream", "test_group", message_id)
+    total_pending, *_ = await redis_client.xpending("my.dummy.my_event:stream", "test_group")
+    assert total_pending == 2
+
+    await asyncio.sleep(0.1)
+    total_pending, *_ = await redis_client.xpending("my.dummy.my_event:stream", "test_group")
+    assert total_pending == 0
+
+
+@pytest.mark.asyncio
+async def test_consume_events_in_flight_window(
+    loop, redis_event_transport: RedisEventTransport, redis_client, dummy_api
+):
+    """No more than max_in_flight messages should be yielded without being acknowledged"""
+    for n in range(0, 5):
+        await redis_client.xadd(
+            "my.dummy.my_event:stream",
+            fields={
+                b"api_name": b"my.dummy",
+                b"event_name": b"my_event",
+                b"id": str(n).encode("utf8"),
+                b"version": b"1",
+                b":field": b'"value"',
+            },
+        )
+
+    consumer = redis_event_transport.consume(
+        [("my.dummy", "my_event")], "test_group", since="0", prefetch=1, max_in_flight=3
+    )
+    messages = []
+
+    async def co_consume():
+        async for message in consumer:
+            messages.append(message)
+
+    task = asyncio.ensure_future(co_consume())
+    await asyncio.sleep(0.1)
+    assert [m.id for m in messages] == ["0", "1", "2"]
+
+    # Acknowledging messages allows more to be consumed
+    await redis_event_transport.acknowledge(*messages[:2])
+    await asyncio.sleep(0.1)
+    await cancel(task)
+    assert [m.id for m in messages] == ["0", "1", "2", "3", "4"]
+
+    await redis_event_transport._flush_acks()
+    total_pending, *_ = await redis_client.xpending(
+        "my.dummy.my_event:stream", "test_cg-test_group"
+    )
+    assert total_pending == 3
+
+
+@pytest.mark.asyncio
+async def test_fields_to_message_prefilters_event_name(
+    redis_event_transport: RedisEventTransport, mocker
+):
+    """Unwanted events on a per-API stream should be skipped without being deserialized"""
+    redis_event_transport.stream_use = StreamUse.PER_API
+    redis_event_transport.deserializer = mocker.Mock(wraps=redis_event_transport.deserializer)
+    fields = {
+        b"api_name": b"my.dummy",
+        b"event_name": b"my_event2",
+        b"id": b"123",
+        b"version": b"1",
+        b":field": b'"value"',
+    }
+
+    message = redis_event_transport._fields_to_message(fields, {"my_event1"}, native_id="1-0")
+    assert message is None
+    assert redis_event_transport.deserializer.call_count == 0
+
+    message = redis_event_transport._fields_to_message(fields, {"my_event2"}, native_id="1-0")
+    assert message.event_name == "my_event2"
+
+
+@pytest.mark.asyncio
+async def test_consume_events_per_api_stream_acks_unwanted(
+    loop, redis_event_transport: RedisEventTransport, redis_client, dummy_api
+):
+    """Events we are not listening for should be acknowledged rather than left pending"""
+    redis_event_transport.stream_use = StreamUse.PER_API
+    consumer = redis_event_transport.consume([("my.dummy", "my_event1")], "test_group", since="0")
+
+    async def co_consume():
+        async for message in consumer:
+            await redis_event_transport.acknowledge(message)
+
+    task = asyncio.ensure_future(co_consume())
+    await asyncio.sleep(0.1)
+    for event_name in (b"my_event1", b"my_event2"):
+        await redis_client.xadd(
+            "my.dummy.*:stream",
+            fields={
+                b"api_name": b"my.dummy",
+                b"event_name": event_name,
+                b"id": b"1",
+                b"version": b"1",
+                b":field": b'"value"',
+            },
+        )
+    await asyncio.sleep(0.2)
+    await cancel(task)
+
+    total_pending, *_ = await redis_client.xpending("my.dummy.*:stream", "test_cg-test_group")
+    assert total_pending == 0
+
+
+@pytest.mark.asyncio
+async def test_history(redis_event_transport: RedisEventTransport):
+    for x, event_name in enumerate(
+        ["my_event1", "my_event2", "my_event1", "my_event2", "my_event1"]
+    ):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name=event_name, id=str(x)), options={}
+        )
+    listen_for = [("my.api", "my_event1"), ("my.api", "my_event2")]
+
+    # Events from both streams are merged in order, and small pages are used to test paging
+    messages = redis_event_transport.history(listen_for, batch_size=2)
+    assert [m.id async for m in messages] == ["0", "1", "2", "3", "4"]
+
+    messages = redis_event_transport.history(listen_for, reverse=True, batch_size=2)
+    assert [m.id async for m in messages] == ["4", "3", "2", "1", "0"]
+
+    messages = redis_event_transport.history([("my.api", "my_event2")], batch_size=1)
+    assert [m.id async for m in messages] == ["1", "3"]
+
+    messages = redis_event_transport.history([("my.api", "my_event1")], reverse=True, batch_size=1)
+    messages = [m async for m in messages]
+    assert [m.id for m in messages] == ["4", "2", "0"]
+    # Native IDs are strings, as when consuming
+    assert all(isinstance(m.native_id, str) for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_history_since_until(redis_event_transport: RedisEventTransport):
+    times = []
+    for x in range(0, 3):
+        times.append(datetime.now())
+        await asyncio.sleep(0.01)
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", id=str(x)), options={}
+        )
+
+    messages = redis_event_transport.history(
+        [("my.api", "my_event")], since=times[1], until=times[2]
+    )
+    assert [m.id async for m in messages] == ["1"]
+
+    messages = redis_event_transport.history([("my.api", "my_event")], since=times[1])
+    assert [m.id async for m in messages] == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_history_per_api_stream(redis_event_transport: RedisEventTransport):
+    redis_event_transport.stream_use = StreamUse.PER_API
+    for x, event_name in enumerate(["my_event1", "my_event2", "my_event1"]):
+        await redis_event_transport.send_event(
+            EventMessage(api_name="my.api", event_name=event_name, id=str(x)), options={}
+        )
+
+    messages = redis_event_transport.history([("my.api", "my_event1")])
+    assert [m.id async for m in messages] == ["0", "2"]
+
+
+async def _add_events(redis_client, total, stream="my.dummy.my_event:stream"):
+    for x in range(0, total):
+        await redis_client.xadd(
+            stream,
+            fields={
+                b"api_name": b"my.dummy",
+                b"event_name": b"my_event",
+                b"id": str(x).encode("utf8"),
+                b"version": b"1",
+                b":field": b'"value"',
+            },
+        )
+        # Spread the events over time, so they fall into different segments
+        await asyncio.sleep(0.002)
+
+
+@pytest.mark.asyncio
+async def test_consume_replay(loop, redis_event_transport: RedisEventTransport, redis_client):
+    await _add_events(redis_client, 20)
+    redis_event_transport.batch_size = 3
+    received = []
+
+    async def co_consume():
+        consumer = redis_event_transport.consume(
+            [("my.dummy", "my_event")], "cg", since="0", replay_segments=4
+        )
+        async for message_ in consumer:
+            received.append(message_.id)
+            await redis_event_transport.acknowledge(message_)
+
+    task = asyncio.ensure_future(co_consume())
+    await asyncio.sleep(0.2)
+    assert sorted(received, key=int) == [str(x) for x in range(0, 20)]
+    assert not await redis_client.exists("my.dummy.my_event:stream:test_cg-cg:replay")
+
+    # The replay is complete, so new events are consumed as normal
+    await redis_client.xadd(
+        "my.dummy.my_event:stream",
+        fields={
+            b"api_name": b"my.dummy",
+            b"event_name": b"my_event",
+            b"id": b"20",
+            b"version": b"1",
+            b":field": b'"value"',
+        },
+    )
+    await asyncio.sleep(0.1)
+    await cancel(task)
+    assert received[-1] == "20"
+    assert len(received) == 21
+
+
+@pytest.mark.asyncio
+async def test_consume_replay_resumes(
+    loop, redis_event_transport: RedisEventTransport, redis_client
+):
+    await _add_events(redis_client, 20)
+    redis_event_transport.batch_size = 5
+    received = []
+
+    async def co_consume(acknowledge_up_to):
+        consumer = redis_event_transport.consume(
+            [("my.dummy", "my_event")], "cg", since="0", replay_segments=1
+        )
+        async for message_ in consumer:
+            received.append(message_.id)
+            if int(message_.id) < acknowledge_up_to:
+                await redis_event_transport.acknowledge(message_)
+
+    # Only the first page is fully processed before the replay is interrupted
+    task = asyncio.ensure_future(co_consume(acknowledge_up_to=7))
+    await asyncio.sleep(0.1)
+    await cancel(task)
+    assert received == [str(x) for x in range(0, 10)]
+
+    # The replay resumes from the second page
+    received = []
+    task = asyncio.ensure_future(co_consume(acknowledge_up_to=20))
+    await asyncio.sleep(0.1)
+    await cancel(task)
+    assert received == [str(x) for x in range(5, 20)]
+
+
+@pytest.mark.asyncio
+async def test_replay_segment_keeps_lock_taken_by_others(
+    loop, redis_event_transport: RedisEventTransport, redis_client
+):
+    """A lock which expired and was taken by another consumer must not be deleted"""
+    await _add_events(redis_client, 3)
+    replay_key = "my.dummy.my_event:stream:test_cg-cg:replay"
+    lock_key = f"{replay_key}:lock:0"
+    await redis_client.hset(replay_key, "0", json.dumps(["0-1", "+"]))
+
+    async def enqueue(message, stream):
+        await redis_client.set(lock_key, "other_consumer")
+        acknowledged = asyncio.Future()
+        acknowledged.set_result(None)
+        return acknowledged
+
+    assert await redis_event_transport._replay_segment(
+        "my.dummy.my_event:stream", "0", "test_cg-cg", {"my_event"}, enqueue
+    )
+    assert await redis_client.get(lock_key) == b"other_consumer"
+
+
+@pytest.mark.asyncio
+async def test_truncating_keeps_events_to_replay(
+    loop, redis_event_transport: RedisEventTransport, redis_client
+):
+    """Events yet to be replayed into a new consumer group must not be removed"""
+    await _add_events(redis_client, 20)
+    message_ids = [id_ for id_, _ in await redis_client.xrange("my.dummy.my_event:stream")]
+    redis_event_transport.max_stream_length = 5
+
+    # The group is created at the end of the stream, and has a segment left to replay
+    await redis_client.xgroup_create("my.dummy.my_event:stream", "test_cg-cg", latest_id="$")
+    await redis_client.hset(
+        "my.dummy.my_event:stream:test_cg-cg:replay",
+        "0",
+        json.dumps([decode(message_ids[10], "utf8"), decode(message_ids[-1], "utf8")]),
+    )
+
+    assert await redis_event_transport.trim_streams(["my.dummy.my_event:stream"]) == 10
+    remaining = await redis_client.xrange("my.dummy.my_event:stream", count=1)
+    assert remaining[0][0] == message_ids[10]
+
+
+@pytest.mark.asyncio
+async def test_get_lag(loop, redis_event_transport: RedisEventTransport, redis_client):
+    listen_for = [("my.dummy", "my_event")]
+    assert await redis_event_transport.get_lag(listen_for) == {"my.dummy.my_event": {}}
+
+    await _add_events(redis_client, 5)
+    await redis_client.xgroup_create("my.dummy.my_event:stream", "test_group", latest_id="0")
+    await redis_client.xread_group(
+        "test_group", "test_consumer", ["my.dummy.my_event:stream"], latest_ids=[">"], count=2
+    )
+
+    lag = await redis_event_transport.get_lag(listen_for)
+    group_lag = lag["my.dummy.my_event"]["test_group"]
+    assert group_lag["pending"] == 2
+    # Older versions of Redis cannot report the number of waiting events
+    assert group_lag["waiting"] in (3, None)
+    assert group_lag["consumers"] == 1
+    assert 0 < group_lag["oldest_pending_age"] < 1
+
+
+@pytest.mark.asyncio
+async def test_delete_consumer_group(
+    loop, redis_event_transport: RedisEventTransport, redis_client
+):
+    await _add_events(redis_client, 1)
+    await redis_client.xgroup_create("my.dummy.my_event:stream", "test_cg-test_group")
+    await redis_client.xgroup_create("my.dummy.my_event:stream", "test_cg-other_group")
+
+    await redis_event_transport.delete_consumer_group([("my.dummy", "my_event")], "test_group")
+    groups = await redis_client.execute(b"XINFO", b"GROUPS", "my.dummy.my_event:stream")
+    assert [dict(zip(g[::2], g[1::2]))[b"name"] for g in groups] == [b"test_cg-other_group"]
+
+    # Streams which do not exist are ignored
+    await redis_event_transport.delete_consumer_group([("my.dummy", "other_event")], "test_group")
+
+
+async def _reclaim_failed_events(redis_client, redis_pool, total, max_deliveries=1):
+    """Add events which have been delivered once to a failing consumer, then reclaim them"""
+    await _add_events(redis_client, total)
+    await redis_client.xgroup_create("my.dummy.my_event:stream", "test_group", latest_id="0")
+    await redis_client.xread_group(
+        "test_group", "bad_consumer", ["my.dummy.my_event:stream"], latest_ids=[">"]
+    )
+    await asyncio.sleep(0.02)
+
+    event_transport = RedisEventTransport(
+        redis_pool=redis_pool,
+        consumer_group_prefix="test_group",
+        consumer_name="good_consumer",
+        acknowledgement_timeout=0.01,
+        max_deliveries=max_deliveries,
+        stream_use=StreamUse.PER_EVENT,
+    )
+    reclaimer = event_transport._reclaim_lost_messages(
+        stream_names=["my.dummy.my_event:stream"],
+        consumer_group="test_group",
+        expected_events={"my_event"},
+    )
+    return event_transport, [m async for m, stream in reclaimer]
+
+
+@pytest.mark.asyncio
+async def test_reclaim_dead_letters(loop, redis_client, redis_pool, dummy_api):
+    """Messages delivered max_deliveries times are moved to the dead letter stream"""
+    event_transport, reclaimed = await _reclaim_failed_events(redis_client, redis_pool, 2)
+
+    assert reclaimed == []
+    assert event_transport.total_dead_lettered_messages == 2
+    assert await redis_client.xlen("my.dummy:dead_letters") == 2
+    pending = await redis_client.xpending("my.dummy.my_event:stream", "test_group")
+    assert pending[0] == 0
+
+    dead_letters = await event_transport.get_dead_letters("my.dummy")
+    assert len(dead_letters) == 2
+    assert dead_letters[0]["event_message"].id == "0"
+    assert dead_letters[0]["event_message"].kwargs == {"field": "value"}
+    assert dead_letters[0]["stream"] == "my.dummy.my_event:stream"
+    assert dead_letters[0]["consumer_group"] == "test_group"
+    assert dead_letters[0]["consumer"] == "bad_consumer"
+    assert dead_letters[0]["deliveries"] == 1
+
+    dead_letters = await event_transport.get_dead_letters("my.dummy", count=1)
+    assert [d["event_message"].id for d in dead_letters] == ["0"]
+
+
+@pytest.mark.asyncio
+async def test_reclaim_dead_letters_under_limit(loop, redis_client, redis_pool, dummy_api):
+    """Messages which have not yet reached max_deliveries are reclaimed as normal"""
+    event_transport, reclaimed = await _reclaim_failed_events(
+        redis_client, redis_pool, 1, max_deliveries=2
+    )
+    assert len(reclaimed) == 1
+    assert not await redis_client.exists("my.dummy:dead_letters")
+
+
+@pytest.mark.asyncio
+async def test_requeue_dead_letters(loop, redis_client, redis_pool, dummy_api):
+    event_transport, _ = await _reclaim_failed_events(redis_client, redis_pool, 5)
+
+    assert await event_transport.requeue_dead_letters("my.dummy", batch_size=2) == 5
+    assert await redis_client.xlen("my.dummy:dead_letters") == 0
+
+    # The requeued events are only delivered to the group which failed to process them
+    requeued = await redis_client.xrange("my.dummy.my_event:stream", start="-", stop="+")
+    requeued = requeued[-5:]
+    messages = [
+        event_transport._fields_to_message(
+            fields, {"my_event"}, native_id=message_id, consumer_group="test_group"
+        )
+        for message_id, fields in requeued
+    ]
+    assert [m.id for m in messages] == ["0", "1", "2", "3", "4"]
+    assert not event_transport._fields_to_message(
+        requeued[0][1], {"my_event"}, native_id=requeued[0][0], consumer_group="other_group"
+    )
+
+
+@pytest.mark.asyncio
+async def test_requeue_dead_letters_by_id(loop, redis_client, redis_pool, dummy_api):
+    event_transport, _ = await _reclaim_failed_events(redis_client, redis_pool, 3)
+    dead_letters = await event_transport.get_dead_letters("my.dummy")
+
+    total = await event_transport.requeue_dead_letters("my.dummy", ids=[dead_letters[1]["id"]])
+    assert total == 1
+    remaining = await event_transport.get_dead_letters("my.dummy")
+    assert [d["event_message"].id for d in remaining] == ["0", "2"]
+
+
+@pytest.fixture
+def sharded_event_transport(redis_client, server):
+    host, port = redis_client.address
+    shard_urls = [f"redis://127.0.0.1:{port}/{db}" for db in (1, 2, 3)]
+    return RedisEventTransport(
+        consumer_group_prefix="test_cg",
+        consumer_name="test_consumer",
+        shard_urls=shard_urls,
+        shard_mapping={"my.api": shard_urls[2]},
+        stream_use=StreamUse.PER_API,
+    )
+
+
+async def _shard_keys(transport, url):
+    with await transport._shards[url].connection_manager() as redis:
+        return sorted(decode(key, "utf8") for key in await redis.keys("*"))
+
+
+@pytest.mark.asyncio
+async def test_sharding_placement(sharded_event_transport: RedisEventTransport):
+    transport = sharded_event_transport
+    url_1, url_2, url_3 = transport.shard_urls
+
+    # Explicitly mapped
+    assert transport._get_shard("my.api").url == url_3
+    # Consistently hashed, with all of an API's streams on the same shard
+    assert transport._get_shard("other.api").url in (url_1, url_2, url_3)
+    assert transport._get_shard("other.api") is transport._get_shard("other.api")
+    assert transport._get_shard(transport._get_api_name("other.api.*:stream")) is (
+        transport._get_shard("other.api")
+    )
+
+
+@pytest.mark.asyncio
+async def test_sharding_invalid_mapping(redis_client):
+    with pytest.raises(UnsupportedOptionValue):
+        RedisEventTransport(
+            consumer_group_prefix="test_cg",
+            consumer_name="test_consumer",
+            shard_urls=["redis://127.0.0.1:6379/1"],
+            shard_mapping={"my.api": "redis://127.0.0.1:6379/2"},
+        )
+
+
+@pytest.mark.asyncio
+async def test_sharding_send_and_consume(loop, sharded_event_transport: RedisEventTransport):
+    transport = sharded_event_transport
+    other_url = transport._get_shard("other.api").url
+
+    received = []
+
+    async def co_receive():
+        consumer = transport.consume([("my.api", "my_event"), ("other.api", "my_event")], "cg")
+        async for message_ in consumer:
+            received.append(message_)
+            await transport.acknowledge(message_)
+
+    task = asyncio.ensure_future(co_receive())
+    await asyncio.sleep(0.1)
+
+    await transport.send_event(
+        EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "a"}), options={}
+    )
+    await transport.send_events(
+        [
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": "b"}),
+            EventMessage(api_name="other.api", event_name="my_event", kwargs={"field": "c"}),
+        ],
+        options={},
+    )
+    await asyncio.sleep(0.1)
+    await cancel(task)
+
+    assert sorted(m.kwargs["field"] for m in received) == ["a", "b", "c"]
+    assert "my.api.*:stream" in await _shard_keys(transport, transport.shard_urls[2])
+    assert "other.api.*:stream" in await _shard_keys(transport, other_url)
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_sharding_send_events_atomic(sharded_event_transport: RedisEventTransport):
+    transport = sharded_event_transport
+    transport.shard_mapping["other.api"] = transport.shard_urls[0]
+    with pytest.raises(UnsupportedOptionValue):
+        await transport.send_events(
+            [
+                EventMessage(api_name="my.api", event_name="my_event"),
+                EventMessage(api_name="other.api", event_name="my_event"),
+            ],
+            options={"atomic": True},
+        )
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_move_stream(loop, sharded_event_transport: RedisEventTransport):
+    transport = sharded_event_transport
+    url_1, url_2, url_3 = transport.shard_urls
+    transport.batch_size = 3
+
+    for x in range(0, 10):
+        await transport.send_event(
+            EventMessage(api_name="my.api", event_name="my_event", kwargs={"field": x}), options={}
+        )
+    with await transport._shards[url_3].connection_manager() as redis:
+        message_ids = [message_id for message_id, _ in await redis.xrange("my.api.*:stream")]
+        await redis.xgroup_create("my.api.*:stream", "test_cg-cg", latest_id="0")
+        # Six events are delivered, but only the first two and the fourth are acknowledged
+        delivered = await redis.xread_group(
+            "test_cg-cg", "test_consumer", ["my.api.*:stream"], latest_ids=[">"], count=6
+        )
+        acknowledged = [m for _, m, _ in delivered[:2]] + [delivered[3][1]]
+        await redis.xack("my.api.*:stream", "test_cg-cg", *acknowledged)
+        await redis.hset("my.api.*:stream:test_cg-cg:replay", "0", '["0-1", "1-0"]')
+
+    assert await transport.move_stream("my.api.*:stream", url_3, url_1, batch_size=4) == 10
+    assert await _shard_keys(transport, url_3) == []
+
+    with await transport._shards[url_1].connection_manager() as redis:
+        moved = [message_id for message_id, _ in await redis.xrange("my.api.*:stream")]
+        assert moved == message_ids
+        # The group keeps its position, and its pending events keep their consumer
+        pending = await redis.xpending("my.api.*:stream", "test_cg-cg", "-", "+", count=10)
+        assert [(m, c) for m, c, *_ in pending] == [
+            (message_ids[2], b"test_consumer"),
+            (message_ids[4], b"test_consumer"),
+            (message_ids[5], b"test_consumer"),
+        ]
+        consumers = await redis.execute(b"XINFO", b"CONSUMERS", "my.api.*:stream", "test_cg-cg")
+        assert len(consumers) == 1
+        assert await redis.hgetall("my.api.*:stream:test_cg-cg:replay") == {
+            b"0": b'["0-1", "1-0"]'
+        }
+        await redis.delete("my.api.*:stream:test_cg-cg:replay")
+
+    # Only the unacknowledged events are delivered again on the new shard
+    transport.shard_mapping["my.api"] = url_1
+    consumer = transport.consume([("my.api", "my_event")], "cg", forever=False)
+    received = []
+    async for message_ in consumer:
+        received.append(message_.kwargs["field"])
+        await transport.acknowledge(message_)
+        if len(received) == 7:
+            break
+    assert received == [2, 4, 5, 6, 7, 8, 9]
+
+    # Moving onto a shard which already has the stream fails
+    with await transport._shards[url_2].connection_manager() as redis:
+        await redis.xadd("my.api.*:stream", fields={"": ""})
+    with pytest.raises(StreamAlreadyExists):
+        await transport.move_stream("my.api.*:stream", url_1, url_2)
+    await transport.close()
+
+
+def test_cluster_stream_names():
+    """In cluster mode, an API's streams and dead letters must share a hash slot"""
+    transport = RedisEventTransport(
+        consumer_group_prefix="test_cg",
+        consumer_name="test",
+        stream_use=StreamUse.PER_EVENT,
+        cluster=True,
+    )
+    stream = transport._get_stream_names([("my.api", "my_event")])[0]
+    assert stream == "{my.api}.my_event:stream"
+    assert transport._get_api_name(stream) == "my.api"
+    assert transport._get_dead_letter_stream_name("my.api") == "{my.api}:dead_letters"
+
+    transport.stream_use = StreamUse.PER_API
+    stream = transport._get_stream_names([("my.api", "my_event")])[0]
+    assert stream == "{my.api}.*:stream"
+    assert transport._get_api_name(stream) == "my.api"
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from uuid import UUID
 
@@ -10,7 +11,7 @@ from lightbus.serializers import (
     ByFieldMessageSerializer,
     ByFieldMessageDeserializer,
 )
-from lightbus.transports.redis import RedisResultTransport
+from lightbus.transports.redis import RedisResultTransport, ResultMode, redis_key_slot
 
 
 pytestmark = pytest.mark.unit
@@ -63,6 +64,83 @@ async def test_send_result(redis_result_transport: RedisResultTransport, redis_c
     }
 
 
+@pytest.mark.asyncio
+async def test_send_results(redis_result_transport: RedisResultTransport, redis_client):
+    rpc_message = RpcMessage(
+        id="123abc", api_name="my.api", procedure_name="my_proc", kwargs={"field": "value"}
+    )
+    await redis_result_transport.send_results(
+        [
+            (
+                rpc_message,
+                ResultMessage(id="345", rpc_message_id="123abc", result="a"),
+                "redis+key://my.api.my_proc:result:a",
+            ),
+            (
+                rpc_message,
+                ResultMessage(id="678", rpc_message_id="123abc", result="b"),
+                "redis+key://my.api.my_proc:result:b",
+            ),
+        ]
+    )
+    assert set(await redis_client.keys("*")) == {
+        b"my.api.my_proc:result:a",
+        b"my.api.my_proc:result:b",
+    }
+    assert json.loads(await redis_client.lpop("my.api.my_proc:result:a"))["kwargs"] == {
+        "result": "a"
+    }
+    assert json.loads(await redis_client.lpop("my.api.my_proc:result:b"))["kwargs"] == {
+        "result": "b"
+    }
+    assert await redis_client.ttl("my.api.my_proc:result:a") > 0
+
+
+@pytest.mark.asyncio
+async def test_abandon(redis_result_transport: RedisResultTransport, redis_client):
+    """Results should not be sent for abandoned calls"""
+    rpc_message = RpcMessage(
+        id="123abc", api_name="my.api", procedure_name="my_proc", kwargs={"field": "value"}
+    )
+    return_path = redis_result_transport.get_return_path(rpc_message)
+    await redis_result_transport.abandon(rpc_message, return_path)
+    assert await redis_client.exists("rpc_abandoned:123abc")
+
+    await redis_result_transport.send_results(
+        [
+            (
+                rpc_message,
+                ResultMessage(id="345", rpc_message_id="123abc", result="a"),
+                return_path,
+            ),
+            (
+                RpcMessage(id="456def", api_name="my.api", procedure_name="my_proc", kwargs={}),
+                ResultMessage(id="678", rpc_message_id="456def", result="b"),
+                "redis+key://my.api.my_proc:result:b",
+            ),
+        ]
+    )
+    assert set(await redis_client.keys("*")) == {
+        b"rpc_abandoned:123abc",
+        b"my.api.my_proc:result:b",
+    }
+
+
+@pytest.mark.asyncio
+async def test_abandon_removes_result(redis_result_transport: RedisResultTransport, redis_client):
+    """A result which arrived just as the call was abandoned should be removed"""
+    rpc_message = RpcMessage(
+        id="123abc", api_name="my.api", procedure_name="my_proc", kwargs={"field": "value"}
+    )
+    return_path = redis_result_transport.get_return_path(rpc_message)
+    await redis_result_transport.send_result(
+        rpc_message, ResultMessage(id="345", rpc_message_id="123abc", result="a"), return_path
+    )
+
+    await redis_result_transport.abandon(rpc_message, return_path)
+    assert await redis_client.keys("*") == [b"rpc_abandoned:123abc"]
+
+
 @pytest.mark.asyncio
 async def test_receive_result(redis_result_transport: RedisResultTransport, redis_client):
 
@@ -93,6 +171,195 @@ async def test_receive_result(redis_result_transport: RedisResultTransport, redi
     assert result_message.error == False
 
 
+@pytest.mark.asyncio
+async def test_receive_result_many_small_pool(new_redis_pool):
+    """Waiting for more results than there are connections should not starve the senders"""
+    transport = RedisResultTransport(redis_pool=new_redis_pool(maxsize=4))
+    rpc_messages = [
+        RpcMessage(id=str(n), api_name="my.api", procedure_name="my_proc", kwargs={})
+        for n in range(0, 10)
+    ]
+    receive_tasks = [
+        asyncio.ensure_future(
+            transport.receive_result(m, transport.get_return_path(m), options={})
+        )
+        for m in rpc_messages
+    ]
+    await asyncio.sleep(0.1)
+
+    await asyncio.wait_for(
+        transport.send_results(
+            [
+                (m, ResultMessage(rpc_message_id=m.id, result=m.id), transport.get_return_path(m))
+                for m in rpc_messages
+            ]
+        ),
+        timeout=1,
+    )
+    results = await asyncio.wait_for(asyncio.gather(*receive_tasks), timeout=1)
+    assert [r.result for r in results] == [m.id for m in rpc_messages]
+
+
+@pytest.mark.asyncio
+async def test_get_return_path_per_process(redis_result_transport: RedisResultTransport):
+    redis_result_transport.result_mode = ResultMode.PER_PROCESS
+    return_path1 = redis_result_transport.get_return_path(
+        RpcMessage(api_name="my.api", procedure_name="my_proc", kwargs={})
+    )
+    return_path2 = redis_result_transport.get_return_path(
+        RpcMessage(api_name="my.api", procedure_name="other_proc", kwargs={})
+    )
+    assert return_path1.startswith("redis+key://result_queue:")
+    assert return_path1 == return_path2
+
+
+@pytest.mark.asyncio
+async def test_receive_result_per_process(
+    redis_result_transport: RedisResultTransport, redis_client, get_total_redis_connections
+):
+    """Results for many calls should be received on a single key and dispatched by ID"""
+    redis_result_transport.result_mode = ResultMode.PER_PROCESS
+    rpc_messages = [
+        RpcMessage(id=str(n), api_name="my.api", procedure_name="my_proc", kwargs={})
+        for n in range(0, 20)
+    ]
+    return_paths = [redis_result_transport.get_return_path(m) for m in rpc_messages]
+    reply_key = return_paths[0][12:]
+
+    receive_tasks = [
+        asyncio.ensure_future(
+            redis_result_transport.receive_result(rpc_message, return_path, options={})
+        )
+        for rpc_message, return_path in zip(rpc_messages, return_paths)
+    ]
+    await asyncio.sleep(0.1)
+
+    # Results arrive in reverse order, along with a result nobody is waiting for
+    for n in ["unknown"] + list(reversed(range(0, 20))):
+        await redis_client.lpush(
+            reply_key,
+            json.dumps(
+                {
+                    "metadata": {"rpc_message_id": str(n), "error": False, "id": f"r{n}"},
+                    "kwargs": {"result": f"result {n}"},
+                }
+            ),
+        )
+
+    result_messages = await asyncio.gather(*receive_tasks)
+    assert [m.result for m in result_messages] == [f"result {n}" for n in range(0, 20)]
+    # The test's redis client, plus the transport's single reply reader
+    assert await get_total_redis_connections() == 2
+    assert not redis_result_transport._get_reply_futures()
+
+    await redis_result_transport.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_result_per_process_early(
+    redis_result_transport: RedisResultTransport, redis_client
+):
+    """Results which arrive before the caller starts waiting should be kept for them"""
+    redis_result_transport.result_mode = ResultMode.PER_PROCESS
+    rpc_messages = [
+        RpcMessage(id=str(n), api_name="my.api", procedure_name="my_proc", kwargs={})
+        for n in range(0, 2)
+    ]
+    return_path = redis_result_transport.get_return_path(rpc_messages[0])
+    # Getting the return path does not register a caller, as the call may yet fail
+    assert not redis_result_transport._get_reply_futures()
+
+    # Start the reply reader by waiting for the first call, then the
+    # result for the second call arrives before anything waits for it
+    receive_task = asyncio.ensure_future(
+        redis_result_transport.receive_result(rpc_messages[0], return_path, options={})
+    )
+    await asyncio.sleep(0.05)
+    for n in [1, 0]:
+        await redis_client.lpush(
+            return_path[12:],
+            json.dumps(
+                {
+                    "metadata": {"rpc_message_id": str(n), "error": False, "id": f"r{n}"},
+                    "kwargs": {"result": f"result {n}"},
+                }
+            ),
+        )
+    assert (await receive_task).result == "result 0"
+
+    result_message = await redis_result_transport.receive_result(
+        rpc_messages[1], return_path, options={}
+    )
+    assert result_message.result == "result 1"
+    assert not redis_result_transport._get_reply_futures()
+    assert len(redis_result_transport._get_early_results()) == 0
+
+    await redis_result_transport.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_result_per_process_timeout(redis_result_transport: RedisResultTransport):
+    """Callers which stop waiting should not leave their future behind"""
+    redis_result_transport.result_mode = ResultMode.PER_PROCESS
+    rpc_message = RpcMessage(id="123abc", api_name="my.api", procedure_name="my_proc", kwargs={})
+    return_path = redis_result_transport.get_return_path(rpc_message)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            redis_result_transport.receive_result(rpc_message, return_path, options={}), timeout=0.1
+        )
+    assert not redis_result_transport._get_reply_futures()
+
+    await redis_result_transport.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_result_per_process_late_and_duplicate(
+    redis_result_transport: RedisResultTransport, redis_client
+):
+    """Results which nobody will collect should be discarded rather than kept"""
+    redis_result_transport.result_mode = ResultMode.PER_PROCESS
+    rpc_messages = [
+        RpcMessage(id=str(n), api_name="my.api", procedure_name="my_proc", kwargs={})
+        for n in range(0, 2)
+    ]
+    return_path = redis_result_transport.get_return_path(rpc_messages[0])
+
+    async def send_result(n):
+        await redis_client.lpush(
+            return_path[12:],
+            json.dumps(
+                {
+                    "metadata": {"rpc_message_id": str(n), "error": False, "id": f"r{n}"},
+                    "kwargs": {"result": f"result {n}"},
+                }
+            ),
+        )
+
+    # The first call times out, and the second receives its result
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            redis_result_transport.receive_result(rpc_messages[0], return_path, options={}),
+            timeout=0.05,
+        )
+    receive_task = asyncio.ensure_future(
+        redis_result_transport.receive_result(rpc_messages[1], return_path, options={})
+    )
+    await asyncio.sleep(0.05)
+    await send_result(1)
+    assert (await receive_task).result == "result 1"
+
+    # A late result for the first call, and a duplicate result for the second
+    await send_result(0)
+    await send_result(1)
+    await asyncio.sleep(0.05)
+    assert len(redis_result_transport._get_early_results()) == 0
+    assert not redis_result_transport._get_reply_futures()
+    assert redis_result_transport._local.reply_reader
+
+    await redis_result_transport.close()
+
+
 @pytest.mark.asyncio
 async def test_from_config(redis_client):
     await redis_client.select(5)
@@ -104,6 +371,7 @@ async def test_from_config(redis_client):
         # Non default serializers, event though they wouldn't make sense in this context
         serializer="lightbus.serializers.ByFieldMessageSerializer",
         deserializer="lightbus.serializers.ByFieldMessageDeserializer",
+        result_mode="per_process",
     )
     with await transport.connection_manager() as transport_client:
         assert transport_client.connection.address == ("127.0.0.1", port)
@@ -114,3 +382,14 @@ async def test_from_config(redis_client):
     assert transport._local.redis_pool.connection.maxsize == 123
     assert isinstance(transport.serializer, ByFieldMessageSerializer)
     assert isinstance(transport.deserializer, ByFieldMessageDeserializer)
+    assert transport.result_mode == ResultMode.PER_PROCESS
+
+
+def test_cluster_abandoned_key():
+    """In cluster mode, the abandoned key must share a hash slot with the result key"""
+    transport = RedisResultTransport(cluster=True)
+    rpc_message = RpcMessage(id="123abc", api_name="my.api", procedure_name="my_proc", kwargs={})
+    return_path = transport.get_return_path(rpc_message)
+    abandoned_key = transport._get_abandoned_key(rpc_message, return_path)
+    assert abandoned_key == "{my.api.my_proc:result:123abc}:rpc_abandoned:123abc"
+    assert redis_key_slot(abandoned_key) == redis_key_slot("my.api.my_proc:result:123abc")
@@ -5,6 +5,7 @@ import logging
 import pytest
 
 from lightbus import RedisRpcTransport
+from lightbus.exceptions import UnsupportedOptionValue
 from lightbus.message import RpcMessage
 from lightbus.serializers import BlobMessageSerializer, BlobMessageDeserializer
 from lightbus.utilities.async import cancel
@@ -31,11 +32,11 @@ async def test_call_rpc(redis_rpc_transport, redis_client):
         return_path="abc",
     )
     await redis_rpc_transport.call_rpc(rpc_message, options={})
-    assert set(await redis_client.keys("*")) == {b"my.api:rpc_queue", b"rpc_expiry_key:123abc"}
+    assert set(await redis_client.keys("*")) == {b"my.api:rpc_queue", b"rpc_message:123abc"}
 
-    messages = await redis_client.lrange("my.api:rpc_queue", start=0, stop=100)
-    assert len(messages) == 1
-    message = json.loads(messages[0])
+    message_ids = await redis_client.lrange("my.api:rpc_queue", start=0, stop=100)
+    assert message_ids == [b"123abc"]
+    message = json.loads(await redis_client.get("rpc_message:123abc"))
     assert message == {
         "metadata": {
             "id": "123abc",
@@ -45,34 +46,33 @@ async def test_call_rpc(redis_rpc_transport, redis_client):
         },
         "kwargs": {"field": "value"},
     }
-    assert await redis_client.exists("rpc_expiry_key:123abc")
-    assert await redis_client.ttl("rpc_expiry_key:123abc") == redis_rpc_transport.rpc_timeout
+    assert await redis_client.ttl("rpc_message:123abc") == redis_rpc_transport.rpc_timeout
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_scripts_flushed(redis_rpc_transport, redis_client):
+    """Lua scripts should be reloaded if Redis has forgotten about them"""
+    await redis_rpc_transport.open()
+    await redis_client.script_flush()
+
+    rpc_message = RpcMessage(
+        id="123abc", api_name="my.api", procedure_name="my_proc", kwargs={"field": "value"}
+    )
+    await redis_rpc_transport.call_rpc(rpc_message, options={})
+    assert await redis_client.lrange("my.api:rpc_queue", start=0, stop=100) == [b"123abc"]
 
 
 @pytest.mark.asyncio
 async def test_consume_rpcs_no_expiry_key(redis_client, redis_rpc_transport, dummy_api):
-    """Does call_rpc() add a message to a stream, but where the expiry key is missing
+    """Does call_rpc() add a message to a stream, but where the message key has expired
 
     Transport should assume that the RPC call has timed out and therefore not serve it.
     """
 
     async def co_enqeue():
         await asyncio.sleep(0.01)
-        # NOT SETTING rpc_expiry_key:123abc
-        return await redis_client.rpush(
-            "my.dummy:rpc_queue",
-            value=json.dumps(
-                {
-                    "metadata": {
-                        "id": "123abc",
-                        "api_name": "my.api",
-                        "procedure_name": "my_proc",
-                        "return_path": "abc",
-                    },
-                    "kwargs": {"field": "value"},
-                }
-            ),
-        )
+        # NOT SETTING rpc_message:123abc
+        return await redis_client.rpush("my.dummy:rpc_queue", value="123abc")
 
     async def co_consume():
         return await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
@@ -86,10 +86,9 @@ async def test_consume_rpcs(redis_client, redis_rpc_transport, dummy_api):
 
     async def co_enqeue():
         await asyncio.sleep(0.01)
-        await redis_client.set("rpc_expiry_key:123abc", 1)
-        return await redis_client.rpush(
-            "my.dummy:rpc_queue",
-            value=json.dumps(
+        await redis_client.set(
+            "rpc_message:123abc",
+            json.dumps(
                 {
                     "metadata": {
                         "id": "123abc",
@@ -101,6 +100,7 @@ async def test_consume_rpcs(redis_client, redis_rpc_transport, dummy_api):
                 }
             ),
         )
+        return await redis_client.rpush("my.dummy:rpc_queue", value="123abc")
 
     async def co_consume():
         return await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
@@ -114,6 +114,203 @@ async def test_consume_rpcs(redis_client, redis_rpc_transport, dummy_api):
     assert message.return_path == "abc"
 
 
+@pytest.mark.asyncio
+async def test_consume_rpcs_batch(redis_client, redis_rpc_transport, dummy_api):
+    """Calls already in the queue should be consumed in a single batch"""
+    redis_rpc_transport.batch_size = 3
+
+    for n in range(0, 5):
+        await redis_client.set(
+            f"rpc_message:{n}",
+            json.dumps(
+                {
+                    "metadata": {
+                        "id": str(n),
+                        "api_name": "my.api",
+                        "procedure_name": "my_proc",
+                        "return_path": "abc",
+                    },
+                    "kwargs": {"field": "value"},
+                }
+            ),
+        )
+        await redis_client.rpush("my.dummy:rpc_queue", value=str(n))
+
+    messages = await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["0", "1", "2"]
+    assert await redis_client.llen("my.dummy:rpc_queue") == 2
+
+    messages = await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["3", "4"]
+    assert not await redis_client.keys("rpc_message:*")
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_legacy_format(redis_client, redis_rpc_transport, dummy_api):
+    """Calls queued by the previous release (whole call plus an expiry key) are still consumed"""
+
+    def legacy_call(id):
+        return json.dumps(
+            {
+                "metadata": {
+                    "id": id,
+                    "api_name": "my.api",
+                    "procedure_name": "my_proc",
+                    "return_path": "abc",
+                },
+                "kwargs": {"field": "value"},
+            }
+        )
+
+    # A live legacy call, an expired legacy call, and a call in the current format
+    await redis_client.set("rpc_expiry_key:live", 1)
+    await redis_client.rpush("my.dummy:rpc_queue", value=legacy_call("live"))
+    await redis_client.rpush("my.dummy:rpc_queue", value=legacy_call("expired"))
+    await redis_rpc_transport.call_rpc(
+        RpcMessage(id="new", api_name="my.dummy", procedure_name="my_proc", kwargs={}),
+        options={},
+    )
+
+    messages = await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["live", "new"]
+    assert messages[0].kwargs == {"field": "value"}
+    assert not await redis_client.keys("rpc_expiry_key:*")
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_batch_discards_expired(redis_client, redis_rpc_transport, dummy_api):
+    """Expired calls within a batch should be discarded, leaving the remainder"""
+    for n in range(0, 3):
+        if n != 1:
+            # Call number 1 has no message key, and has therefore timed out
+            await redis_client.set(
+                f"rpc_message:{n}",
+                json.dumps(
+                    {
+                        "metadata": {
+                            "id": str(n),
+                            "api_name": "my.api",
+                            "procedure_name": "my_proc",
+                            "return_path": "abc",
+                        },
+                        "kwargs": {"field": "value"},
+                    }
+                ),
+            )
+        await redis_client.rpush("my.dummy:rpc_queue", value=str(n))
+
+    messages = await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["0", "2"]
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_priority(redis_rpc_transport, redis_client):
+    """Calls should be placed in the queue for their priority"""
+    redis_rpc_transport.priority_levels = 3
+    for priority in (0, 2):
+        await redis_rpc_transport.call_rpc(
+            RpcMessage(id=str(priority), api_name="my.api", procedure_name="my_proc", kwargs={}),
+            options={"priority": priority},
+        )
+    assert await redis_client.lrange("my.api:rpc_queue", start=0, stop=100) == [b"0"]
+    assert await redis_client.lrange("my.api:rpc_queue:2", start=0, stop=100) == [b"2"]
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_invalid_priority(redis_rpc_transport):
+    rpc_message = RpcMessage(id="1", api_name="my.api", procedure_name="my_proc", kwargs={})
+    with pytest.raises(UnsupportedOptionValue):
+        await redis_rpc_transport.call_rpc(rpc_message, options={"priority": 1})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("priority", [1.0, True, "1"])
+async def test_call_rpc_priority_not_int(redis_rpc_transport, priority):
+    redis_rpc_transport.priority_levels = 3
+    rpc_message = RpcMessage(id="1", api_name="my.api", procedure_name="my_proc", kwargs={})
+    with pytest.raises(UnsupportedOptionValue):
+        await redis_rpc_transport.call_rpc(rpc_message, options={"priority": priority})
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_priority(redis_rpc_transport, dummy_api):
+    """Higher priority calls should be consumed first"""
+    redis_rpc_transport.priority_levels = 3
+    redis_rpc_transport.batch_size = 1
+    for n, priority in enumerate([0, 1, 2, 0, 2]):
+        await redis_rpc_transport.call_rpc(
+            RpcMessage(id=str(n), api_name="my.dummy", procedure_name="my_proc", kwargs={}),
+            options={"priority": priority},
+        )
+
+    consumed = []
+    for _ in range(0, 5):
+        messages = await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
+        consumed.extend(m.id for m in messages)
+    assert consumed == ["2", "4", "1", "0", "3"]
+
+
+@pytest.mark.asyncio
+async def test_cancel(redis_client, redis_rpc_transport, dummy_api):
+    """Cancelled calls should be discarded rather than consumed"""
+    for n in range(0, 2):
+        await redis_rpc_transport.call_rpc(
+            RpcMessage(id=str(n), api_name="my.dummy", procedure_name="my_proc", kwargs={}),
+            options={},
+        )
+
+    await redis_rpc_transport.cancel(
+        RpcMessage(id="0", api_name="my.dummy", procedure_name="my_proc", kwargs={})
+    )
+    assert not await redis_client.exists("rpc_message:0")
+
+    messages = await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_call_rpcs(redis_client, redis_rpc_transport, dummy_api):
+    # Ensure the enqueue script needs to be reloaded within the pipeline
+    await redis_client.script_flush()
+    await redis_rpc_transport.call_rpcs(
+        [
+            RpcMessage(id=str(n), api_name="my.dummy", procedure_name="my_proc", kwargs={})
+            for n in range(0, 3)
+        ],
+        options={},
+    )
+    assert await redis_client.llen("my.dummy:rpc_queue") == 3
+
+    messages = await redis_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_call_rpcs_invalid_priority(redis_client, redis_rpc_transport):
+    """No calls should be enqueued if any are invalid"""
+    rpc_message = RpcMessage(id="1", api_name="my.api", procedure_name="my_proc", kwargs={})
+    with pytest.raises(UnsupportedOptionValue):
+        await redis_rpc_transport.call_rpcs([rpc_message], options={"priority": 1})
+    assert not await redis_client.exists("my.api:rpc_queue")
+
+
+@pytest.mark.asyncio
+async def test_get_backlog(redis_client, redis_rpc_transport):
+    redis_rpc_transport.priority_levels = 2
+    assert await redis_rpc_transport.get_backlog(["my.api"]) == {
+        "my.api": {"pending": None, "waiting": 0}
+    }
+
+    for priority in (0, 1, 1):
+        rpc_message = RpcMessage(api_name="my.api", procedure_name="my_proc", kwargs={})
+        await redis_rpc_transport.call_rpc(rpc_message, options={"priority": priority})
+
+    assert await redis_rpc_transport.get_backlog(["my.api", "my.other_api"]) == {
+        "my.api": {"pending": None, "waiting": 3},
+        "my.other_api": {"pending": None, "waiting": 0},
+    }
+
+
 @pytest.mark.asyncio
 async def test_from_config(redis_client):
     await redis_client.select(5)
@@ -123,6 +320,7 @@ async def test_from_config(redis_client):
         url=f"redis://127.0.0.1:{port}/5",
         connection_parameters=dict(maxsize=123),
         batch_size=123,
+        priority_levels=3,
         # Non default serializers, event though they wouldn't make sense in this context
         serializer="lightbus.serializers.BlobMessageSerializer",
         deserializer="lightbus.serializers.BlobMessageDeserializer",
@@ -134,6 +332,7 @@ async def test_from_config(redis_client):
         assert await redis_client.get("x")
 
     assert transport._local.redis_pool.connection.maxsize == 123
+    assert transport.priority_levels == 3
     assert isinstance(transport.serializer, BlobMessageSerializer)
     assert isinstance(transport.deserializer, BlobMessageDeserializer)
 
@@ -155,9 +354,8 @@ async def test_consume_rpcs_only_once(redis_client, dummy_api, redis_pool):
     consumer2 = asyncio.ensure_future(co_consume(transport2))
     await asyncio.sleep(0.1)
 
-    await redis_client.set("rpc_expiry_key:123abc", 1)
-    await redis_client.rpush(
-        "my.dummy:rpc_queue",
+    await redis_client.set(
+        "rpc_message:123abc",
         json.dumps(
             {
                 "metadata": {
@@ -170,12 +368,13 @@ async def test_consume_rpcs_only_once(redis_client, dummy_api, redis_pool):
             }
         ),
     )
+    await redis_client.rpush("my.dummy:rpc_queue", value="123abc")
     await asyncio.sleep(0.1)
 
     await cancel(consumer1, consumer2)
     assert message_count == 1
 
-    assert not await redis_client.exists("rpc_expiry_key:123abc")
+    assert not await redis_client.exists("rpc_message:123abc")
 
 
 @pytest.mark.asyncio
@@ -193,7 +392,7 @@ async def test_reconnect_upon_call_rpc(redis_rpc_transport, redis_client):
         return_path="abc",
     )
     await redis_rpc_transport.call_rpc(rpc_message, options={})
-    assert set(await redis_client.keys("*")) == {b"my.api:rpc_queue", b"rpc_expiry_key:123abc"}
+    assert set(await redis_client.keys("*")) == {b"my.api:rpc_queue", b"rpc_message:123abc"}
 
     messages = await redis_client.lrange("my.api:rpc_queue", start=0, stop=100)
     assert len(messages) == 1
@@ -206,10 +405,9 @@ async def test_reconnect_upon_consume_rpcs(loop, redis_client, redis_rpc_transpo
     async def co_enqeue():
         while True:
             await asyncio.sleep(0.01)
-            await redis_client.set("rpc_expiry_key:123abc", 1)
-            await redis_client.rpush(
-                "my.dummy:rpc_queue",
-                value=json.dumps(
+            await redis_client.set(
+                "rpc_message:123abc",
+                json.dumps(
                     {
                         "metadata": {
                             "id": "123abc",
@@ -221,6 +419,7 @@ async def test_reconnect_upon_consume_rpcs(loop, redis_client, redis_rpc_transpo
                     }
                 ),
             )
+            await redis_client.rpush("my.dummy:rpc_queue", value="123abc")
 
     total_messages = 0
 
@@ -241,3 +440,15 @@ async def test_reconnect_upon_consume_rpcs(loop, redis_client, redis_rpc_transpo
     assert total_messages > 0
 
     await cancel(enque_task, consume_task)
+
+
+def test_cluster_key_names():
+    """In cluster mode, an API's queues and messages must share a hash slot"""
+    transport = RedisRpcTransport(priority_levels=2, cluster=True)
+    assert transport._get_queue_key("my.api", 0) == "{my.api}:rpc_queue"
+    assert transport._get_queue_key("my.api", 1) == "{my.api}:rpc_queue:1"
+    assert transport._get_message_key("my.api", "123abc") == "{my.api}:rpc_message:123abc"
+
+    transport = RedisRpcTransport(priority_levels=2)
+    assert transport._get_queue_key("my.api", 1) == "my.api:rpc_queue:1"
+    assert transport._get_message_key("my.api", "123abc") == "rpc_message:123abc"
@@ -0,0 +1,292 @@
+import asyncio
+import time
+
+import pytest
+
+from lightbus import RedisStreamRpcTransport
+from lightbus.message import RpcMessage
+from lightbus.serializers import BlobMessageSerializer, BlobMessageDeserializer
+from lightbus.utilities.async import cancel
+
+pytestmark = pytest.mark.unit
+
+
+def make_rpc_message(id="123abc"):
+    return RpcMessage(
+        id=id,
+        api_name="my.dummy",
+        procedure_name="my_proc",
+        kwargs={"field": "value"},
+        return_path="abc",
+    )
+
+
+@pytest.mark.asyncio
+async def test_call_rpc(redis_stream_rpc_transport, redis_client):
+    """Does call_rpc() add a message to a stream"""
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(), options={})
+    assert await redis_client.keys("*") == [b"my.dummy:rpc_stream"]
+
+    messages = await redis_client.xrange("my.dummy:rpc_stream")
+    assert len(messages) == 1
+    _, fields = messages[0]
+    assert fields == {
+        b"id": b"123abc",
+        b"api_name": b"my.dummy",
+        b"procedure_name": b"my_proc",
+        b"return_path": b"abc",
+        b":field": b'"value"',
+    }
+
+
+@pytest.mark.asyncio
+async def test_call_rpcs(redis_stream_rpc_transport, redis_client):
+    rpc_messages = [make_rpc_message(id="a"), make_rpc_message(id="b")]
+    await redis_stream_rpc_transport.call_rpcs(rpc_messages, options={})
+
+    messages = await redis_client.xrange("my.dummy:rpc_stream")
+    assert [fields[b"id"] for _, fields in messages] == [b"a", b"b"]
+    # The stream IDs are stored on the messages so they can be cancelled
+    assert [m.native_id for m in rpc_messages] == [
+        message_id.decode("utf8") for message_id, _ in messages
+    ]
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs(redis_stream_rpc_transport, dummy_api):
+
+    async def co_enqueue():
+        await asyncio.sleep(0.1)
+        await redis_stream_rpc_transport.call_rpc(make_rpc_message(), options={})
+
+    async def co_consume():
+        return await redis_stream_rpc_transport.consume_rpcs(apis=[dummy_api])
+
+    _, messages = await asyncio.gather(co_enqueue(), co_consume())
+    message = messages[0]
+    assert message.id == "123abc"
+    assert message.api_name == "my.dummy"
+    assert message.procedure_name == "my_proc"
+    assert message.kwargs == {"field": "value"}
+    assert message.return_path == "abc"
+    assert message.native_id
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_batch(redis_stream_rpc_transport, redis_client, dummy_api):
+    """Calls waiting in the stream should be consumed in batches"""
+    redis_stream_rpc_transport.batch_size = 3
+    await redis_client.xadd("my.dummy:rpc_stream", fields={"": ""})
+    await redis_client.xgroup_create("my.dummy:rpc_stream", "rpc_consumers", latest_id="0")
+
+    for n in range(0, 5):
+        await redis_stream_rpc_transport.call_rpc(make_rpc_message(id=str(n)), options={})
+
+    messages = await redis_stream_rpc_transport.consume_rpcs(apis=[dummy_api])
+    # The noop message which created the stream is discarded, leaving two calls
+    assert [m.id for m in messages] == ["0", "1"]
+    messages = await redis_stream_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_discards_expired(redis_stream_rpc_transport, redis_client, dummy_api):
+    """Calls older than the rpc timeout should be discarded and acknowledged"""
+    # A call made well before the rpc timeout, followed by a current call
+    expired_id = "{}-0".format(int((time.time() - 60) * 1000))
+    await redis_client.xadd(
+        "my.dummy:rpc_stream",
+        fields=redis_stream_rpc_transport.serializer(make_rpc_message(id="old")),
+        message_id=expired_id,
+    )
+    await redis_client.xgroup_create("my.dummy:rpc_stream", "rpc_consumers", latest_id="0")
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(id="new"), options={})
+
+    messages = await redis_stream_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["new"]
+
+    # Only the call we are processing remains pending
+    pending = await redis_client.xpending("my.dummy:rpc_stream", "rpc_consumers")
+    assert pending[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_call_before_consumer(redis_stream_rpc_transport, dummy_api):
+    """Calls made before any consumer has started should still be consumed"""
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(), options={})
+    messages = await redis_stream_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["123abc"]
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_creates_group_once(redis_stream_rpc_transport, dummy_api, mocker):
+    """The consumer group should only be created on the first consume"""
+    create_spy = mocker.spy(redis_stream_rpc_transport, "_create_consumer_groups")
+    for n in range(0, 3):
+        await redis_stream_rpc_transport.call_rpc(make_rpc_message(id=str(n)), options={})
+        await redis_stream_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert create_spy.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_group_deleted(redis_stream_rpc_transport, redis_client, dummy_api):
+    """The consumer group should be created again if it is deleted"""
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(id="1"), options={})
+    await redis_stream_rpc_transport.consume_rpcs(apis=[dummy_api])
+    await redis_client.delete("my.dummy:rpc_stream")
+
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(id="2"), options={})
+    messages = await redis_stream_rpc_transport.consume_rpcs(apis=[dummy_api])
+    assert [m.id for m in messages] == ["2"]
+
+
+@pytest.mark.asyncio
+async def test_acknowledge(redis_stream_rpc_transport, redis_client, dummy_api):
+    consume_task = asyncio.ensure_future(redis_stream_rpc_transport.consume_rpcs([dummy_api]))
+    await asyncio.sleep(0.1)
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(), options={})
+    messages = await consume_task
+
+    pending = await redis_client.xpending("my.dummy:rpc_stream", "rpc_consumers")
+    assert pending[0] == 1
+
+    await redis_stream_rpc_transport.acknowledge(*messages)
+    pending = await redis_client.xpending("my.dummy:rpc_stream", "rpc_consumers")
+    assert pending[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel(redis_stream_rpc_transport, redis_client, dummy_api):
+    """Cancelled calls should be removed from the stream"""
+    rpc_message = make_rpc_message()
+    await redis_stream_rpc_transport.call_rpc(rpc_message, options={})
+    assert rpc_message.native_id
+
+    await redis_stream_rpc_transport.cancel(rpc_message)
+    assert await redis_client.xrange("my.dummy:rpc_stream") == []
+
+
+@pytest.mark.asyncio
+async def test_reclaim_lost_calls(redis_pool, redis_client, dummy_api):
+    """Calls not acknowledged by a failed consumer should be executed by another consumer"""
+    transport1 = RedisStreamRpcTransport(
+        redis_pool=redis_pool, consumer_name="consumer1", acknowledgement_timeout=0.1
+    )
+    transport2 = RedisStreamRpcTransport(
+        redis_pool=redis_pool, consumer_name="consumer2", acknowledgement_timeout=0.1
+    )
+
+    consume_task = asyncio.ensure_future(transport1.consume_rpcs([dummy_api]))
+    await asyncio.sleep(0.1)
+    await transport1.call_rpc(make_rpc_message(), options={})
+    # Consumer 1 receives the message, but dies without acknowledging it
+    assert [m.id for m in await consume_task] == ["123abc"]
+
+    await asyncio.sleep(0.2)
+    messages = await transport2.consume_rpcs([dummy_api])
+    assert [m.id for m in messages] == ["123abc"]
+
+    pending = await redis_client.xpending("my.dummy:rpc_stream", "rpc_consumers", "-", "+", 10)
+    assert [consumer_name for _, consumer_name, _, _ in pending] == [b"consumer2"]
+
+
+@pytest.mark.asyncio
+async def test_slow_call_executed_once(redis_pool, redis_client, dummy_api):
+    """Calls which are still being executed should not be reclaimed by another consumer"""
+    transport1 = RedisStreamRpcTransport(
+        redis_pool=redis_pool, consumer_name="consumer1", rpc_timeout=0.5
+    )
+    transport2 = RedisStreamRpcTransport(
+        redis_pool=redis_pool, consumer_name="consumer2", rpc_timeout=0.5
+    )
+    assert transport2.acknowledgement_timeout == 0.5
+
+    consume_task = asyncio.ensure_future(transport1.consume_rpcs([dummy_api]))
+    await asyncio.sleep(0.1)
+    await transport1.call_rpc(make_rpc_message(), options={})
+    messages = await consume_task
+    assert [m.id for m in messages] == ["123abc"]
+
+    # Consumer 1 takes a while to execute the call, during which
+    # consumer 2 should not receive it
+    consume_task = asyncio.ensure_future(transport2.consume_rpcs([dummy_api]))
+    await asyncio.sleep(0.3)
+    assert not consume_task.done()
+    await transport1.acknowledge(*messages)
+    await cancel(consume_task)
+
+    pending = await redis_client.xpending("my.dummy:rpc_stream", "rpc_consumers")
+    assert pending[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_only_once(redis_client, dummy_api, redis_pool):
+    """Ensure that an RPC call gets consumed only once even with multiple consumers"""
+    message_count = 0
+
+    transport1 = RedisStreamRpcTransport(redis_pool=redis_pool, consumer_name="consumer1")
+    transport2 = RedisStreamRpcTransport(redis_pool=redis_pool, consumer_name="consumer2")
+
+    async def co_consume(transport):
+        nonlocal message_count
+        messages = await transport.consume_rpcs(apis=[dummy_api])
+        message_count += len(messages)
+
+    consumer1 = asyncio.ensure_future(co_consume(transport1))
+    consumer2 = asyncio.ensure_future(co_consume(transport2))
+    await asyncio.sleep(0.1)
+
+    await transport1.call_rpc(make_rpc_message(), options={})
+    await asyncio.sleep(0.1)
+
+    await cancel(consumer1, consumer2)
+    assert message_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_backlog(redis_stream_rpc_transport, dummy_api):
+    # No calls made yet
+    assert await redis_stream_rpc_transport.get_backlog(["my.dummy"]) == {
+        "my.dummy": {"pending": 0, "waiting": 0}
+    }
+
+    consume_task = asyncio.ensure_future(redis_stream_rpc_transport.consume_rpcs([dummy_api]))
+    await asyncio.sleep(0.1)
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(id="1"), options={})
+    await consume_task
+
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(id="2"), options={})
+    await redis_stream_rpc_transport.call_rpc(make_rpc_message(id="3"), options={})
+
+    backlog = await redis_stream_rpc_transport.get_backlog(["my.dummy"])
+    assert backlog["my.dummy"]["pending"] == 1
+    # Older versions of Redis cannot report the number of waiting calls
+    assert backlog["my.dummy"]["waiting"] in (2, None)
+
+
+@pytest.mark.asyncio
+async def test_from_config(redis_client):
+    await redis_client.select(5)
+    host, port = redis_client.address
+    transport = RedisStreamRpcTransport.from_config(
+        config=None,
+        consumer_name="test_consumer",
+        url=f"redis://127.0.0.1:{port}/5",
+        connection_parameters=dict(maxsize=123),
+        batch_size=123,
+        acknowledgement_timeout=1.5,
+        # Non default serializers, event though they wouldn't make sense in this context
+        serializer="lightbus.serializers.BlobMessageSerializer",
+        deserializer="lightbus.serializers.BlobMessageDeserializer",
+    )
+    with await transport.connection_manager() as transport_client:
+        assert transport_client.connection.address == ("127.0.0.1", port)
+        assert transport_client.connection.db == 5
+        await transport_client.set("x", 1)
+        assert await redis_client.get("x")
+
+    assert transport._local.redis_pool.connection.maxsize == 123
+    assert transport.batch_size == 123
+    assert transport.acknowledgement_timeout == 1.5
+    assert isinstance(transport.serializer, BlobMessageSerializer)
+    assert isinstance(transport.deserializer, BlobMessageDeserializer)
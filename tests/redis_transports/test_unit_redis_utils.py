@@ -1,8 +1,17 @@
 from datetime import datetime
 
 import pytest
+from aioredis import ReplyError
 
-from lightbus.transports.redis import redis_stream_id_subtract_one, redis_steam_id_to_datetime
+from lightbus.transports.redis import (
+    redis_stream_id_subtract_one,
+    redis_stream_id_previous,
+    redis_steam_id_to_datetime,
+    redis_key_slot,
+    parse_cluster_redirect,
+    RedisEventTransport,
+    InvalidRedisPool,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -13,6 +22,12 @@ def test_redis_stream_id_subtract_one():
     assert redis_stream_id_subtract_one("0000000000000-0") == "0000000000000-0"
 
 
+def test_redis_stream_id_previous():
+    assert redis_stream_id_previous("1514028809812-10") == "1514028809812-9"
+    assert redis_stream_id_previous(b"1514028809812-0") == "1514028809811-18446744073709551615"
+    assert redis_stream_id_previous("0-0") is None
+
+
 def test_redis_steam_id_to_datetime():
     assert redis_steam_id_to_datetime("0000000000000-0") == datetime(1970, 1, 1, 0, 0)
     assert redis_steam_id_to_datetime("0000000000000-1") == datetime(1970, 1, 1, 0, 0, 0, 1)
@@ -20,3 +35,44 @@ def test_redis_steam_id_to_datetime():
         2017, 12, 23, 11, 33, 29, 812010
     )
     assert redis_steam_id_to_datetime(b"0000000000000-0") == datetime(1970, 1, 1, 0, 0)
+
+
+def test_redis_key_slot():
+    assert redis_key_slot("foo") == 12182
+    assert redis_key_slot(b"foo") == 12182
+    # Only the hash tag is hashed
+    assert redis_key_slot("{foo}:bar") == 12182
+    assert redis_key_slot("{foo}:bar") == redis_key_slot("{foo}:baz")
+    # Empty hash tags are ignored, in which case the whole key is hashed
+    assert redis_key_slot("{}foo") != redis_key_slot("foo")
+
+
+def test_cluster_with_redis_pool():
+    with pytest.raises(InvalidRedisPool):
+        RedisEventTransport(
+            redis_pool=object(), consumer_group_prefix="test_cg", consumer_name="test", cluster=True
+        )
+
+
+def test_group_by_slot():
+    transport = RedisEventTransport(
+        consumer_group_prefix="test_cg", consumer_name="test", cluster=True
+    )
+    groups = transport._group_by_slot(["{a}:1", "{b}:1", "{a}:2"])
+    assert groups == [["{a}:1", "{a}:2"], ["{b}:1"]]
+
+    transport = RedisEventTransport(consumer_group_prefix="test_cg", consumer_name="test")
+    assert transport._group_by_slot(["{a}:1", "{b}:1", "{a}:2"]) == [["{a}:1", "{b}:1", "{a}:2"]]
+    assert transport._group_by_slot([]) == []
+
+
+def test_parse_cluster_redirect():
+    assert parse_cluster_redirect(ReplyError("MOVED 3999 127.0.0.1:6381")) == (
+        False,
+        ("127.0.0.1", 6381),
+    )
+    assert parse_cluster_redirect(ReplyError("ASK 3999 10.0.0.2:7000")) == (
+        True,
+        ("10.0.0.2", 7000),
+    )
+    assert parse_cluster_redirect(ReplyError("ERR unknown command")) is None
@@ -349,6 +349,17 @@ async def test_validate_parameters_event_invalid(schema, TestApi):
         schema.validate_parameters("my.test_api", "my_event", {"field": 123})
 
 
+@pytest.mark.asyncio
+async def test_validate_parameters_event_subset(schema, TestApi):
+    await schema.add_api(TestApi())
+    # The invalid (and required) field is ignored as it was not requested
+    schema.validate_parameters("my.test_api", "my_event", {"field": 123}, parameter_names=[])
+    with pytest.raises(ValidationError):
+        schema.validate_parameters(
+            "my.test_api", "my_event", {"field": 123}, parameter_names=["field"]
+        )
+
+
 @pytest.mark.asyncio
 async def test_validate_response_valid(schema, TestApi):
     await schema.add_api(TestApi())
@@ -1,6 +1,9 @@
+import json
+
 import pytest
 
 from lightbus.message import EventMessage
+from lightbus.serializers import LazyKwargs
 from lightbus.serializers.by_field import ByFieldMessageSerializer, ByFieldMessageDeserializer
 
 pytestmark = pytest.mark.unit
@@ -61,3 +64,54 @@ def test_by_field_deserializer_empty_keys_and_values():
     assert message.kwargs == {"field": "value"}
     assert message.version == 2
     assert message.native_id == "456"
+
+
+def test_by_field_deserializer_lazy_kwargs(mocker):
+    decoder = mocker.Mock(side_effect=json.loads)
+    deserializer = ByFieldMessageDeserializer(EventMessage, decoder=decoder)
+    message = deserializer(
+        {
+            "api_name": "my.api",
+            "event_name": "my_event",
+            "id": "123",
+            "version": "2",
+            ":field": '"value"',
+            ":other": '{"a": 1}',
+        }
+    )
+    assert isinstance(message.kwargs, LazyKwargs)
+    assert set(message.kwargs) == {"field", "other"}
+    assert decoder.call_count == 0
+
+    assert message.kwargs["field"] == "value"
+    assert message.kwargs["field"] == "value"
+    assert decoder.call_count == 1
+    assert not message.kwargs.is_decoded("other")
+
+
+def test_by_field_deserialized_message_round_trip():
+    deserializer = ByFieldMessageDeserializer(EventMessage)
+    serializer = ByFieldMessageSerializer()
+    message = deserializer(
+        {
+            "api_name": "my.api",
+            "event_name": "my_event",
+            "id": "123",
+            "version": "2",
+            ":field": '"value"',
+            ":other": '{"a": 1}',
+        }
+    )
+
+    # Re-sending the received message as-is
+    serialized = serializer(message)
+    assert serialized[":field"] == '"value"'
+    assert json.loads(serialized[":other"]) == {"a": 1}
+
+    # Nesting the received kwargs within another message (as the metrics plugin does)
+    serialized = serializer(
+        EventMessage(
+            api_name="my.api", event_name="nested", kwargs={"kwargs": message.kwargs}, id="456"
+        )
+    )
+    assert json.loads(serialized[":kwargs"]) == {"field": "value", "other": {"a": 1}}
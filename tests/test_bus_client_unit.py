@@ -9,7 +9,8 @@ import lightbus.creation
 import lightbus.path
 from lightbus import Schema, RpcMessage, ResultMessage, EventMessage, BusClient
 from lightbus.config import Config
-from lightbus.config.structure import OnError
+from lightbus.config.structure import OnError, RpcCacheConfig
+from lightbus.utilities.async import cancel
 from lightbus.exceptions import (
     UnknownApi,
     EventNotFound,
@@ -18,6 +19,7 @@ from lightbus.exceptions import (
     TransportNotFound,
     InvalidName,
     ValidationError,
+    LightbusTimeout,
 )
 
 pytestmark = pytest.mark.unit
@@ -86,6 +88,32 @@ async def test_listen_for_event_starts_with_underscore(dummy_bus: lightbus.path.
         )
 
 
+@pytest.mark.asyncio
+async def test_fire_events_many(dummy_bus: lightbus.path.BusPath, dummy_api, mocker):
+    event_transport = dummy_bus.client.transport_registry.get_event_transport("default")
+    mocker.spy(event_transport, "send_events")
+
+    await dummy_bus.client.fire_events_many(
+        [("my.dummy", "my_event", {"field": 1}), ("my.dummy", "my_event", {"field": 2})]
+    )
+    assert event_transport.send_events.call_count == 1
+    event_messages = event_transport.send_events.call_args[0][0]
+    assert [m.kwargs for m in event_messages] == [{"field": 1}, {"field": 2}]
+
+
+@pytest.mark.asyncio
+async def test_fire_events_many_invalid(dummy_bus: lightbus.path.BusPath, dummy_api, mocker):
+    """No events should be sent if any are invalid"""
+    event_transport = dummy_bus.client.transport_registry.get_event_transport("default")
+    mocker.spy(event_transport, "send_events")
+
+    with pytest.raises(InvalidEventArguments):
+        await dummy_bus.client.fire_events_many(
+            [("my.dummy", "my_event", {"field": 1}), ("my.dummy", "my_event", {"bad_arg": 2})]
+        )
+    assert event_transport.send_events.call_count == 0
+
+
 @pytest.mark.asyncio
 async def test_fire_event_starts_with_underscore(dummy_bus: lightbus.path.BusPath, dummy_api):
     with pytest.raises(InvalidName):
@@ -156,6 +184,338 @@ async def test_no_transport_type():
         await client.call_rpc_remote("my_api", "test", kwargs={}, options={})
 
 
+@pytest.mark.asyncio
+async def test_call_rpc_remote_cached(dummy_bus: lightbus.path.BusPath, mocker):
+    dummy_bus.client.config.api("default").rpc_cache = {"my_proc": RpcCacheConfig(ttl=60)}
+    rpc_transport = dummy_bus.client.transport_registry.get_rpc_transport("default")
+    mocker.spy(rpc_transport, "call_rpc")
+
+    result1 = await dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={"field": 1})
+    result2 = await dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={"field": 1})
+    assert result1 == result2 == "Fake result"
+    assert rpc_transport.call_rpc.call_count == 1
+
+    # Different kwargs are cached separately
+    await dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={"field": 2})
+    assert rpc_transport.call_rpc.call_count == 2
+
+    # Other procedures are not cached
+    await dummy_bus.client.call_rpc_remote("my.dummy", "other_proc", kwargs={})
+    await dummy_bus.client.call_rpc_remote("my.dummy", "other_proc", kwargs={})
+    assert rpc_transport.call_rpc.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_remote_coalesced(dummy_bus: lightbus.path.BusPath, mocker):
+    dummy_bus.client.config.api("default").coalesce_rpcs = True
+    rpc_transport = dummy_bus.client.transport_registry.get_rpc_transport("default")
+    mocker.spy(rpc_transport, "call_rpc")
+
+    results = await asyncio.gather(
+        *[
+            dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={"field": 1})
+            for _ in range(0, 5)
+        ],
+        dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={"field": 2}),
+    )
+    assert results == ["Fake result"] * 6
+    assert rpc_transport.call_rpc.call_count == 2
+    assert not dummy_bus.client._rpc_calls_in_flight
+
+    # Calls which are not concurrent are not coalesced
+    await dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={"field": 1})
+    assert rpc_transport.call_rpc.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_remote_coalesced_results_copied(
+    dummy_bus: lightbus.path.BusPath, mocker
+):
+    """Each caller should receive its own copy of a shared result"""
+    dummy_bus.client.config.api("default").coalesce_rpcs = True
+
+    async def call_rpc_remote(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return {"n": 1}
+
+    mocker.patch.object(dummy_bus.client, "_call_rpc_remote", call_rpc_remote)
+
+    async def call_and_mutate():
+        result = await dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={})
+        result["n"] = 999
+        return result
+
+    async def call_later():
+        # Join the call once the originator has made it. The originator will then
+        # receive (and mutate) its result before the joiner copies the result
+        await asyncio.sleep(0)
+        return await dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={})
+
+    originator_result, joiner_result = await asyncio.gather(call_and_mutate(), call_later())
+    assert originator_result == {"n": 999}
+    assert joiner_result == {"n": 1}
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_remote_coalesced_cancelled(dummy_bus: lightbus.path.BusPath):
+    """Cancelling one caller should not affect the others sharing the call"""
+    dummy_bus.client.config.api("default").coalesce_rpcs = True
+
+    call1 = asyncio.ensure_future(
+        dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={"field": 1})
+    )
+    call2 = asyncio.ensure_future(
+        dummy_bus.client.call_rpc_remote("my.dummy", "my_proc", kwargs={"field": 1})
+    )
+    await asyncio.sleep(0.01)
+    call1.cancel()
+    assert await call2 == "Fake result"
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_many(dummy_bus: lightbus.path.BusPath, mocker):
+    rpc_transport = dummy_bus.client.transport_registry.get_rpc_transport("default")
+    mocker.spy(rpc_transport, "call_rpcs")
+
+    results = await dummy_bus.client.call_rpc_many(
+        [("my.dummy", "my_proc", {"field": 1}), ("my.dummy", "other_proc", {})]
+    )
+    assert results == ["Fake result", "Fake result"]
+    # Both calls were sent to the transport in a single batch
+    assert rpc_transport.call_rpcs.call_count == 1
+    rpc_messages = rpc_transport.call_rpcs.call_args[0][0]
+    assert [m.canonical_name for m in rpc_messages] == ["my.dummy.my_proc", "my.dummy.other_proc"]
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_many_timeout(dummy_bus: lightbus.path.BusPath):
+    # The debug result transport takes 0.1 seconds to return a result
+    with pytest.raises(LightbusTimeout):
+        await dummy_bus.client.call_rpc_many(
+            [("my.dummy", "my_proc", {})], options={"timeout": 0.01}
+        )
+
+    results = await dummy_bus.client.call_rpc_many(
+        [("my.dummy", "my_proc", {})], options={"timeout": 0.01}, return_exceptions=True
+    )
+    assert len(results) == 1
+    assert isinstance(results[0], LightbusTimeout)
+
+
+@pytest.mark.asyncio
+async def test_call_rpc_timeout_cleanup_error(dummy_bus: lightbus.path.BusPath, mocker):
+    """Errors while cleaning up after a timeout must not hide the timeout"""
+    rpc_transport = dummy_bus.client.transport_registry.get_rpc_transport("default")
+    result_transport = dummy_bus.client.transport_registry.get_result_transport("default")
+
+    async def fail(*args, **kwargs):
+        raise ConnectionError("Cleanup failed")
+
+    mocker.patch.object(rpc_transport, "cancel", fail)
+    mocker.patch.object(result_transport, "abandon", fail)
+
+    with pytest.raises(LightbusTimeout):
+        await dummy_bus.client.call_rpc_remote(
+            "my.dummy", "my_proc", kwargs={}, options={"timeout": 0.01}
+        )
+
+    results = await dummy_bus.client.call_rpc_many(
+        [("my.dummy", "my_proc", {}), ("my.dummy", "my_proc", {})],
+        options={"timeout": 0.01},
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, LightbusTimeout) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_call_many_async(dummy_bus: lightbus.path.BusPath):
+    results = await dummy_bus.my.dummy.my_proc.call_many_async([{"field": 1}, {"field": 2}])
+    assert results == ["Fake result", "Fake result"]
+
+
+@pytest.mark.asyncio
+async def test_consume_rpcs_batch_with_invalid_message(
+    dummy_bus: lightbus.path.BusPath, dummy_api, mocker
+):
+    """A call which fails validation must not prevent the rest of its batch being processed"""
+    client = dummy_bus.client
+    rpc_transport = client.transport_registry.get_rpc_transport("default")
+    rpc_messages = [
+        RpcMessage(api_name="my.dummy", procedure_name="my_proc", kwargs={"field": n})
+        for n in range(0, 3)
+    ]
+
+    async def consume_rpcs(apis):
+        return rpc_messages
+
+    def validate(message, direction, **kwargs):
+        if message is rpc_messages[1] and direction == "incoming":
+            raise ValidationError("Invalid call")
+
+    mocker.patch.object(rpc_transport, "consume_rpcs", consume_rpcs)
+    mocker.patch.object(client, "_validate", validate)
+    mocker.spy(rpc_transport, "acknowledge")
+    mocker.spy(client, "send_result")
+
+    await client._consume_rpcs_with_transport(rpc_transport, apis=[dummy_api])
+
+    # Every call is acknowledged, and the invalid call receives an error
+    results = [call[1]["result_message"] for call in client.send_result.call_args_list]
+    assert [r.error for r in results] == [False, True, False]
+    assert results[0].result == "value: 0"
+    assert "Invalid call" in results[1].result
+    acknowledged = [call[0][0] for call in rpc_transport.acknowledge.call_args_list]
+    assert acknowledged == rpc_messages
+
+
+@pytest.fixture
+def dummy_events(dummy_bus: lightbus.path.BusPath):
+    """Make the dummy bus's event transport produce the given events"""
+
+    def dummy_events(fields):
+        event_transport = dummy_bus.client.transport_registry.get_event_transport("default")
+        event_messages = [
+            EventMessage(api_name="my.dummy", event_name="my_event", id=str(n), kwargs={"field": f})
+            for n, f in enumerate(fields)
+        ]
+
+        async def consume(*args, **kwargs):
+            for event_message in event_messages:
+                yield event_message
+            await asyncio.sleep(10)
+
+        event_transport.consume = consume
+        return event_transport
+
+    return dummy_events
+
+
+@pytest.mark.asyncio
+async def test_listen_for_event_partitioned(dummy_bus: lightbus.path.BusPath, dummy_events, mocker):
+    event_transport = dummy_events(["a", "a", "b"])
+    mocker.spy(event_transport, "acknowledge")
+    handled = []
+
+    async def listener(event_message, field):
+        # The first event is slowest, so would be overtaken by the second if not kept in order
+        await asyncio.sleep(0.05 if event_message.id == "0" else 0.01)
+        handled.append(event_message.id)
+
+    task = await dummy_bus.client.listen_for_event(
+        "my.dummy", "my_event", listener, options={"partition_key": "field", "max_concurrency": 5}
+    )
+    await asyncio.sleep(0.1)
+    await cancel(task)
+
+    # Event 2 has a different key, so did not need to wait for the others
+    assert handled == ["2", "0", "1"]
+    # Events are acknowledged as they complete
+    acknowledged = [call[0][0].id for call in event_transport.acknowledge.call_args_list]
+    assert acknowledged == ["2", "0", "1"]
+
+
+@pytest.mark.asyncio
+async def test_listen_for_event_partitioned_unhashable(
+    dummy_bus: lightbus.path.BusPath, dummy_events
+):
+    dummy_events([{"a": 1}, {"a": 1}, {"b": [1]}])
+    handled = []
+
+    async def listener(event_message, field):
+        await asyncio.sleep(0.05 if event_message.id == "0" else 0.01)
+        handled.append(event_message.id)
+
+    task = await dummy_bus.client.listen_for_event(
+        "my.dummy", "my_event", listener, options={"partition_key": "field", "max_concurrency": 5}
+    )
+    await asyncio.sleep(0.1)
+    assert not task.done()
+    await cancel(task)
+
+    # Equal dict values share a partition, so are still handled in order
+    assert handled == ["2", "0", "1"]
+
+
+@pytest.mark.asyncio
+async def test_get_backlog(dummy_bus: lightbus.path.BusPath, mocker):
+    rpc_transport = dummy_bus.client.transport_registry.get_rpc_transport("default")
+    event_transport = dummy_bus.client.transport_registry.get_event_transport("default")
+
+    # The debug transports cannot report a backlog, so are skipped
+    assert await dummy_bus.client.get_backlog(api_names=["my.dummy"]) == {"rpcs": {}, "events": {}}
+
+    async def get_backlog(api_names):
+        return {api_name: {"pending": None, "waiting": 1} for api_name in api_names}
+
+    async def get_lag(listen_for):
+        return {f"{a}.{e}": {"group": {"pending": 1}} for a, e in listen_for}
+
+    mocker.patch.object(rpc_transport, "get_backlog", get_backlog)
+    mocker.patch.object(event_transport, "get_lag", get_lag)
+    backlog = await dummy_bus.client.get_backlog(
+        api_names=["my.dummy"], events=[("my.dummy", "my_event")]
+    )
+    assert backlog == {
+        "rpcs": {"my.dummy": {"pending": None, "waiting": 1}},
+        "events": {"my.dummy.my_event": {"group": {"pending": 1}}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_listen_for_event_parameters(dummy_bus: lightbus.path.BusPath, dummy_events):
+    dummy_events(["a"])
+    received = []
+
+    def listener(event_message, **kwargs):
+        received.append(kwargs)
+
+    task = await dummy_bus.client.listen_for_event(
+        "my.dummy", "my_event", listener, options={"parameters": []}
+    )
+    await asyncio.sleep(0.01)
+    await cancel(task)
+
+    assert received == [{}]
+
+
+@pytest.mark.asyncio
+async def test_listen_for_event_max_concurrency(dummy_bus: lightbus.path.BusPath, dummy_events):
+    dummy_events(["a", "b", "c", "d"])
+    running = 0
+    max_running = 0
+
+    async def listener(event_message, field):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    task = await dummy_bus.client.listen_for_event(
+        "my.dummy", "my_event", listener, options={"partition_key": "field", "max_concurrency": 2}
+    )
+    await asyncio.sleep(0.1)
+    await cancel(task)
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_listen_for_event_concurrent_stop_listener(
+    dummy_bus: lightbus.path.BusPath, dummy_events
+):
+    dummy_bus.client.config.api("default").on_error = OnError.STOP_LISTENER
+    dummy_events(["a", "b"])
+
+    def listener(event_message, field):
+        raise Exception("Oh no")
+
+    task = await dummy_bus.client.listen_for_event(
+        "my.dummy", "my_event", listener, options={"max_concurrency": 2}
+    )
+    await asyncio.wait_for(task, timeout=1)
+    assert task.done()
+
+
 # Validation
 
 
@@ -39,12 +39,11 @@ async def transaction_transport(aiopg_connection, aiopg_cursor, loop):
     return transport
 
 
-async def consumer_to_messages(consumer):
+async def consumer_to_messages(transport, consumer):
     messages = []
     async for message in consumer:
         messages.append(message)
-        dummy_value = await consumer.__anext__()
-        assert not isinstance(dummy_value, EventMessage)
+        await transport.acknowledge(message)
     return messages
 
 
@@ -56,7 +55,6 @@ def transaction_transport_with_consumer(aiopg_connection, aiopg_cursor):
         async def dummy_consume_method(*args, **kwargs):
             for event_message in event_messages:
                 yield event_message
-                yield True
 
         transport = TransactionalEventTransport(DebugEventTransport())
         # start_transaction=False, as we start a transaction below (using BEGIN)
@@ -153,7 +151,7 @@ async def test_fetch_ok(transaction_transport_with_consumer, aiopg_cursor, loop)
         event_messages=[message1, message2, message3]
     )
     consumer = transport.consume(listen_for="api.event")
-    produced_events = await consumer_to_messages(consumer)
+    produced_events = await consumer_to_messages(transport, consumer)
     assert produced_events == [message1, message2, message3]
 
     await aiopg_cursor.execute("SELECT COUNT(*) FROM lightbus_processed_events")
@@ -169,7 +167,7 @@ async def test_fetch_duplicate(transaction_transport_with_consumer, aiopg_cursor
 
     transport = await transaction_transport_with_consumer(event_messages=[message1, message2])
     consumer = transport.consume(listen_for="api.event")
-    produced_events = await consumer_to_messages(consumer)
+    produced_events = await consumer_to_messages(transport, consumer)
     assert produced_events == [message1]  # The second message should be ignored
 
     await aiopg_cursor.execute("SELECT COUNT(*) FROM lightbus_processed_events")
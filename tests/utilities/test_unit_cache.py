@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from lightbus.utilities.cache import TtlLruCache, make_rpc_key, make_partition_key
+
+pytestmark = pytest.mark.unit
+
+
+def test_cache_get_set():
+    cache = TtlLruCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", "default") == "default"
+
+
+def test_cache_max_size():
+    cache = TtlLruCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Accessing 'a' makes 'b' the least recently used
+    cache.get("a")
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_ttl():
+    cache = TtlLruCache(max_size=10, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_pop():
+    cache = TtlLruCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert cache.pop("a", "default") == "default"
+    assert len(cache) == 0
+
+
+def test_cache_clear():
+    cache = TtlLruCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_make_rpc_key_kwarg_order():
+    assert make_rpc_key("my.api", "my_proc", {"a": 1, "b": 2}) == make_rpc_key(
+        "my.api", "my_proc", {"b": 2, "a": 1}
+    )
+
+
+def test_make_rpc_key_different():
+    key = make_rpc_key("my.api", "my_proc", {"a": 1})
+    assert key != make_rpc_key("my.api", "my_proc", {"a": 2})
+    assert key != make_rpc_key("my.api", "other_proc", {"a": 1})
+    assert key != make_rpc_key("other.api", "my_proc", {"a": 1})
+
+
+def test_make_partition_key_hashable():
+    assert make_partition_key("a") == "a"
+    assert make_partition_key(1) == 1
+    assert make_partition_key(None) is None
+
+
+def test_make_partition_key_unhashable():
+    key = make_partition_key({"a": 1, "b": [1, 2]})
+    hash(key)
+    assert key == make_partition_key({"b": [1, 2], "a": 1})
+    assert key != make_partition_key({"a": 2, "b": [1, 2]})
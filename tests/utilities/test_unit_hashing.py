@@ -0,0 +1,42 @@
+from collections import Counter
+
+import pytest
+
+from lightbus.utilities.hashing import ConsistentHashRing, crc16
+
+pytestmark = pytest.mark.unit
+
+
+def test_hash_ring_stable():
+    ring = ConsistentHashRing(["a", "b", "c"])
+    keys = [f"key{n}" for n in range(100)]
+    assert [ring.get_node(k) for k in keys] == [
+        ConsistentHashRing(["c", "b", "a"]).get_node(k) for k in keys
+    ]
+
+
+def test_hash_ring_spread():
+    ring = ConsistentHashRing(["a", "b", "c"])
+    counts = Counter(ring.get_node(f"key{n}") for n in range(3000))
+    assert set(counts) == {"a", "b", "c"}
+    assert min(counts.values()) > 500
+
+
+def test_hash_ring_add_node():
+    """Adding a node should only move keys onto the new node"""
+    before = ConsistentHashRing(["a", "b", "c"])
+    after = ConsistentHashRing(["a", "b", "c", "d"])
+    for n in range(1000):
+        key = f"key{n}"
+        assert after.get_node(key) in (before.get_node(key), "d")
+
+
+def test_hash_ring_empty():
+    with pytest.raises(ValueError):
+        ConsistentHashRing([]).get_node("key")
+
+
+def test_crc16():
+    # The check value for CRC-16/XMODEM, as used by Redis Cluster
+    assert crc16(b"123456789") == 0x31C3
+    assert crc16(b"") == 0